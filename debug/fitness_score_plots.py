@@ -1,5 +1,11 @@
 import json
+import sys
+
 import matplotlib.pyplot as plt
+import numpy as np
+
+sys.path.append('..')
+from src.game.ai.telemetry_recorder import load_telemetry  # noqa: E402
 
 
 # Cargar datos desde archivos JSON
@@ -9,7 +15,7 @@ def load_json(filename):
 
 
 # Función para plotear fitness score y líneas verticales para generaciones
-def plot_fitness_and_generations(fitness_scores, generation_intervals, cars, str=""):
+def plot_fitness_and_generations(telemetry, generation_intervals, cars, str=""):
     if str == "total":
         for i, interval in enumerate(generation_intervals):
             plt.axvline(x=interval['end'], color='r', linestyle='--')
@@ -17,12 +23,11 @@ def plot_fitness_and_generations(fitness_scores, generation_intervals, cars, str
         plt.axvline(x=generation_intervals[0]['end'], color='r', linestyle='--',
                     label='Generation Change')  # Solo se añade una vez a la leyenda
     plt.figure(figsize=(12, 6))
-    for car_id, fitness_data in fitness_scores.items():
-        frames = list(map(float, fitness_data.keys()))
-        fitness_values = list(map(float, fitness_data.values()))
+    for car_id in np.unique(telemetry['car_id']):
         if int(car_id) - 8820 not in cars:
             continue
-        plt.plot(frames, fitness_values, label=f'{str} of car {int(car_id)-8820}')
+        car_telemetry = telemetry[telemetry['car_id'] == car_id]
+        plt.plot(car_telemetry['time'], car_telemetry['fitness'], label=f'{str} of car {int(car_id)-8820}')
 
     plt.xlabel('Time')
     plt.ylabel('Fitness Score')
@@ -45,7 +50,8 @@ def plot_top_fitness_per_gen(top_fitness_per_gen):
 
 
 # Cargar datos
-fitness_scores = load_json('../assets/data_files/results/total_fitness_scores.json')
+# All the telemetry chunks are read and concatenated in memory
+fitness_scores = load_telemetry('../assets/data_files/results/telemetry')
 generation_intervals = load_json('../assets/data_files/results/generation_intervals.json')
 top_fitness_per_gen = load_json('../assets/data_files/results/top_fitness.json')
 
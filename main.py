@@ -5,7 +5,9 @@ Main file of the game
 import pygame
 
 from src.engine.managers.fps_manager import FPSManager
+from src.engine.managers.resource_manager.sprite_loader import SpriteLoader
 from src.game.ai.ai_info.chronometer import Chronometer
+from src.game.ai.ai_info.sim_clock import SimClock
 from src.game.game import Game
 
 
@@ -17,9 +19,14 @@ def main():
     pygame.init()
 
     FPSManager(max_fps=30, time_increment=1)
-    chrono = Chronometer()
-
-    game = Game(chrono)
+    # The times of the game are measured in simulated time, advanced by the game with the delta time of every frame
+    clock = SimClock()
+    chrono = Chronometer(clock)
+
+    game = Game(chrono, clock)
+    # All the sprites are loaded once, with the window already created so they are converted to its pixel format
+    number_of_sprites = SpriteLoader.preload()
+    print(f"Preloaded {number_of_sprites} sprites, {SpriteLoader.get_memory_usage() // 1024} KB")
     game.initialize()
 
     while game.is_running():
@@ -0,0 +1,78 @@
+"""
+Benchmark of the evolution of one generation of the genetic algorithm
+Compares the previous per-gene crossover and mutation with the vectorized ones
+"""
+import time
+
+import numpy as np
+
+from src.engine.ai.genetic_algorithm.genetic_algorithm import GeneticAlgorithm
+from src.game.ai.ai_manager import NEURAL_NET_LAYER_SIZES, population_size
+
+GENOME_LENGTH = sum(NEURAL_NET_LAYER_SIZES[i] * NEURAL_NET_LAYER_SIZES[i + 1] + NEURAL_NET_LAYER_SIZES[i + 1]
+                    for i in range(len(NEURAL_NET_LAYER_SIZES) - 1))
+REPETITIONS = 20
+
+
+def per_gene_evolve(genomes, fitness_scores, mutation_rate=0.04, mutation_strength=0.1, elite_fraction=0.13):
+    """
+    The evolution of the genetic algorithm before vectorizing it, drawing a random number per gene
+    :param genomes: genomes of the population, one per row
+    :param fitness_scores: fitness score of each genome
+    :param mutation_rate: probability of mutating each gene
+    :param mutation_strength: deviation of the mutations
+    :param elite_fraction: fraction of the population preserved as elite
+    :return: genomes of the next generation
+    """
+    sorted_genomes = [genomes[i] for i in sorted(range(len(genomes)), key=lambda i: fitness_scores[i], reverse=True)]
+    num_elite = max(1, int(round(elite_fraction * len(genomes))))
+    next_generation = [genome.copy() for genome in sorted_genomes[:num_elite]]
+
+    def mutate(genome):
+        genome_copy = genome.copy()
+        for i in range(len(genome)):
+            if np.random.rand() < mutation_rate:
+                genome_copy[i] += np.random.normal(0, mutation_strength)
+        return genome_copy
+
+    while len(next_generation) < len(genomes):
+        parent1, parent2 = sorted_genomes[0], sorted_genomes[1]
+        child1 = np.array([g1 if np.random.rand() < 0.5 else g2 for g1, g2 in zip(parent1, parent2)])
+        child2 = np.array([g1 if np.random.rand() < 0.5 else g2 for g1, g2 in zip(parent1, parent2)])
+        next_generation.append(mutate(child1))
+        if len(next_generation) < len(genomes):
+            next_generation.append(mutate(child2))
+    return next_generation
+
+
+def benchmark(evolve, genomes, fitness_scores) -> float:
+    """
+    Measure the mean time of evolving one generation
+    :param evolve: function that evolves the genomes
+    :param genomes: genomes of the population, one per row
+    :param fitness_scores: fitness score of each genome
+    :return: mean time in seconds
+    """
+    start_time = time.perf_counter()
+    for _ in range(REPETITIONS):
+        evolve(genomes, fitness_scores)
+    return (time.perf_counter() - start_time) / REPETITIONS
+
+
+def main():
+    random_generator = np.random.default_rng(0)
+    genomes = random_generator.normal(size=(population_size, GENOME_LENGTH))
+    fitness_scores = random_generator.random(population_size)
+
+    genetic_algorithm = GeneticAlgorithm(seed=0)
+    per_gene_time = benchmark(per_gene_evolve, genomes, fitness_scores)
+    vectorized_time = benchmark(genetic_algorithm.evolve_genomes, genomes, fitness_scores)
+
+    print(f"Population: {population_size}, genome length: {GENOME_LENGTH}")
+    print(f"Per gene evolution:   {per_gene_time * 1000:.2f} ms per generation")
+    print(f"Vectorized evolution: {vectorized_time * 1000:.2f} ms per generation")
+    print(f"Speedup: {per_gene_time / vectorized_time:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
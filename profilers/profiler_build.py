@@ -7,6 +7,7 @@ import pygame
 from src.engine.fps_manager import FPSManager
 from src.game.game import Game
 from src.game.ai.ai_info.chronometer import Chronometer
+from src.game.ai.ai_info.sim_clock import SimClock
 
 
 def main():
@@ -14,16 +15,17 @@ def main():
     pygame.init()
 
     FPSManager(time_increment=1)
-    chrono = Chronometer()
+    clock = SimClock()
+    chrono = Chronometer(clock)
     chrono.start()
-    game = Game(chrono)
+    game = Game(chrono, clock)
     game.initialize()
 
     # Clock for controlling frame rate and calculating delta time
     running = True
     pr = cProfile.Profile()
     pr.enable()
-    start_time = time.time()
+    start_time = time.perf_counter()
     profile_duration = 1
 
     while running:
@@ -34,7 +36,7 @@ def main():
         game.update(FPSManager.get_delta_time())
 
         # Detener el perfilado después de cierto tiempo
-        if time.time() - start_time > profile_duration:
+        if time.perf_counter() - start_time > profile_duration:
             print("Stopping profiling")
             pr.disable()
             profiling_file = os.path.join(os.path.dirname(__file__), 'training_mode/profiling_test_v04.txt')
@@ -42,7 +44,7 @@ def main():
                 ps = pstats.Stats(pr, stream=f).sort_stats('cumulative')
                 ps.print_stats()
             pr.enable()  # Reiniciar el perfilado
-            start_time = time.time()
+            start_time = time.perf_counter()
 
     pygame.quit()
     exit()
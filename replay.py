@@ -0,0 +1,44 @@
+"""
+Replay entry point
+Simulates again a recorded generation without opening a window, as fast as possible, and checks that the cars end
+exactly as they were recorded. It can also be repeated to benchmark the simulation.
+"""
+import argparse
+import time
+
+from src.game.replay.replay import Replay
+from src.game.replay.replay_player import ReplayPlayer
+
+
+def main():
+    """
+    Main function of the replay
+    """
+    parser = argparse.ArgumentParser(description="Simulate a recorded replay without rendering")
+    parser.add_argument("replay", help="path of the replay file")
+    parser.add_argument("--repeat", type=int, default=1, help="number of times to simulate the replay, to benchmark it")
+    args = parser.parse_args()
+
+    replay = Replay.load(args.replay)
+    header = replay.header
+    print(f"Replay of generation {header['generation']} on {header['map_name']}: {header['number_of_cars']} cars, "
+          f"{replay.get_number_of_frames()} frames, {replay.delta_times.sum():.2f} simulated seconds")
+
+    all_match = True
+    times = []
+    for _ in range(args.repeat):
+        player = ReplayPlayer(replay)
+        # Only the simulation of the frames is measured, not the loading of the map
+        start_time = time.perf_counter()
+        all_match = player.run() and all_match
+        times.append(time.perf_counter() - start_time)
+
+    best_time = min(times)
+    print(f"Simulated in {best_time:.3f} s, {replay.get_number_of_frames() / best_time:.0f} frames per second")
+    print("The cars ended exactly as recorded" if all_match else "The cars did NOT end as recorded")
+    if not all_match:
+        exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -5,7 +5,7 @@ This module contains the GeneticAlgorithm class that manages the genetic algorit
 import numpy as np
 
 from src.engine.ai.ai_agent import AIAgent
-from src.game.ai.ai_info.chronometer import Chronometer
+from src.engine.ai.genetic_algorithm.selection_strategies import SelectionStrategy, TournamentSelection
 
 
 class GeneticAlgorithm:
@@ -13,16 +13,25 @@ class GeneticAlgorithm:
     Genetic Algorithm class that manages the genetic algorithm
     """
 
-    def __init__(self):
+    def __init__(self, seed: int = None, selection_strategy: SelectionStrategy = None):
+        """
+        Initialize the genetic algorithm
+        :param seed: seed of the random generator, to make the evolution reproducible, or None for a random seed
+        :param selection_strategy: strategy that chooses the parents of the children, tournament selection if None
+        """
         self._agents: list[AIAgent] = []
         self.mutation_rate: float = 0.04
         self.mutation_strength: float = 0.1
+        # Simulated seconds of each generation
         self.generation_duration: int = 300
-        self.generation_timer: Chronometer = Chronometer()
         self.end_of_selection: bool = False
         self.current_generation = 1
         self.elite_fraction = 0.13  # 13% of the best agents are preserved as elite
         self.top_fitness = 0
+        self.top_parameters: np.ndarray = None
+        self.seed = seed
+        self.random_generator: np.random.Generator = np.random.default_rng(seed)
+        self.selection_strategy: SelectionStrategy = selection_strategy or TournamentSelection()
 
     def load_agents(self, agents: list[AIAgent]):
         """
@@ -46,62 +55,110 @@ class GeneticAlgorithm:
         """
         population = self.get_agents()
 
-        # Sort the population by fitness score in descending order
-        sorted_population = sorted(population, key=lambda x: x.fitness_score, reverse=True)
-        top_agent = sorted_population[0]
-        top_agent.neural_network.save_parameters()
+        fitness_scores = np.array([agent.fitness_score for agent in population], dtype=np.float64)
+        top_agent = population[int(np.argmax(fitness_scores))]
+        # Saving the parameters is left to the caller, so the disk is not accessed here
+        self.top_parameters = top_agent.get_genome()
         self.top_fitness = top_agent.fitness_score
 
+        genomes = np.stack([agent.get_genome() for agent in population])
+        return list(self.evolve_genomes(genomes, fitness_scores))
+
+    def evolve_genomes(self, genomes: np.ndarray, fitness_scores: np.ndarray) -> np.ndarray:
+        """
+        Evolve a population of genomes, one per row, based on their fitness scores
+        The elite is preserved without changes and the rest of the population are the children of parents chosen by
+        the selection strategy, generated and mutated all at once
+        :param genomes: genomes of the current population, with shape (population size, genome length)
+        :param fitness_scores: fitness score of each genome
+        :return: genomes of the next generation, with the same shape
+        """
+        population_size = len(genomes)
+        fitness_scores = np.asarray(fitness_scores, dtype=np.float64)
+
         # Determine number of elite agents to keep
-        num_elite = int(round(self.elite_fraction * len(population)))
-        if self.elite_fraction > 0 and len(population) > 0:
+        num_elite = int(round(self.elite_fraction * population_size))
+        if self.elite_fraction > 0 and population_size > 0:
             num_elite = max(1, num_elite)
-        elite = sorted_population[:num_elite]
-
-        next_generation = []
-        # Preserve the elite agents for the next generation without changes
-        for agent in elite:
-            genome_copy = agent.get_genome().copy()
-            next_generation.append(genome_copy)
-        parent1 = sorted_population[0]
-        parent2 = sorted_population[1]
+        num_elite = min(num_elite, population_size)
+
+        next_generation = np.empty_like(genomes)
+        # Preserve the elite agents for the next generation without changes, best first
+        # Only the elite is sorted, the rest of the population is just partitioned from it
+        if num_elite > 0:
+            elite_indices = np.argpartition(-fitness_scores, num_elite - 1)[:num_elite]
+            elite_indices = elite_indices[np.argsort(-fitness_scores[elite_indices], kind="stable")]
+            next_generation[:num_elite] = genomes[elite_indices]
+
         # Crossover and mutate for generating the rest of the population
-        while len(next_generation) < len(population):
-            child1, child2 = self._crossover(parent1.get_genome().copy(), parent2.get_genome().copy())
-            child1, child2 = self._mutate(child1), self._mutate(child2)
-            next_generation.append(child1)
-            if len(next_generation) < len(population):
-                next_generation.append(child2)
+        num_children = population_size - num_elite
+        if num_children > 0:
+            # Children are generated in pairs, the last one is discarded if the number of children is odd
+            num_pairs = (num_children + 1) // 2
+            parents1, parents2 = self.selection_strategy.select_parents(fitness_scores, num_pairs,
+                                                                        self.random_generator)
+            children1, children2 = self._crossover(genomes[parents1], genomes[parents2])
+            children = np.empty((2 * num_pairs, genomes.shape[1]), dtype=genomes.dtype)
+            children[0::2] = children1
+            children[1::2] = children2
+            next_generation[num_elite:] = self._mutate(children[:num_children])
+
         self.mutation_rate *= 0.99
         self.mutation_strength *= 0.99
 
         self.current_generation += 1
         return next_generation
 
-    @staticmethod
-    def _crossover(genome1, genome2):
+    def get_state(self) -> dict:
+        """
+        Get the state of the evolution, so it can be saved and resumed later
+        :return: dictionary with the current generation, the mutation parameters, the top fitness and the state of the
+        random generator
+        """
+        return {
+            "current_generation": self.current_generation,
+            "mutation_rate": self.mutation_rate,
+            "mutation_strength": self.mutation_strength,
+            "top_fitness": float(self.top_fitness),
+            "random_generator_state": self.random_generator.bit_generator.state
+        }
+
+    def set_state(self, state: dict) -> None:
+        """
+        Restore the state of the evolution saved with get_state
+        :param state: dictionary returned by get_state
+        """
+        self.current_generation = state["current_generation"]
+        self.mutation_rate = state["mutation_rate"]
+        self.mutation_strength = state["mutation_strength"]
+        self.top_fitness = state["top_fitness"]
+        self.random_generator.bit_generator.state = state["random_generator_state"]
+
+    def _crossover(self, genome1, genome2):
         """
-        Crossover two genomes
+        Uniform crossover of two genomes, or of two arrays of genomes (one per row) at once
+        Every gene of each child is taken from one of the parents with the same probability
         :param genome1: weights and biases of the neural network of the first parent
         :param genome2: weights amd biases of the neural network of the second parent
-        :return: child genome
+        :return: the two child genomes
         """
-        if len(genome1) != len(genome2):
+        if np.shape(genome1) != np.shape(genome2):
             raise ValueError("Genomes must have the same length")
 
-        # Uniform crossover
-        child_genome1 = np.array([g1 if np.random.rand() < 0.5 else g2 for g1, g2 in zip(genome1, genome2)])
-        child_genome2 = np.array([g1 if np.random.rand() < 0.5 else g2 for g1, g2 in zip(genome1, genome2)])
+        shape = np.shape(genome1)
+        child_genome1 = np.where(self.random_generator.random(shape) < 0.5, genome1, genome2)
+        child_genome2 = np.where(self.random_generator.random(shape) < 0.5, genome1, genome2)
         return child_genome1, child_genome2
 
     def _mutate(self, genome):
         """
-        Mutate the genome of an agent
+        Mutate the genome of an agent, or an array of genomes (one per row) at once
+        Every gene is mutated with probability mutation_rate by adding gaussian noise of deviation mutation_strength
         :param genome: weights and biases of the neural network of the agent
         :return: mutated genome
         """
-        genome_copy = genome.copy()
-        for i in range(len(genome)):
-            if np.random.rand() < self.mutation_rate:
-                genome_copy[i] += np.random.normal(0, self.mutation_strength)
+        genome_copy = np.array(genome, dtype=np.float64)
+        mutation_mask = self.random_generator.random(genome_copy.shape) < self.mutation_rate
+        genome_copy[mutation_mask] += self.random_generator.normal(0, self.mutation_strength,
+                                                                   np.count_nonzero(mutation_mask))
         return genome_copy
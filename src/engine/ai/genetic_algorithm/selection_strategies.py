@@ -0,0 +1,69 @@
+"""
+This module contains the selection strategies of the genetic algorithm
+"""
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+
+class SelectionStrategy(ABC):
+    """
+    Strategy that chooses the parents of the children of the next generation
+    All the parents are chosen in one draw, as arrays of indices of the population
+    """
+    @abstractmethod
+    def select_parents(self, fitness_scores: np.ndarray, number_of_pairs: int,
+                       random_generator: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Choose the pairs of parents of the children
+        :param fitness_scores: fitness score of each genome of the population
+        :param number_of_pairs: number of pairs of parents to choose
+        :param random_generator: random generator of the genetic algorithm
+        :return: the indices of the first parents and the indices of the second parents
+        """
+        pass
+
+
+class TournamentSelection(SelectionStrategy):
+    """
+    Each parent is the best of a group of genomes chosen at random
+    The bigger the tournament, the more the best genomes are chosen
+    """
+    def __init__(self, tournament_size: int = 3):
+        if tournament_size < 1:
+            raise ValueError("The tournament size must be at least 1")
+        self.tournament_size: int = tournament_size
+
+    def select_parents(self, fitness_scores: np.ndarray, number_of_pairs: int,
+                       random_generator: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+        # One row per parent, with the indices of the contestants of its tournament
+        contestants = random_generator.integers(0, len(fitness_scores), (2 * number_of_pairs, self.tournament_size))
+        winners = contestants[np.arange(len(contestants)), np.argmax(fitness_scores[contestants], axis=1)]
+        return winners[0::2], winners[1::2]
+
+
+class RankSelection(SelectionStrategy):
+    """
+    Each genome is chosen with a probability proportional to its rank, the worst one has rank 1
+    Unlike the fitness proportional selection, it doesn't depend on the scale of the fitness scores
+    """
+    def select_parents(self, fitness_scores: np.ndarray, number_of_pairs: int,
+                       random_generator: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+        ranks = np.empty(len(fitness_scores), dtype=np.float64)
+        ranks[np.argsort(fitness_scores, kind="stable")] = np.arange(1, len(fitness_scores) + 1)
+        parents = random_generator.choice(len(fitness_scores), (2, number_of_pairs), p=ranks / ranks.sum())
+        return parents[0], parents[1]
+
+
+class FitnessProportionalSelection(SelectionStrategy):
+    """
+    Each genome is chosen with a probability proportional to its fitness score (roulette wheel selection)
+    The scores are shifted so the worst one is 0, and all the genomes have the same probability if they are equal
+    """
+    def select_parents(self, fitness_scores: np.ndarray, number_of_pairs: int,
+                       random_generator: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+        weights = np.asarray(fitness_scores, dtype=np.float64) - np.min(fitness_scores)
+        total = weights.sum()
+        probabilities = weights / total if total > 0 else None
+        parents = random_generator.choice(len(fitness_scores), (2, number_of_pairs), p=probabilities)
+        return parents[0], parents[1]
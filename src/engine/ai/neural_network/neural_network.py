@@ -31,24 +31,31 @@ class NeuralNetwork:
         self.outputs = []
 
     @staticmethod
-    def relu(z):
+    def relu(z, out=None):
         """
         Apply the ReLU activation function.
 
         :param z: The input matrix
+        :param out: The array where the output is written, it can be z. A new array if None
         :return: The activated output
         """
-        return np.maximum(0, z)
+        return np.maximum(0, z, out=out)
 
     @staticmethod
-    def sigmoid(z):
+    def sigmoid(z, out=None):
         """
         Apply the sigmoid activation function.
 
         :param z: The input matrix
+        :param out: The array where the output is written, it can be z. A new array if None
         :return: The activated output
         """
-        return 1 / (1 + np.exp(-z))
+        if out is None:
+            return 1 / (1 + np.exp(-z))
+        np.negative(z, out=out)
+        np.exp(out, out=out)
+        np.add(out, 1, out=out)
+        return np.reciprocal(out, out=out)
 
     @staticmethod
     def softmax(x):
@@ -0,0 +1,89 @@
+"""
+This module contains the PopulationNeuralNetwork class, which evaluates many neural networks at once.
+"""
+import numpy as np
+
+from src.engine.ai.neural_network.neural_network import NeuralNetwork
+
+
+class PopulationNeuralNetwork:
+    """
+    This class evaluates a whole population of neural networks with the same layer sizes in a single pass.
+    The weights and biases of every network are stacked in 3-D tensors, one per layer, so the forward pass of all
+    the networks is one batched matrix multiplication per layer instead of one small multiplication per network.
+
+    The stacked parameters are a copy, so it must be rebuilt when the parameters of the networks change.
+
+    The activations of each layer are written in buffers allocated once for the whole population, so a forward pass
+    doesn't allocate any array. The dtype sets the precision of the parameters and the buffers, float32 inputs are
+    used directly by a float32 population.
+    """
+    def __init__(self, networks: list[NeuralNetwork], dtype=np.float64):
+        """
+        Stack the parameters of the given networks.
+        :param networks: The networks of the population, all with the same layer sizes
+        :param dtype: The dtype of the parameters and the activations, float64 or float32
+        """
+        if len(networks) == 0:
+            raise ValueError("The population must have at least one neural network.")
+        layer_sizes = networks[0].layer_sizes
+        if any(network.layer_sizes != layer_sizes for network in networks):
+            raise ValueError("All the neural networks of the population must have the same layer sizes.")
+
+        self.layer_sizes: list[int] = layer_sizes
+        self.networks: list[NeuralNetwork] = networks
+        # weights[layer] has shape (population, outputs, inputs) and biases[layer] (population, outputs)
+        self.weights: list[np.ndarray] = []
+        self.biases: list[np.ndarray] = []
+        self.activation_functions = []
+        # Activations of each layer, and the parameters of the evaluated networks when only some of them are evaluated
+        self._activations: list[np.ndarray] = []
+        self._selected_weights: list[np.ndarray] = []
+        self._selected_biases: list[np.ndarray] = []
+        self.dtype = np.dtype(dtype)
+        for i in range(len(layer_sizes) - 1):
+            self.weights.append(np.stack([network.layers[i].weights for network in networks]).astype(dtype,
+                                                                                                      copy=False))
+            self.biases.append(np.stack([network.layers[i].biases.reshape(-1) for network in networks])
+                               .astype(dtype, copy=False))
+            self.activation_functions.append(networks[0].layers[i].activation_function)
+            self._activations.append(np.zeros((len(networks), layer_sizes[i + 1]), dtype=dtype))
+            self._selected_weights.append(np.zeros_like(self.weights[i]))
+            self._selected_biases.append(np.zeros_like(self.biases[i]))
+
+    def forward(self, inputs: np.ndarray, indices: np.ndarray = None) -> np.ndarray:
+        """
+        Perform a forward pass of several networks of the population.
+        :param inputs: The inputs of the networks, with shape (number of networks, input size)
+        :param indices: The index in the population of the network of each row of inputs, all of them if None
+        :return: The outputs of the networks, with shape (number of networks, output size). It is a buffer that is
+        overwritten by the next call
+        """
+        activations = np.asarray(inputs, dtype=self.dtype)
+        number_of_networks = len(activations)
+        for i, activation_function in enumerate(self.activation_functions):
+            weights = self.weights[i]
+            biases = self.biases[i]
+            if indices is not None:
+                weights = np.take(weights, indices, axis=0, out=self._selected_weights[i][:number_of_networks])
+                biases = np.take(biases, indices, axis=0, out=self._selected_biases[i][:number_of_networks])
+            outputs = self._activations[i][:number_of_networks]
+            np.matmul(weights, activations[:, :, np.newaxis], out=outputs[:, :, np.newaxis])
+            np.add(outputs, biases, out=outputs)
+            activation_function(outputs, out=outputs)
+            activations = outputs
+        return self.custom_activation(activations)
+
+    @staticmethod
+    def custom_activation(outputs: np.ndarray) -> np.ndarray:
+        """
+        The custom activation of NeuralNetwork applied to every row of outputs at once.
+        :param outputs: The outputs of the networks, with shape (number of networks, output size)
+        :return: The modified outputs of the networks
+        """
+        if outputs.shape[1] < 4:
+            return outputs
+        opposite_keys = (outputs[:, 2] > 0.5) & (outputs[:, 3] > 0.5)
+        outputs[opposite_keys, 2] = 0
+        outputs[opposite_keys, 3] = 0
+        return outputs
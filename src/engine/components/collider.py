@@ -6,40 +6,17 @@ from typing import Optional, Callable
 import pygame as pygame
 
 from src.engine.components.physics import Physics
+from src.engine.managers.collider_manager.collision_layers import CollisionLayer
 from src.engine.components.transform import Transform
 
 
-class Intersection:
-    """
-    A class representing the intersection between two colliders. It contains a boolean value that indicates if the
-    colliders intersect and a float value that represents the area of the intersection.
-
-    This class is meant to be used as an information container for the Collider class.
-    """
-
-    def __init__(self, intersects: bool, intersection_area: float):
-        self.intersects: bool = intersects
-        self.intersection_area: float = intersection_area
-
-    def get_intersects(self) -> bool:
-        """
-        Get the boolean value that indicates if the colliders intersect.
-        :return: True if the colliders intersect, False otherwise
-        """
-        return self.intersects
-
-    def get_intersection_area(self) -> float:
-        """
-        Get the area of the intersection between the colliders.
-        """
-        return self.intersection_area
-
-
 class Collider:
     """
     The Collider class is responsible for storing the rectangle that represents the collision box of an entity.
-    It is also responsible for checking if it intersects with another collider and for storing information about
-    the collisions.
+    It is also responsible for storing information about the collisions, which are checked by the collider manager.
+
+    Each collider belongs to a collision layer and has a mask with the layers it can collide with, so groups of
+    colliders (like the cars between them) can ignore each other.
     """
 
     def __init__(self, rect: pygame.Rect, is_active: bool = True):
@@ -52,7 +29,9 @@ class Collider:
         self._collider_debug_show: bool = False
         self._colliding: bool = False
 
-        self._non_collideable_colliders: set[Collider] = set()
+        # Stored as int, it is faster to operate than the flags
+        self._collision_layer: int = int(CollisionLayer.DEFAULT)
+        self._collision_mask: int = int(CollisionLayer.ALL)
         self._collision_callback: Optional[Callable] = None
 
         self._collidered_physics: Optional[Physics] = None
@@ -94,13 +73,38 @@ class Collider:
         """
         return self._collidered_transforms
 
-    def get_non_collideable_colliders(self) -> set['Collider']:
+    def set_collision_layer(self, layer: CollisionLayer, mask: CollisionLayer = CollisionLayer.ALL) -> None:
         """
-        Get the set of colliders that this collider should not collide with.
-        If a collider is in this set, it will not be checked for collision.
-        :return:
+        Set the collision layer of the collider and the layers it can collide with.
+        :param layer: The layer the collider belongs to
+        :param mask: The layers the collider collides with
+        :return: None
         """
-        return self._non_collideable_colliders
+        self._collision_layer = int(layer)
+        self._collision_mask = int(mask)
+
+    def get_collision_layer(self) -> CollisionLayer:
+        """
+        Get the collision layer of the collider.
+        :return: The layer the collider belongs to
+        """
+        return CollisionLayer(self._collision_layer)
+
+    def get_collision_mask(self) -> CollisionLayer:
+        """
+        Get the layers the collider can collide with.
+        :return: The collision mask of the collider
+        """
+        return CollisionLayer(self._collision_mask)
+
+    def can_collide_with(self, other_collider: 'Collider') -> bool:
+        """
+        Check if the layer of the other collider is in the collision mask of this collider.
+        If it is not, the collision between them will not be checked.
+        :param other_collider: The other collider
+        :return: True if this collider collides with the other one, False otherwise
+        """
+        return (self._collision_mask & other_collider._collision_layer) != 0
 
     def set_collision_callback(self, callback: Callable) -> None:
         """
@@ -118,14 +122,6 @@ class Collider:
         """
         return self._collision_callback
 
-    def add_non_collideable_collider(self, collider: 'Collider') -> None:
-        """
-        Add a collider to the set of colliders that this collider should not collide with.
-        :param collider: The collider to add
-        :return: None
-        """
-        self._non_collideable_colliders.add(collider)
-
     def get_rect(self) -> pygame.Rect:
         """
         Get the rect of the collider.
@@ -145,27 +141,6 @@ class Collider:
         #     raise ValueError("Rect must be an instance of pygame.Rect")
         self.rect = sprite_rect
 
-    def intersects(self, other_collider: 'Collider') -> Intersection:
-        """
-        Returns a tuple with a boolean value and a float value. The boolean value is True if the collider intersects.
-        The float is the area of the intersection. If the boolean value is False, the float value is 0.
-        :param other_collider: The other collider to check for intersection
-        :return: A class Intersection with the intersection information.
-        """
-        # if not isinstance(other_collider, Collider):
-        #     raise ValueError("other_collider must be an instance of Collider")
-
-        # Check for intersection
-        intersects = self.rect.colliderect(other_collider.get_rect())
-        if intersects:
-            # Calculate intersection rectangle
-            intersection_rect = self.rect.clip(other_collider.get_rect())
-            # Calculate area of intersection
-            intersection_area = intersection_rect.width * intersection_rect.height
-            return Intersection(True, intersection_area)
-        else:
-            return Intersection(False, 0.0)
-
     def is_active(self):
         """
         Check if the collider is active.
@@ -1,8 +1,12 @@
 """
 This module contains the Physics class
 """
+from typing import Optional
+
 from pygame import Vector2
 
+from src.engine.managers.physics_manager.physics_store import PhysicsStore
+
 
 class Physics:
     """
@@ -31,16 +35,97 @@ class Physics:
 
     - is_static: a boolean value that represents if the object is static or not. If it is static, it will not move in
       any way.
+
+    The physics of the dynamic entities are bound to a row of the PhysicsStore, so all of them can be updated at once.
+    When bound, the mass, velocity, force, drag, vector_velocity and is_static values are read and written in the
+    store, and this component is only a view onto it.
     """
     def __init__(self, is_static):
-        self.mass: float = 1
-        self.velocity: float = 0
+        self._store: Optional[PhysicsStore] = None
+        self._slot: int = -1
+        self._mass: float = 1
+        self._velocity: float = 0
         self.acceleration: float = 0
-        self.force: float = 0
-        self.drag: float = 0.1
+        self._force: float = 0
+        self._drag: float = 0.1
         self._is_static: bool = is_static
         self._vector_velocity: Vector2 = Vector2(0, 0)
 
+    def bind(self, store: PhysicsStore, slot: int) -> None:
+        """
+        Move the values of the physics to a row of the physics store, so it becomes a view onto that row
+        :param store: The physics store
+        :param slot: The row of the store reserved for this physics
+        :return: None
+        """
+        store.mass[slot] = self._mass
+        store.velocity[slot] = self._velocity
+        store.force[slot] = self._force
+        store.drag[slot] = self._drag
+        store.vector_velocity[slot] = self._vector_velocity
+        store.is_static[slot] = self._is_static
+        self._store = store
+        self._slot = slot
+
+    def is_bound(self) -> bool:
+        """
+        Check if the physics is a view onto a row of the physics store
+        :return: True if it is bound to the store, False otherwise
+        """
+        return self._store is not None
+
+    @property
+    def mass(self) -> float:
+        if self._store is None:
+            return self._mass
+        return self._store.mass.item(self._slot)
+
+    @mass.setter
+    def mass(self, mass: float) -> None:
+        if self._store is None:
+            self._mass = mass
+        else:
+            self._store.mass[self._slot] = mass
+
+    @property
+    def velocity(self) -> float:
+        if self._store is None:
+            return self._velocity
+        return self._store.velocity.item(self._slot)
+
+    @velocity.setter
+    def velocity(self, velocity: float) -> None:
+        if self._store is None:
+            self._velocity = velocity
+        else:
+            self._store.velocity[self._slot] = velocity
+
+    @property
+    def force(self) -> float:
+        if self._store is None:
+            return self._force
+        return self._store.force.item(self._slot)
+
+    @force.setter
+    def force(self, force: float) -> None:
+        if self._store is None:
+            self._force = force
+        else:
+            self._store.force[self._slot] = force
+
+    @property
+    def drag(self) -> float:
+        if self._store is None:
+            return self._drag
+        return self._store.drag.item(self._slot)
+
+    @drag.setter
+    def drag(self, drag: float) -> None:
+        if self._store is None:
+            self._drag = drag
+        else:
+            self._store.drag[self._slot] = drag
+
     def add_acceleration(self, acceleration: float) -> None:
         """
         Add acceleration to the current forward acceleration
@@ -132,14 +217,20 @@ class Physics:
         :param vector_velocity: the velocity of the object in a 2D space (x, y)
         :return: none
         """
-        self._vector_velocity = vector_velocity
+        if self._store is None:
+            self._vector_velocity = vector_velocity
+        else:
+            self._store.vector_velocity[self._slot] = vector_velocity
 
     def get_vector_velocity(self) -> Vector2:
         """
         Get the velocity of the physics object in a 2D space
-        :return: the velocity of the object in a 2D space (x, y)
+        :return: the velocity of the object in a 2D space (x, y), a copy of the stored one when bound to the store
         """
-        return self._vector_velocity
+        if self._store is None:
+            return self._vector_velocity
+        vector_velocity = self._store.vector_velocity
+        return Vector2(vector_velocity.item(self._slot, 0), vector_velocity.item(self._slot, 1))
 
     def set_velocity(self, velocity: float) -> None:
         """
@@ -170,7 +261,9 @@ class Physics:
         Check if the object is static, if it is, it will not move
         :return: True if the object is static, False otherwise
         """
-        return self._is_static
+        if self._store is None:
+            return self._is_static
+        return self._store.is_static.item(self._slot)
 
     def set_static(self, is_static: bool) -> None:
         """
@@ -179,7 +272,10 @@ class Physics:
         :param is_static: True if the object is static, False otherwise
         :return: none
         """
-        self._is_static = is_static
+        if self._store is None:
+            self._is_static = is_static
+        else:
+            self._store.is_static[self._slot] = is_static
 
     def copy(self) -> 'Physics':
         """
@@ -200,6 +296,6 @@ class Physics:
         :return: none
         """
         self.velocity = 0
-        self._vector_velocity = Vector2(0, 0)
+        self.set_vector_velocity(Vector2(0, 0))
         self.acceleration = 0
         self.force = 0
@@ -1,10 +1,14 @@
 """
 This module contains the Sprite class.
 """
+from typing import Optional
+
 import pygame
 from pygame import Vector2
 
 from src.engine.components.transform import Transform
+from src.engine.engine_attributes import EngineAttributes
+from src.engine.managers.resource_manager.rotation_cache import RotationCache
 from src.engine.managers.resource_manager.sprite_loader import SpriteLoader
 from src.game.camera_coordinates import apply_view_to_pos_vec
 
@@ -18,9 +22,15 @@ class Sprite(pygame.sprite.Sprite):
     The sprite needs to hold to a transform because of how layered sprite group optimizes the rendering. The group
     needs to update all the sprites and then render them, so the sprite needs to hold the transform and update it
     when needed.
+
+    The rotation is quantized to a step, and the rotated images are shared by all the sprites with the same image, so
+    the image is only rotated again when the sprite turns a whole step. With a step of 0 the rotation is exact and
+    the image is rotated every time the rotation changes.
     """
-    def __init__(self, image_path: str):
+    def __init__(self, image_path: str, rotation_step: float = EngineAttributes.SPRITE_ROTATION_STEP):
         super().__init__()
+        self.image_path: str = image_path
+        self.rotation_step: float = rotation_step
         self.original_image = SpriteLoader.load(image_path)
         self.image = self.original_image
         self.rect = self.image.get_rect()
@@ -29,10 +39,15 @@ class Sprite(pygame.sprite.Sprite):
         self.dirty = True  # Mark sprite as needing an update
         self._is_added_to_renderer = False
         self.camera_pos: Vector2 = Vector2(0, 0)
+        # Angle of the current image and the rotation, position and camera position of the last applied transform
+        self._image_angle: Optional[float] = None
+        self._applied_rotation: Optional[float] = None
+        self._applied_position: Vector2 = Vector2(0, 0)
+        self._applied_camera_pos: Vector2 = Vector2(0, 0)
 
     def update_transform(self, transform: Transform, camera_pos: Vector2) -> None:
         """
-        Update transform parameters and mark sprite as dirty.
+        Update transform parameters and mark sprite as dirty if the transform or the camera have changed.
         :param transform: The new transform of the sprite
         :param camera_pos: The position of the camera
         :return: None
@@ -41,8 +56,10 @@ class Sprite(pygame.sprite.Sprite):
             raise ValueError("Transform cannot be None")
         # check if transform has changed
         self.transform = transform
-        self.dirty = True
         self.camera_pos: Vector2 = camera_pos
+        if (transform.get_rotation() != self._applied_rotation or transform.get_position() != self._applied_position
+                or camera_pos != self._applied_camera_pos):
+            self.dirty = True
 
     def update(self, *args) -> None:
         """
@@ -58,10 +75,20 @@ class Sprite(pygame.sprite.Sprite):
         """
         Apply stored transformations to the sprite.
         Applies rotations and scaling to the sprite (if any).
+        The image is only rotated again if the quantized angle has changed.
         :return: None
         """
-        # And then rotate the scaled image in two steps, instead of using rotozoom
-        self.image = pygame.transform.rotate(self.original_image, self.transform.get_rotation() + 180)
+        rotation = self.transform.get_rotation()
+        angle = RotationCache.quantize(rotation + 180, self.rotation_step)
+        if angle != self._image_angle:
+            if self.rotation_step > 0:
+                self.image = RotationCache.get_rotated(self.image_path, self.original_image, angle)
+            else:
+                self.image = pygame.transform.rotate(self.original_image, angle)
+            self._image_angle = angle
+        self._applied_rotation = rotation
+        self._applied_position.update(self.transform.get_position())
+        self._applied_camera_pos.update(self.camera_pos)
         pos_view_space: Vector2 = self.transform.get_position().copy()
         apply_view_to_pos_vec(pos_view_space, self.camera_pos)
         self.rect = self.image.get_rect(center=pos_view_space)
@@ -3,22 +3,50 @@ This transform component is responsible for storing the position, rotation, and
 """
 import copy
 import math
+from typing import Optional
 
 from pygame import Vector2
 
+from src.engine.managers.physics_manager.physics_store import PhysicsStore
+
 
 class Transform:
     """
     The Transform component is responsible for storing the position, rotation, and scale of an entity.
     It also has methods to obtain the forward vector of the entity and to manipulate the position, rotation, and scale.
+
+    The transforms of the dynamic entities are bound to a row of the PhysicsStore, where the physics manager updates
+    the positions of all of them at once. When bound, the position and the rotation are read and written in the store,
+    so get_position returns a copy of the stored position and it must be set back to change it.
     """
     def __init__(self):
+        self._store: Optional[PhysicsStore] = None
+        self._slot: int = -1
         self._position = Vector2(0, 0)
         self._rotation = 0
         self._scale = Vector2(1, 1)
         self._transform_debug_show: bool = False
         self._forward_debug_show: bool = False
 
+    def bind(self, store: PhysicsStore, slot: int) -> None:
+        """
+        Move the position and rotation of the transform to a row of the physics store, so it becomes a view onto it
+        :param store: The physics store
+        :param slot: The row of the store reserved for this transform
+        :return: None
+        """
+        store.position[slot] = self._position
+        store.rotation[slot] = self._rotation
+        self._store = store
+        self._slot = slot
+
+    def is_bound(self) -> bool:
+        """
+        Check if the transform is a view onto a row of the physics store
+        :return: True if it is bound to the store, False otherwise
+        """
+        return self._store is not None
+
     def __eq__(self, other: 'Transform') -> bool:
         """
         Check if two transforms are equal.
@@ -27,7 +55,8 @@ class Transform:
         """
         if self is other:
             return True
-        return self._position == other._position and self._rotation == other._rotation and self._scale == other._scale
+        return (self.get_position() == other.get_position() and self.get_rotation() == other.get_rotation()
+                and self._scale == other._scale)
 
     def __deepcopy__(self, memodict=None) -> 'Transform':
         """
@@ -41,7 +70,14 @@ class Transform:
         result = cls.__new__(cls)
         memodict[id(self)] = result
         for k, v in self.__dict__.items():
+            if k == "_store":
+                continue
             setattr(result, k, copy.deepcopy(v, memodict))  # Use deepcopy for attributes
+        # The copy is not a view onto the store, it keeps its own position and rotation
+        result._store = None
+        result._slot = -1
+        result._position = self.get_position().copy()
+        result._rotation = self.get_rotation()
         return result
 
     def displace(self, displacement: Vector2) -> None:
@@ -52,14 +88,20 @@ class Transform:
         """
         # if not isinstance(displacement, Vector2):
         #     raise ValueError("Displacement must be a Vector2")
-        self._position += displacement
+        if self._store is None:
+            self._position += displacement
+        else:
+            self._store.position[self._slot] += displacement
 
     def get_position(self) -> Vector2:
         """
         Get the position of the entity.
-        :return: The position of the entity
+        :return: The position of the entity, a copy of the stored one when bound to the store
         """
-        return self._position
+        if self._store is None:
+            return self._position
+        position = self._store.position
+        return Vector2(position.item(self._slot, 0), position.item(self._slot, 1))
 
     def set_position_x(self, x: float) -> None:
         """
@@ -69,7 +111,10 @@ class Transform:
         """
         # if not isinstance(x, (int, float)):
         #     raise ValueError("X must be a number")
-        self._position[0] = x
+        if self._store is None:
+            self._position[0] = x
+        else:
+            self._store.position[self._slot, 0] = x
 
     def set_position_y(self, y: float) -> None:
         """
@@ -79,7 +124,10 @@ class Transform:
         """
         # if not isinstance(y, (int, float)):
         #     raise ValueError("Y must be a number")
-        self._position[1] = y
+        if self._store is None:
+            self._position[1] = y
+        else:
+            self._store.position[self._slot, 1] = y
 
     def set_position(self, position: Vector2) -> None:
         """
@@ -89,14 +137,19 @@ class Transform:
         """
         # if not isinstance(position, Vector2):
         #     raise ValueError("Position must be a Vector2")
-        self._position = position
+        if self._store is None:
+            self._position = position
+        else:
+            self._store.position[self._slot] = position
 
     def get_rotation(self) -> float:
         """
         Get the rotation of the entity.
         :return: The rotation of the entity
         """
-        return self._rotation
+        if self._store is None:
+            return self._rotation
+        return self._store.rotation.item(self._slot)
 
     def set_rotation(self, rotation: float) -> None:
         """
@@ -106,7 +159,10 @@ class Transform:
         """
         # if not isinstance(rotation, (int, float)):
         #     raise ValueError("Rotation must be a number")
-        self._rotation = rotation
+        if self._store is None:
+            self._rotation = rotation
+        else:
+            self._store.rotation[self._slot] = rotation
 
     def get_scale(self) -> Vector2:
         """
@@ -139,8 +195,7 @@ class Transform:
         :param angle:
         :return:
         """
-        self._rotation += angle
-        self._rotation %= 360
+        self.set_rotation((self.get_rotation() + angle) % 360)
 
     def get_forward(self) -> Vector2:
         """
@@ -149,7 +204,7 @@ class Transform:
         :return: The forward vector of the entity
         """
         # Convert rotation to radians because math trig functions expect radians
-        radians = math.radians(self._rotation)
+        radians = math.radians(self.get_rotation())
 
         forward_x = math.sin(-radians)
         forward_y = math.cos(radians)  # Add pi to rotate 180 degrees, forward starts looking up
@@ -163,7 +218,7 @@ class Transform:
         :param forward:
         :return:
         """
-        self._rotation = math.degrees(math.atan2(forward.y, forward.x)) + 90
+        self.set_rotation(math.degrees(math.atan2(forward.y, forward.x)) + 90)
 
     def shows_debug_transform(self) -> bool:
         """
@@ -185,7 +240,7 @@ class Transform:
         :return:
         """
         new_transform = Transform()
-        new_transform._position = self._position.copy()
+        new_transform._position = self.get_position().copy()
         new_transform._scale = self._scale.copy()
         return new_transform
 
@@ -224,8 +279,8 @@ class Transform:
         debug mode.
         :return:
         """
-        self._position = Vector2(0, 0)
-        self._rotation = 0
+        self.set_position(Vector2(0, 0))
+        self.set_rotation(0)
         self._scale = Vector2(1, 1)
         self._transform_debug_show = False
         self._forward_debug_show = False
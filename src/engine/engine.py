@@ -4,6 +4,7 @@ This module contains the Engine class.
 from pygame import Vector2, Rect
 
 from src.engine.camera import Camera
+from src.engine.engine_attributes import EngineAttributes
 from src.engine.engine_fonts import EngineFonts
 from src.engine.managers.collider_manager.collider_manager import ColliderManager
 
@@ -71,7 +72,7 @@ class Engine:
         Reset the engine and the game.
         """
         print("RESET")
-        for entity in self._entity_manager.entities:
+        for entity in self._entity_manager.dynamic_entities:
             if not self._entity_manager.get_physics(entity).is_static():
                 self._entity_manager.reset_entity(entity)
         self._game_reset()
@@ -89,8 +90,9 @@ class Engine:
     def update(self, delta_time: float) -> None:
         """
         Main update loop of the engine.
-        This method iterates over the entities and calls the update methods of the managers on their component.
-        Also updates the rect of the collider and the batch sprites.
+        This method iterates over the dynamic entities and calls the update methods of the managers on their component.
+        Also updates the rect of the collider.
+        The static entities are not updated, they are only used once to create the background batch.
         :param delta_time:
         :return:
         """
@@ -99,18 +101,12 @@ class Engine:
         self._game_update(delta_time)
         self.camera.update(delta_time)
         CameraCoords.update_window_size(Vector2(self.window.get_width(), self.window.get_height()))
-        batch_sprites = []
-        batch_transforms = []
-
-        for entity in self._entity_manager.entities:
-            # Getting the next frame collider before updating the physics
-            # This way a collider never enters another, blocking the entity
+        # The physics of all the dynamic entities are updated at once
+        self.physics_manager.step(self._entity_manager, delta_time)
+        for entity in self._entity_manager.dynamic_entities:
             transform = self._entity_manager.get_transform(entity)
-            physics = self._entity_manager.get_physics(entity)
             sprite = self._entity_manager.get_sprite(entity)
             collider = self._entity_manager.get_collider(entity)
-            if not physics.is_static():
-                self.physics_manager.update(entity, physics, transform, self._entity_manager, delta_time)
 
             sprite_rect: Rect = self._entity_manager.get_sprite_rect(entity)
             collider.update_rect(sprite_rect)
@@ -118,13 +114,8 @@ class Engine:
             layer = self._entity_manager.get_layer(entity)
             self.renderer.update(sprite, transform, is_batched, layer)
 
-            if is_batched:
-                batch_transforms.append(transform)
-                batch_sprites.append(sprite)
-
-        if len(self._entity_manager.entities) > 0 and not self.background_batch_created:
-            self.renderer.create_background_batch(batch_sprites, batch_transforms)
-            self.background_batch_created = True
+        if len(self._entity_manager.static_entities) > 0 and not self.background_batch_created:
+            self._create_background_batch()
 
         # This only work the second update onwards
         # Because needs the rects from the sprites updated and for them to be updated
@@ -133,6 +124,19 @@ class Engine:
             self.collider_manager.update()
         self._is_second_update = True
 
+    def _create_background_batch(self) -> None:
+        """
+        Create the background batch from the static entities.
+        :return: None
+        """
+        batch_sprites = []
+        batch_transforms = []
+        for entity in self._entity_manager.static_entities:
+            batch_sprites.append(self._entity_manager.get_sprite(entity))
+            batch_transforms.append(self._entity_manager.get_transform(entity))
+        self.renderer.create_background_batch(batch_sprites, batch_transforms)
+        self.background_batch_created = True
+
     def _draw_fps(self) -> None:
         """
         Draw the FPS on the screen for debugging purposes.
@@ -149,10 +153,10 @@ class Engine:
 
     def _draw_entity_debug_information(self) -> None:
         """
-        Draws all the debug information of the entities.
+        Draws all the debug information of the dynamic entities.
         :return: None
         """
-        for entity in self._entity_manager.entities:
+        for entity in self._entity_manager.dynamic_entities:
             collider = self._entity_manager.get_collider(entity)
             transform = self._entity_manager.get_transform(entity)
             self.debug_renderer.draw_collider(collider)
@@ -165,7 +169,8 @@ class Engine:
         This will render the game and the debug information if debug mode is enabled.
         :return:
         """
-        self.window.clear()
+        # The background batch is drawn straight to the window, over the color of the background
+        self.window.clear(EngineAttributes.BACKGROUND_COLOR)
         self.renderer.render()
         self._game_render()
 
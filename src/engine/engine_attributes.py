@@ -16,3 +16,4 @@ class EngineAttributes:
     DEBUG_UI_FONT_SIZE = 30
     DEBUG_ENTITY_FONT_SIZE = 15
     FORWARD_LINE_LENGTH = 50
+    SPRITE_ROTATION_STEP = 1.0  # Degrees, the sprites are only rotated again when they turn a whole step
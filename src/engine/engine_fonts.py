@@ -5,6 +5,7 @@ This module contains the EngineFonts class.
 import pygame
 
 from src.engine.engine_attributes import EngineAttributes
+from src.engine.font_cache import FontCache
 
 
 class EngineFonts:
@@ -19,10 +20,10 @@ class EngineFonts:
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(EngineFonts, cls).__new__(cls)
-            cls._instance.debug_UI_font = pygame.font.SysFont(EngineAttributes.DEBUG_FONT,
-                                                              EngineAttributes.DEBUG_UI_FONT_SIZE)
-            cls._instance.debug_entity_font = pygame.font.SysFont(EngineAttributes.DEBUG_FONT,
-                                                                  EngineAttributes.DEBUG_ENTITY_FONT_SIZE, bold=True)
+            cls._instance.debug_UI_font = FontCache().get_font(EngineAttributes.DEBUG_FONT,
+                                                               EngineAttributes.DEBUG_UI_FONT_SIZE)
+            cls._instance.debug_entity_font = FontCache().get_font(EngineAttributes.DEBUG_FONT,
+                                                                   EngineAttributes.DEBUG_ENTITY_FONT_SIZE, bold=True)
 
     @classmethod
     def get_fonts(cls) -> "EngineFonts":
@@ -0,0 +1,108 @@
+"""
+This module contains the FontCache class.
+"""
+from collections import OrderedDict
+
+import pygame
+
+# Number of rendered texts kept, the least recently used ones are discarded first
+TEXT_CACHE_CAPACITY = 2048
+
+
+class FontCache:
+    """
+    This class caches the fonts and the rendered texts of the engine.
+    Loading a system font and rendering a text are slow, and the same texts are drawn every frame (the debug
+    information, the explainability and the menu), so they are only loaded and rendered once.
+
+    The fonts are kept by family, size and bold, and the rendered texts by text, font and color, in a least recently
+    used cache, so the texts that change every frame don't use more and more memory.
+    The surfaces of the rendered texts are shared, they must not be modified.
+    This class is a singleton, so it will only be instantiated once.
+    """
+    _instance: "FontCache" = None
+    capacity: int  # Maximum number of rendered texts kept
+    font_hits: int
+    font_misses: int
+    text_hits: int
+    text_misses: int
+    _fonts: dict[tuple[str, int, bool], pygame.font.Font]
+    _texts: OrderedDict[tuple[str, str, int, bool, tuple[int, ...]], pygame.Surface]
+
+    def __new__(cls, capacity: int = TEXT_CACHE_CAPACITY):
+        if cls._instance is None:
+            cls._instance = super(FontCache, cls).__new__(cls)
+            cls._instance.capacity = capacity
+            cls._instance._fonts = {}
+            cls._instance._texts = OrderedDict()
+            cls._instance.reset_stats()
+        return cls._instance
+
+    def get_font(self, family: str, size: int, bold: bool = False) -> pygame.font.Font:
+        """
+        Get a system font, loading it the first time it is requested.
+        :param family: The family of the font
+        :param size: The size of the font in pixels
+        :param bold: If the font is bold
+        :return: The font
+        """
+        key = (family, size, bold)
+        font = self._fonts.get(key)
+        if font is None:
+            self.font_misses += 1
+            font = pygame.font.SysFont(family, size, bold=bold)
+            self._fonts[key] = font
+        else:
+            self.font_hits += 1
+        return font
+
+    def render(self, text: str, family: str, size: int, color: tuple[int, ...],
+               bold: bool = False) -> pygame.Surface:
+        """
+        Get the surface of a text, rendering it with antialiasing if it is not cached.
+        :param text: The text to render
+        :param family: The family of the font
+        :param size: The size of the font in pixels
+        :param color: The color of the text
+        :param bold: If the font is bold
+        :return: The surface of the text, that must not be modified
+        """
+        key = (text, family, size, bold, tuple(color))
+        surface = self._texts.get(key)
+        if surface is not None:
+            self.text_hits += 1
+            self._texts.move_to_end(key)
+            return surface
+        self.text_misses += 1
+        surface = self.get_font(family, size, bold).render(text, True, color)
+        self._texts[key] = surface
+        if len(self._texts) > self.capacity:
+            self._texts.popitem(last=False)
+        return surface
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get the hits and misses of the caches, and the number of fonts and texts cached.
+        :return: The statistics of the caches
+        """
+        return {"font_hits": self.font_hits, "font_misses": self.font_misses, "fonts": len(self._fonts),
+                "text_hits": self.text_hits, "text_misses": self.text_misses, "texts": len(self._texts)}
+
+    def reset_stats(self) -> None:
+        """
+        Reset the hits and misses of the caches.
+        :return: None
+        """
+        self.font_hits = 0
+        self.font_misses = 0
+        self.text_hits = 0
+        self.text_misses = 0
+
+    def clear(self) -> None:
+        """
+        Discard all the cached fonts and texts, and reset the statistics.
+        :return: None
+        """
+        self._fonts.clear()
+        self._texts.clear()
+        self.reset_stats()
@@ -4,20 +4,33 @@ This module contains the ColliderManager class.
 from src.engine.components.collider import Collider
 from src.engine.components.physics import Physics
 from src.engine.components.transform import Transform
+from src.engine.managers.collider_manager.spatial_hash import SpatialHash
 
 from src.engine.managers.entity_manager.entity_manager import EntityManager
 from src.engine.managers.render_manager.renderer import DebugRenderer
+from src.game.map.tile_map import TILE_SIZE
+
+# Side of the cells of the spatial hash, big enough for a car or a NPC to overlap few cells
+COLLISION_CELL_SIZE = 4 * TILE_SIZE
 
 
 class ColliderManager:
     """
     The collision manager is responsible for checking for collisions between colliders and to report the collision
     information. It also renders the colliders for debugging purposes.
+
+    Every update the active colliders are added to the spatial hash of their collision layer, so each collider is
+    only tested against the colliders near it whose collision layer is in its collision mask. This way the cars,
+    that all start on the same tile and never collide between them, don't even look at each other.
     """
-    def __init__(self, entity_manager: EntityManager, debug_renderer: DebugRenderer):
+    def __init__(self, entity_manager: EntityManager, debug_renderer: DebugRenderer,
+                 cell_size: int = COLLISION_CELL_SIZE):
         self._debug_renderer = debug_renderer
         self._entity_manager = entity_manager
         self._entities_with_colliders = []
+        self._cell_size: int = cell_size
+        # One spatial hash per collision layer
+        self._spatial_hashes: dict[int, SpatialHash] = {}
 
     def send_data(self, entity: int) -> None:
         """
@@ -44,19 +57,28 @@ class ColliderManager:
         The update is in charge of checking for collisions between colliders.
         :return:
         """
-        colliders: list[Collider] = []
+        # Broad phase, rebuilt every frame as almost every collider moves
+        for spatial_hash in self._spatial_hashes.values():
+            spatial_hash.clear()
+        for index, entity in enumerate(self._entities_with_colliders):
+            collider: Collider = self._entity_manager.get_collider(entity)
+            if collider.is_active():
+                layer = int(collider.get_collision_layer())
+                if layer not in self._spatial_hashes:
+                    self._spatial_hashes[layer] = SpatialHash(self._cell_size)
+                self._spatial_hashes[layer].insert(index, collider.get_rect())
+
         for entity in self._entities_with_colliders:
             physics: Physics = self._entity_manager.get_physics(entity)
             if physics.is_static():
-                return  # Static entities don't move, so they don't need to check for collision
-            colliders.append(self._entity_manager.get_collider(entity))
+                continue  # Static entities don't move, so they don't need to check for collision
             collider: Collider = self._entity_manager.get_collider(entity)
             transform: Transform = self._entity_manager.get_transform(entity)
             self._check_collision(collider, physics, transform)
 
     def _check_collision(self, collider: Collider, physics: Physics, transform: Transform) -> None:
         """
-        Check for collisions between the given collider and all the other colliders.
+        Check for collisions between the given collider and the other colliders near it.
         This method is called for each collider in the list of entities with colliders in the update method.
         If a collision is detected, the velocity of the collider is set to be the opposite of the direction from one
         transform to the other. The callback of the collider is also called if it exists.
@@ -65,11 +87,19 @@ class ColliderManager:
         :param transform: The transform component of the entity
         :return: None
         """
+        if not collider.is_active():
+            return
+        mask = int(collider.get_collision_mask())
+        candidates = set()
+        for layer, spatial_hash in self._spatial_hashes.items():
+            if layer & mask:
+                candidates.update(spatial_hash.query(collider.get_rect()))
+
         colliding = False
-        for entity in self._entities_with_colliders:
+        # Checked in the order the colliders were added, as the last collision sets the velocity
+        for index in sorted(candidates):
+            entity = self._entities_with_colliders[index]
             other_collider: Collider = self._entity_manager.get_collider(entity)
-            other_transform: Transform = self._entity_manager.get_transform(entity)
-            other_physics: Physics = self._entity_manager.get_physics(entity)
 
             if other_collider is collider:
                 continue
@@ -79,19 +109,20 @@ class ColliderManager:
             if not other_collider.is_active() or not collider.is_active():
                 continue
 
-            if other_collider in collider.get_non_collideable_colliders():
+            if not collider.can_collide_with(other_collider):
                 continue
 
-            intersection = collider.intersects(other_collider)
-            if intersection.get_intersects():
+            if collider.get_rect().colliderect(other_collider.get_rect()):
                 colliding = True
+                other_transform: Transform = self._entity_manager.get_transform(entity)
+                other_physics: Physics = self._entity_manager.get_physics(entity)
                 # Set the velocity to be the opposite of the direction from one transform to the other
                 colliders_direction = transform.get_position() - other_transform.get_position()
                 collider.set_collidered(other_physics, other_transform, other_collider)
                 physics.set_vector_velocity(colliders_direction.normalize() * 100000 / physics.get_mass())
                 if collider.get_collision_callback() is not None:
                     collider.get_collision_callback()()
-            collider.set_colliding(colliding)
+        collider.set_colliding(colliding)
 
     def clear(self) -> None:
         """
@@ -99,4 +130,4 @@ class ColliderManager:
         :return: None
         """
         self._entities_with_colliders.clear()
-
+        self._spatial_hashes.clear()
@@ -0,0 +1,17 @@
+"""
+This module contains the CollisionLayer flag class for the different collision layers.
+"""
+from enum import IntFlag
+
+
+class CollisionLayer(IntFlag):
+    """
+    Flags for the different collision layers.
+    Each collider belongs to a layer and has a mask with the layers it collides with, so a collider only checks the
+    collision with another collider if its mask contains the layer of the other one.
+    """
+    NONE = 0
+    DEFAULT = 1
+    CARS = 2
+    NPCS = 4
+    ALL = DEFAULT | CARS | NPCS
@@ -0,0 +1,66 @@
+"""
+This module contains the SpatialHash class
+"""
+import pygame
+
+
+class SpatialHash:
+    """
+    The spatial hash is a uniform grid that stores in each cell the items whose rect overlaps it.
+    It is used as the broad phase of the collision detection: a collider only has to be tested against the items that
+    share a cell with it, instead of against every other collider.
+
+    The items are the indices of the colliders, so the candidates of a query can be returned in the same order the
+    colliders were added.
+    """
+    def __init__(self, cell_size: int):
+        if cell_size <= 0:
+            raise ValueError("Cell size must be greater than 0")
+        self.cell_size: int = cell_size
+        self._cells: dict[tuple[int, int], list[int]] = {}
+
+    def _cells_of_rect(self, rect: pygame.Rect):
+        """
+        Get the coordinates of the cells that overlap the given rect
+        :param rect: The rect
+        :return: A generator of the coordinates of the cells
+        """
+        cell_size = self.cell_size
+        # right and bottom are not part of the rect
+        for cell_x in range(rect.left // cell_size, (rect.right - 1) // cell_size + 1):
+            for cell_y in range(rect.top // cell_size, (rect.bottom - 1) // cell_size + 1):
+                yield cell_x, cell_y
+
+    def insert(self, item: int, rect: pygame.Rect) -> None:
+        """
+        Add an item to all the cells its rect overlaps
+        :param item: The item, the index of a collider
+        :param rect: The rect of the item
+        :return: None
+        """
+        for cell in self._cells_of_rect(rect):
+            items = self._cells.get(cell)
+            if items is None:
+                self._cells[cell] = [item]
+            else:
+                items.append(item)
+
+    def query(self, rect: pygame.Rect) -> list[int]:
+        """
+        Get the items that share a cell with the given rect
+        :param rect: The rect to query
+        :return: The items near the rect, sorted and without repetitions
+        """
+        candidates = set()
+        for cell in self._cells_of_rect(rect):
+            items = self._cells.get(cell)
+            if items is not None:
+                candidates.update(items)
+        return sorted(candidates)
+
+    def clear(self) -> None:
+        """
+        Remove all the items
+        :return: None
+        """
+        self._cells.clear()
@@ -10,6 +10,7 @@ from src.engine.components.collider import Collider
 from src.engine.components.physics import Physics
 from src.engine.components.sprite import Sprite
 from src.engine.components.transform import Transform
+from src.engine.managers.physics_manager.physics_store import PhysicsStore
 from src.engine.managers.render_manager.render_layers import RenderLayer
 from src.engine.managers.resource_manager.sprite_loader import SpriteLoader
 
@@ -24,9 +25,19 @@ class EntityManager:
 
     Also, it stores the components in separate arrays instead of storing them in the entity class itself. This is
     because it is more efficient to store the components in separate arrays, as it allows for better cache locality.
+
+    The entities are also split in static entities, which are batched and never move (like the tiles of the map), and
+    dynamic entities, the rest. The static entities are only needed once to build the background batch, so the
+    engine only iterates over the dynamic ones every frame.
+
+    The physics and transforms of the dynamic entities are bound to the physics store, which holds their values in
+    arrays so the physics manager can update all of them at once.
     """
     def __init__(self):
         self.entities: list[int] = []
+        self.static_entities: list[int] = []
+        self.dynamic_entities: list[int] = []
+        self.physics_store: PhysicsStore = PhysicsStore()
 
         self.transforms: list[Transform] = []
         self.physics: list[Physics] = []
@@ -81,6 +92,13 @@ class EntityManager:
 
         # Add entity to the entity list
         self.entities.append(entity_id)
+        if batched and is_static:
+            self.static_entities.append(entity_id)
+        else:
+            self.dynamic_entities.append(entity_id)
+            slot = self.physics_store.add_slot()
+            transform.bind(self.physics_store, slot)
+            physics.bind(self.physics_store, slot)
 
         return entity_id
 
@@ -214,6 +232,9 @@ class EntityManager:
         :return: None
         """
         self.entities.clear()
+        self.static_entities.clear()
+        self.dynamic_entities.clear()
+        self.physics_store.clear()
         self.transforms.clear()
         self.physics.clear()
         self.sprites.clear()
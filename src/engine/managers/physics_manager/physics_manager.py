@@ -10,7 +10,20 @@ class PhysicsManager:
     """
     The physics manager is responsible for updating the physics of the entities.
     Is applies to all the entities the forces, the velocities, the drags and the displacements.
+
+    The dynamic entities are updated all at once with step, on the physics store of the entity manager. The update
+    method handles a single entity whose components are not bound to the store.
     """
+    @staticmethod
+    def step(entity_manager: EntityManager, delta_time: float) -> None:
+        """
+        Update the physics of all the dynamic entities at once.
+        :param entity_manager: The entity manager, holding the physics store of the dynamic entities
+        :param delta_time: The time passed since the last frame so physics are frame rate independent
+        :return: None
+        """
+        entity_manager.physics_store.step(delta_time)
+
     def update(self, entity: int, physics: Physics, transform: Transform, entity_manager: EntityManager,
                delta_time: float):
         """
@@ -0,0 +1,99 @@
+"""
+This module contains the PhysicsStore class
+"""
+import numpy as np
+
+
+class PhysicsStore:
+    """
+    The physics store keeps the physics and the transform values of the dynamic entities in a structure of arrays.
+    Each dynamic entity owns a row (slot) of every array, and its Physics and Transform components read and write that
+    row, so they are views onto this storage instead of holding the values themselves.
+
+    Having all the values in contiguous NumPy arrays allows to update the physics of all the cars and NPCs with a few
+    array operations in step, instead of updating the entities one by one.
+
+    The arrays grow by doubling their capacity, so a component must never keep a reference to an array, only to the
+    store and its slot.
+    """
+    def __init__(self, capacity: int = 64):
+        self.size: int = 0
+        self.mass: np.ndarray = np.ones(capacity, dtype=np.float64)
+        self.velocity: np.ndarray = np.zeros(capacity, dtype=np.float64)
+        self.force: np.ndarray = np.zeros(capacity, dtype=np.float64)
+        self.drag: np.ndarray = np.zeros(capacity, dtype=np.float64)
+        self.vector_velocity: np.ndarray = np.zeros((capacity, 2), dtype=np.float64)
+        self.position: np.ndarray = np.zeros((capacity, 2), dtype=np.float64)
+        self.rotation: np.ndarray = np.zeros(capacity, dtype=np.float64)
+        self.is_static: np.ndarray = np.ones(capacity, dtype=bool)
+
+    def add_slot(self) -> int:
+        """
+        Reserve a new row in all the arrays, growing them if they are full
+        :return: The slot of the new row
+        """
+        if self.size == len(self.velocity):
+            self._grow(2 * len(self.velocity))
+        slot = self.size
+        self.size += 1
+        return slot
+
+    def _grow(self, capacity: int) -> None:
+        """
+        Grow the arrays to the given capacity, keeping the values of the used rows
+        :param capacity: The new capacity of the arrays
+        :return: None
+        """
+        for name, fill_value in (("mass", 1), ("velocity", 0), ("force", 0), ("drag", 0), ("vector_velocity", 0),
+                                 ("position", 0), ("rotation", 0), ("is_static", True)):
+            array = getattr(self, name)
+            grown = np.full((capacity,) + array.shape[1:], fill_value, dtype=array.dtype)
+            grown[:self.size] = array[:self.size]
+            setattr(self, name, grown)
+
+    def step(self, delta_time: float) -> None:
+        """
+        Update the physics of all the non-static rows at once
+        It applies the same drag, acceleration and displacement than PhysicsManager does for a single entity:
+        the forward velocity is dragged towards 0 without changing its sign, the vector velocity is dragged, the
+        acceleration from the force and the mass is added to the velocity, the position is displaced towards the
+        forward vector and the vector velocity and the force is consumed.
+        :param delta_time: The time passed since the last frame so physics are frame rate independent
+        :return: None
+        """
+        moving = np.flatnonzero(~self.is_static[:self.size])
+        if len(moving) == 0:
+            return
+
+        drag = self.drag[moving]
+        velocity = self.velocity[moving]
+        # Drag should slow down the entity, but never flip the direction of its velocity
+        velocity = np.where(velocity > 0, np.maximum(0.0, velocity - drag * velocity),
+                            np.minimum(0.0, velocity + drag * np.abs(velocity)))
+        vector_velocity = self.vector_velocity[moving]
+        vector_velocity -= drag[:, np.newaxis] * vector_velocity
+
+        velocity += self.force[moving] / self.mass[moving]
+
+        # Same forward vector than Transform.get_forward, forward starts looking up
+        radians = np.radians(self.rotation[moving])
+        forward = np.empty((len(moving), 2), dtype=np.float64)
+        forward[:, 0] = np.sin(radians)
+        forward[:, 1] = -np.cos(radians)
+
+        position = self.position[moving]
+        position += forward * (velocity * delta_time)[:, np.newaxis]
+        position += vector_velocity * delta_time
+
+        self.velocity[moving] = velocity
+        self.vector_velocity[moving] = vector_velocity
+        self.position[moving] = position
+        self.force[moving] = 0
+
+    def clear(self) -> None:
+        """
+        Release all the rows, setting the store to its initial state
+        :return: None
+        """
+        self.size = 0
+        self.is_static[:] = True
@@ -6,6 +6,9 @@ from pygame import Surface
 
 from src.engine.components.transform import Transform
 
+# Size in pixels of the square chunks the background is split into
+BACKGROUND_CHUNK_SIZE = 512
+
 
 class BackgroundBatch:
     """
@@ -15,6 +18,9 @@ class BackgroundBatch:
 
     This takes all the sprites and transforms for a batch and creates a surface with all the sprites in the correct
     positions.
+
+    The surface is split into square chunks once it is created, and only the chunks that are inside the window are
+    drawn, so the cost of drawing the background doesn't grow with the size of the map.
     """
 
     def __init__(self, entity_width: int, entity_height: int, sprites: list[Surface],
@@ -61,6 +67,72 @@ class BackgroundBatch:
         for sprite, transform in zip(sprites, transforms):
             self.add_entity(sprite, transform.get_position())
 
+        # The chunks are subsurfaces, they share the pixels of the batch surface
+        self.chunk_size: int = BACKGROUND_CHUNK_SIZE
+        self.chunks: list[list[Surface]] = []
+        self.build_chunks()
+
+    @staticmethod
+    def from_surface(surface: Surface, entity_width: int, entity_height: int, offset_x: float,
+                     offset_y: float) -> 'BackgroundBatch':
+        """
+        Create a background batch from a surface with the sprites already composed, for example a cached one.
+        :param surface: The surface with all the sprites
+        :param entity_width: The width of the entities in pixels
+        :param entity_height: The height of the entities in pixels
+        :param offset_x: The minimum x position of the entities
+        :param offset_y: The minimum y position of the entities
+        :return: The background batch
+        """
+        batch = BackgroundBatch.__new__(BackgroundBatch)
+        batch.entity_width = entity_width
+        batch.entity_height = entity_height
+        batch.cols = surface.get_width() // entity_width
+        batch.rows = surface.get_height() // entity_height
+        batch.batch_surface = surface
+        batch.offset_x = offset_x
+        batch.offset_y = offset_y
+        batch.chunk_size = BACKGROUND_CHUNK_SIZE
+        batch.build_chunks()
+        return batch
+
+    def build_chunks(self) -> None:
+        """
+        Split the batch surface into chunks.
+        The batch surface is converted to the pixel format of the window first, if there is one, so the chunks are
+        drawn faster.
+        :return: None
+        """
+        if pygame.display.get_surface() is not None:
+            self.batch_surface = self.batch_surface.convert_alpha()
+        width = self.get_width()
+        height = self.get_height()
+        self.chunks = []
+        for y in range(0, height, self.chunk_size):
+            row = []
+            for x in range(0, width, self.chunk_size):
+                row.append(self.batch_surface.subsurface(
+                    pygame.Rect(x, y, min(self.chunk_size, width - x), min(self.chunk_size, height - y))))
+            self.chunks.append(row)
+
+    def draw(self, target: Surface, position: tuple[int, int]) -> int:
+        """
+        Draw the chunks of the batch that are inside the target surface.
+        :param target: The surface to draw on, usually the window
+        :param position: The position of the top left corner of the batch in the target surface
+        :return: The number of chunks drawn
+        """
+        x, y = position
+        first_column = max(0, -x // self.chunk_size)
+        last_column = min(len(self.chunks[0]) - 1, (target.get_width() - x - 1) // self.chunk_size) \
+            if self.chunks else -1
+        first_row = max(0, -y // self.chunk_size)
+        last_row = min(len(self.chunks) - 1, (target.get_height() - y - 1) // self.chunk_size)
+        blits = [(self.chunks[row][column], (x + column * self.chunk_size, y + row * self.chunk_size))
+                 for row in range(first_row, last_row + 1) for column in range(first_column, last_column + 1)]
+        target.blits(blits, doreturn=False)
+        return len(blits)
+
     def add_entity(self, sprite: Surface, position: pygame.Vector2) -> None:
         """
         Add an entity to the batch surface to be batched on the surface batch.
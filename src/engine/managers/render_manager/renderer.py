@@ -11,7 +11,7 @@ from src.engine.components.collider import Collider
 from src.engine.components.sprite import Sprite
 from src.engine.components.transform import Transform
 from src.engine.engine_attributes import EngineAttributes
-from src.engine.engine_fonts import EngineFonts
+from src.engine.font_cache import FontCache
 from src.engine.managers.render_manager.background_batch import BackgroundBatch
 from src.engine.managers.render_manager.render_layers import RenderLayer
 from src.engine.managers.window_manager.window import Window
@@ -203,7 +203,8 @@ class DebugRenderer:
         :param centered: If the text should be centered
         :return: None
         """
-        text_surface = EngineFonts.get_fonts().debug_entity_font.render(text, True, color)
+        text_surface = FontCache().render(text, EngineAttributes.DEBUG_FONT, EngineAttributes.DEBUG_ENTITY_FONT_SIZE,
+                                          color, bold=True)
         pos = position.copy()
         pos.update(
             apply_view_to_pos(pos.x, pos.y, CameraCoords.get_camera_position().x,
@@ -221,7 +222,8 @@ class DebugRenderer:
         :param color: The color of the text
         :return: None
         """
-        text_surface = EngineFonts.get_fonts().debug_entity_font.render(text, True, color)
+        text_surface = FontCache().render(text, EngineAttributes.DEBUG_FONT, EngineAttributes.DEBUG_ENTITY_FONT_SIZE,
+                                          color, bold=True)
         self.window.get_window().blit(text_surface, position)
 
 
@@ -234,9 +236,6 @@ class Renderer:
     def __init__(self, window: Window):
         self.window = window
         self.sprite_group = pygame.sprite.LayeredUpdates()
-        self.surface_batch = pygame.surface.Surface((self.window.get_width(), self.window.get_height()))
-        self.surface_batch_position: Vector2 = Vector2(0, 0)
-        self.surface_batch_dirty: bool = False
         self.background_batch: Optional[BackgroundBatch] = None
         self.camera_pos = Vector2(0, 0)
 
@@ -244,18 +243,15 @@ class Renderer:
         """
         This method is in charge of rendering the sprites and the background batch.
         It will call the update method of the sprite group and draw the sprites.
-        And will draw the background batch if it exists.
+        And will draw the chunks of the background batch inside the window, straight to the window, if it exists.
         :return:
         """
         self.sprite_group.update()
         if self.background_batch is not None:
-            self.surface_batch.blit(self.background_batch.get_batch_surface(),
-                                    apply_view_to_pos(0, int(self.surface_batch.get_height() * 1.5),
-                                                      CameraCoords.get_camera_position().x,
-                                                      CameraCoords.get_camera_position().y))
-        self.window.get_window().blit(self.surface_batch, (0, 0))
+            position = apply_view_to_pos(0, int(self.window.get_height() * 1.5),
+                                         CameraCoords.get_camera_position().x, CameraCoords.get_camera_position().y)
+            self.background_batch.draw(self.window.get_window(), (int(position[0]), int(position[1])))
         self.sprite_group.draw(self.window.get_window())
-        self.surface_batch.fill(EngineAttributes.BACKGROUND_COLOR)
 
     def update(self, sprite: Sprite, transform: Transform, is_batched: bool, layer: RenderLayer) -> None:
         """
@@ -276,7 +272,6 @@ class Renderer:
 
         # Update the sprite's transform
         sprite.update_transform(transform, CameraCoords.get_camera_position())
-        self.surface_batch_position = -CameraCoords.get_camera_position()
         # Add the sprite to the renderer if it hasn't been added yet
         if not sprite.is_added_to_renderer() and not is_batched:
             # noinspection PyTypeChecker
@@ -296,6 +291,14 @@ class Renderer:
         entity_height = batch_sprites[0].get_height()
         self.background_batch = BackgroundBatch(entity_width, entity_height, batch_sprites, batch_transforms)
 
+    def set_background_batch(self, background_batch: BackgroundBatch) -> None:
+        """
+        Set a background batch that is already created, instead of creating it from the sprites.
+        :param background_batch: The background batch
+        :return: None
+        """
+        self.background_batch = background_batch
+
     def draw_surface(self, surface: pygame.Surface, position: Vector2) -> None:
         """
         Draw a surface on the screen at a given position.
@@ -316,8 +319,7 @@ class Renderer:
         :param size: The size of the text in pixels
         :return: None
         """
-        current_font = pygame.font.SysFont(EngineAttributes.DEBUG_FONT, size)
-        text_surface = current_font.render(text, True, color)
+        text_surface = FontCache().render(text, EngineAttributes.DEBUG_FONT, size, color)
         pos = position.copy()
         pos.update(
             apply_view_to_pos(pos.x, pos.y,
@@ -340,8 +342,7 @@ class Renderer:
         :param bold: If the text should be bold
         :return: None
         """
-        current_font = pygame.font.SysFont(EngineAttributes.DEBUG_FONT, size, bold=bold)
-        text_surface = current_font.render(text, True, color)
+        text_surface = FontCache().render(text, EngineAttributes.DEBUG_FONT, size, color, bold=bold)
         self.window.get_window().blit(text_surface, text_surface.get_rect(center=position) if centered else position)
 
     def draw_rect_absolute(self, rect: pygame.Rect, color: tuple[int, int, int] = (255, 0, 0),
@@ -382,11 +383,9 @@ class Renderer:
     def render_clear(self) -> None:
         """
         Completely clear the renderer.
-        This will set all the data structures to empty and will clear the surface batch.
+        This will set all the data structures to empty and will clear the background batch.
         :return:
         """
         self.sprite_group = pygame.sprite.LayeredUpdates()
         self.background_batch = None
-        self.surface_batch_position: Vector2 = Vector2(0, 0)
-        self.surface_batch_dirty: bool = False
         self.camera_pos = Vector2(0, 0)
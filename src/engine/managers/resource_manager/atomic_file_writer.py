@@ -0,0 +1,71 @@
+"""
+This module contains the AtomicFileWriter class
+"""
+import json
+import os
+from typing import Callable, IO
+
+import numpy as np
+
+
+class AtomicFileWriter:
+    """
+    This class writes files so that a crash never leaves them half written.
+    The content is written to a temporary file next to the destination, flushed to the disk and then renamed over the
+    destination, so the file always has either its previous content or the new one.
+    The lines appended to a file are also flushed to the disk, so only the last line can be lost.
+    """
+    @staticmethod
+    def write(path: str, write_content: Callable[[IO], None], binary: bool = False) -> None:
+        """
+        Write a file atomically
+        :param path: The path of the file
+        :param write_content: Function that writes the content to the given open file
+        :param binary: Whether the file is opened in binary mode
+        :return: None
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary_path = path + ".tmp"
+        with open(temporary_path, "wb" if binary else "w") as file:
+            write_content(file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, path)
+
+    @staticmethod
+    def save_npy(path: str, array: np.ndarray) -> None:
+        """
+        Save an array as a .npy file atomically
+        :param path: The path of the file
+        :param array: The array to save
+        :return: None
+        """
+        AtomicFileWriter.write(path, lambda file: np.save(file, array), binary=True)
+
+    @staticmethod
+    def save_json(path: str, data) -> None:
+        """
+        Save data as a JSON file atomically
+        :param path: The path of the file
+        :param data: The data to save
+        :return: None
+        """
+        AtomicFileWriter.write(path, lambda file: json.dump(data, file, indent=4))
+
+    @staticmethod
+    def append_line(path: str, line: str) -> None:
+        """
+        Append a line to a file and flush it to the disk
+        :param path: The path of the file
+        :param line: The line to append, without the line break
+        :return: None
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "a") as file:
+            file.write(line + "\n")
+            file.flush()
+            os.fsync(file.fileno())
@@ -0,0 +1,70 @@
+"""
+This module contains the BackgroundWriter class
+"""
+import atexit
+import queue
+import threading
+from typing import Callable, Optional
+
+
+class BackgroundWriter:
+    """
+    This class writes files to the disk in a background thread, so the game loop doesn't stall while they are saved.
+    The writes are functions queued in a bounded queue and run in order by the thread. If the queue is full, queueing
+    a new write waits until there is room, so a slow disk can't make the memory grow without limit.
+
+    The thread is a daemon, so it never keeps the program alive, but the queued writes are still done at exit.
+    """
+    def __init__(self, max_queued_writes: int = 16):
+        self._queue: queue.Queue[Optional[tuple[Callable, tuple]]] = queue.Queue(max_queued_writes)
+        self._thread = threading.Thread(target=self._run, name="BackgroundWriter", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, write: Callable, *args) -> None:
+        """
+        Queue a write to be run in the background thread
+        :param write: The function that writes to the disk
+        :param args: The arguments of the function
+        :return: None
+        """
+        if not self._thread.is_alive():
+            raise RuntimeError("The background writer is closed")
+        self._queue.put((write, args))
+
+    def flush(self) -> None:
+        """
+        Wait until all the queued writes are done
+        :return: None
+        """
+        self._queue.join()
+
+    def close(self) -> None:
+        """
+        Run all the queued writes and stop the background thread
+        :return: None
+        """
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        # Closed, there is nothing left to do at exit
+        atexit.unregister(self.close)
+
+    def _run(self) -> None:
+        """
+        Loop of the background thread, running the queued writes until close is called
+        :return: None
+        """
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                write, args = job
+                try:
+                    write(*args)
+                except Exception as exception:
+                    # A failed write must not stop the following ones
+                    print(f"Background write failed: {exception}")
+            finally:
+                self._queue.task_done()
@@ -0,0 +1,66 @@
+"""
+This module contains the RotationCache class.
+"""
+import pygame
+
+
+class RotationCache:
+    """
+    A class to cache the rotated surfaces of the sprites.
+    Rotating a surface is slow and the cars rotate a little every frame, so the angles are quantized to a step and the
+    surfaces rotated to each quantized angle are kept by the path of their sprite, shared by all the sprites that use
+    the same image.
+    The cached surfaces are shared, they must not be modified.
+    """
+    _rotations: dict[tuple[str, float], pygame.Surface] = {}
+    hits: int = 0
+    misses: int = 0
+
+    @staticmethod
+    def quantize(angle: float, step: float) -> float:
+        """
+        Quantize an angle to the closest multiple of the step, between 0 and 360 degrees.
+        :param angle: The angle in degrees
+        :param step: The step in degrees, if it is 0 the angle is not quantized
+        :return: The quantized angle
+        """
+        if step <= 0:
+            return angle % 360
+        return (round(angle / step) * step) % 360
+
+    @classmethod
+    def get_rotated(cls, path: str, image: pygame.Surface, angle: float) -> pygame.Surface:
+        """
+        Get the image of a sprite rotated by a quantized angle, rotating it if it is not cached.
+        :param path: The path of the sprite, that identifies the image
+        :param image: The original image of the sprite
+        :param angle: The quantized angle in degrees
+        :return: The rotated image, that must not be modified
+        """
+        key = (path, angle)
+        rotated = cls._rotations.get(key)
+        if rotated is None:
+            cls.misses += 1
+            rotated = pygame.transform.rotate(image, angle)
+            cls._rotations[key] = rotated
+        else:
+            cls.hits += 1
+        return rotated
+
+    @classmethod
+    def get_stats(cls) -> dict[str, int]:
+        """
+        Get the hits and misses of the cache, and the number of rotated surfaces cached.
+        :return: The statistics of the cache
+        """
+        return {"hits": cls.hits, "misses": cls.misses, "rotations": len(cls._rotations)}
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Discard all the rotated surfaces and reset the statistics.
+        :return: None
+        """
+        cls._rotations.clear()
+        cls.hits = 0
+        cls.misses = 0
@@ -1,6 +1,8 @@
 """
 This module contains the SpriteLoader class.
 """
+import os
+
 import pygame
 
 GLOBAL_SPRITE_PATH = "assets/sprites/"
@@ -10,12 +12,80 @@ SPRITE_EXTENSION = ".png"
 class SpriteLoader:
     """
     A class to load sprites from the disk and return them as a pygame.Surface.
+
+    The sprites are cached by path for the whole process, so each sprite is read from the disk and converted only
+    once, and all the entities with the same sprite (the thousands of tiles of a map) share the same surface.
+    The surfaces are shared, they must not be modified.
     """
+    _sprites: dict[str, pygame.Surface] = {}
+    # Paths of the cached sprites that are converted to the pixel format of the window
+    _converted: set[str] = set()
+    hits: int = 0
+    misses: int = 0
+
     @staticmethod
     def load(path: str) -> pygame.Surface:
         """
         Load a sprite from the disk and return it as a pygame.Surface.
-        :param path: The path to the sprite to load
-        :return: The sprite as a pygame.Surface
+        If there is no window (headless training), the sprite is returned without converting it, as there is no
+        display pixel format to convert it to. It is converted the first time it is loaded once there is a window.
+        :param path: The path to the sprite to load, relative to the sprites folder and without extension
+        :return: The sprite as a pygame.Surface, shared by all the sprites with the same path
+        """
+        sprite = SpriteLoader._sprites.get(path)
+        has_window = pygame.display.get_surface() is not None
+        if sprite is not None and (path in SpriteLoader._converted or not has_window):
+            SpriteLoader.hits += 1
+            return sprite
+        SpriteLoader.misses += 1
+        if sprite is None:
+            sprite = pygame.image.load(GLOBAL_SPRITE_PATH + path + SPRITE_EXTENSION)
+        if has_window:
+            sprite = sprite.convert_alpha()
+            SpriteLoader._converted.add(path)
+        SpriteLoader._sprites[path] = sprite
+        return sprite
+
+    @staticmethod
+    def preload(directory: str = "") -> int:
+        """
+        Load all the sprites of a folder and its subfolders, so they are already loaded when they are needed.
+        :param directory: The folder relative to the sprites folder, all the sprites if empty
+        :return: The number of sprites loaded
+        """
+        number_of_sprites = 0
+        for root, _, files in os.walk(GLOBAL_SPRITE_PATH + directory):
+            for file in sorted(files):
+                if file.endswith(SPRITE_EXTENSION):
+                    path = os.path.relpath(os.path.join(root, file), GLOBAL_SPRITE_PATH)
+                    SpriteLoader.load(path[:-len(SPRITE_EXTENSION)].replace(os.sep, "/"))
+                    number_of_sprites += 1
+        return number_of_sprites
+
+    @staticmethod
+    def get_memory_usage() -> int:
+        """
+        Get the memory used by the pixels of the cached sprites.
+        :return: The memory in bytes
+        """
+        return sum(sprite.get_pitch() * sprite.get_height() for sprite in SpriteLoader._sprites.values())
+
+    @staticmethod
+    def get_stats() -> dict[str, int]:
+        """
+        Get the hits and misses of the cache, the number of cached sprites and the memory they use.
+        :return: The statistics of the cache
+        """
+        return {"hits": SpriteLoader.hits, "misses": SpriteLoader.misses, "sprites": len(SpriteLoader._sprites),
+                "memory": SpriteLoader.get_memory_usage()}
+
+    @staticmethod
+    def clear() -> None:
+        """
+        Discard all the cached sprites and reset the statistics.
+        :return: None
         """
-        return pygame.image.load(GLOBAL_SPRITE_PATH + path + SPRITE_EXTENSION).convert_alpha()
+        SpriteLoader._sprites.clear()
+        SpriteLoader._converted.clear()
+        SpriteLoader.hits = 0
+        SpriteLoader.misses = 0
@@ -81,9 +81,10 @@ class Window:
         """
         pygame.display.flip()
 
-    def clear(self) -> None:
+    def clear(self, color: tuple[int, int, int] = None) -> None:
         """
-        Clear the window, filling it with the background color.
+        Clear the window, filling it with a color.
+        :param color: The color to fill the window with, the background color of the window if None
         :return:
         """
-        self.window.fill(self.WINDOW_BACKGROUND_COLOR)
+        self.window.fill(self.WINDOW_BACKGROUND_COLOR if color is None else color)
@@ -4,9 +4,28 @@ This module contains functions for geometry calculations.
 import numpy as np
 from numpy import ndarray
 from numba import njit, boolean, float64, uint32, uint64, int64
+from numba.extending import intrinsic
 
 
-@njit(boolean(float64[:], float64[:, :]))
+@intrinsic
+def fused_multiply_add(typing_context, a, b, c):
+    """
+    Calculate a * b + c rounding only once, as the FMA instruction does.
+    This can only be called from functions compiled with Numba.
+    It is used to rotate points exactly as NumPy does with np.dot, whose BLAS kernels use FMA, so the rounding of the
+    rotated points is the same.
+    :param typing_context: The typing context of Numba
+    :param a: The first factor
+    :param b: The second factor
+    :param c: The value to add to the product
+    :return: The signature and the code generator of the intrinsic
+    """
+    def codegen(context, builder, signature, arguments):
+        return builder.fma(*arguments)
+    return float64(float64, float64, float64), codegen
+
+
+@njit(boolean(float64[:], float64[:, :]), cache=True)
 def point_in_polygon(point: ndarray, polygon: ndarray[ndarray]) -> bool:
     """
     Check if a point is inside a polygon.
@@ -35,7 +54,7 @@ def point_in_polygon(point: ndarray, polygon: ndarray[ndarray]) -> bool:
     return inside
 
 
-@njit(float64[:](float64, float64, float64, float64, float64))
+@njit(float64[:](float64, float64, float64, float64, float64), cache=True)
 def rotate_point(x, y, center_x, center_y, angle):
     """
     Rotate a point around a center.
@@ -68,7 +87,7 @@ def rotate_point(x, y, center_x, center_y, angle):
     return np.array([new_x, new_y])
 
 
-@njit(float64[:, :](float64, float64[:], float64[:], float64, uint32))
+@njit(float64[:, :](float64, float64[:], float64[:], float64, uint32), cache=True)
 def calculate_polygon(angle: float, direction: ndarray, position: ndarray, tile_size: int,
                       radius: float = 6) -> ndarray:
     """
@@ -6,6 +6,7 @@ import random
 from pygame import Vector2
 
 from src.engine.components.collider import Collider
+from src.engine.managers.collider_manager.collision_layers import CollisionLayer
 from src.engine.managers.entity_manager.entity_manager import EntityManager
 from src.engine.managers.render_manager.renderer import DebugRenderer
 from src.game.entities.NPC import NPC
@@ -46,7 +47,7 @@ class NPCManager:
         :return: True if the position is invalid, False otherwise
         """
         return self.is_npc_pos_invalid(pos) \
-            or self._tile_map.get_tile_at_pos_vec(pos).tile_type == MapType.TRACK
+            or self._tile_map.type_at(pos) == MapType.TRACK
 
     def is_npc_pos_invalid(self, pos: Vector2) -> bool:
         """
@@ -60,8 +61,9 @@ class NPCManager:
         tile_index = self._tile_map.get_tile_index_from_pos_vec(pos)
         tile_index_x = tile_index[0]
         tile_index_y = tile_index[1]
-        return self._tile_map.get_tile_at_pos_vec(pos) is None \
-            or self._tile_map.get_tile_at_pos_vec(pos).tile_type == MapType.SEA \
+        tile_type = self._tile_map.type_at(pos)
+        return tile_type is None \
+            or tile_type == MapType.SEA \
             or tile_index_x > self._tile_map.get_width_number() - self._map_margin_invalid \
             or tile_index_x < self._map_margin_invalid \
             or tile_index_y > self._tile_map.get_height_number() - self._map_margin_invalid \
@@ -96,7 +98,7 @@ class NPCManager:
             if not self.is_npc_pos_invalid(goal_position):  # Check if the goal is valid
                 # And if it is, check of it is on the road, if it is, return it with a certain probability
                 # If the probability fails, keep looping until a valid goal is found
-                if self._tile_map.get_tile_at_pos_vec(goal_position).tile_type == MapType.TRACK:
+                if self._tile_map.type_at(goal_position) == MapType.TRACK:
                     if random.random() < road_probability:
                         return goal_position
                     else:
@@ -161,8 +163,8 @@ class NPCManager:
 
     def configure_npcs(self, cars: list[Car]) -> None:
         """
-        Configure the NPCs in the game by setting their initial position and goal and adding the colliders they can't
-        collide with to their collider component
+        Configure the NPCs in the game by setting their initial position and goal and the collision layer of their
+        collider component, so they don't collide with the cars nor between them
         :param cars: list of cars in the game
         """
         random.seed(seed)
@@ -173,14 +175,9 @@ class NPCManager:
             npc_physics = self._entity_manager.get_physics(npc.entity_ID)
             npc_physics.set_static(False)
             npc_collider.set_active(True)
-            for other_npc in self._NPCs:
-                other_npc_collider: Collider = self._entity_manager.get_collider(other_npc.entity_ID)
-                if npc_collider is not other_npc_collider:
-                    npc_collider.add_non_collideable_collider(other_npc_collider)
-
-            for car in cars:
-                car_collider: Collider = self._entity_manager.get_collider(car.entity_ID)
-                npc_collider.add_non_collideable_collider(car_collider)
+            # The NPCs don't collide with each other nor with the cars, but the cars collide with them
+            npc_collider.set_collision_layer(CollisionLayer.NPCS,
+                                             CollisionLayer.ALL & ~(CollisionLayer.NPCS | CollisionLayer.CARS))
 
     def initialize(self, cars: list[Car]):
         """
@@ -2,14 +2,25 @@
 Module that contains the class that represents the car knowledge in the game.
 """
 import math
+from typing import Optional
 
+import numpy as np
 from pygame import Vector2
 
 from src.game.ai.ai_info.chronometer import Chronometer
 from src.game.ai.ai_info.field_of_view import FOV
 from src.game.ai.ai_info.interval import Interval
+from src.game.ai.ai_info.ring_buffer import RingBuffer
+from src.game.ai.ai_info.sim_clock import SimClock
 from src.game.map.map_types import MapType
 
+# Number of values kept of each telemetry series, the older ones are overwritten
+TELEMETRY_CAPACITY = 4096
+# Simulated seconds a car can go without beating its best traveled distance before it is stalled
+STALL_TIME = 2.0
+# Distance the best traveled distance must be beaten by to count as progress
+PROGRESS_MARGIN = 1.0
+
 
 class CarKnowledge:
     """
@@ -17,21 +28,26 @@ class CarKnowledge:
     It includes the field of view, the chronometers, the intervals, the speeds, the distances and the angles to the
     next checkpoint, the traveled distance, the collisions count, the tile type, the nearest tile, the checkpoint
     number, the checkpoint value, the lap number, the position of the next checkpoint, and the has collided flag.
+
+    The telemetry series (intervals, speeds and distances) are ring buffers that only keep the last values, so the
+    memory used by each car stays the same during long training sessions.
+
+    With a clock of the simulation, the chronometers measure simulated time.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, telemetry_capacity: int = TELEMETRY_CAPACITY, clock: Optional[SimClock] = None) -> None:
         self.field_of_view = FOV()
 
-        self.chronometer_track = Chronometer()
-        self.chronometer_sidewalk = Chronometer()
-        self.chronometer_grass = Chronometer()
-        self.chronometer_still = Chronometer()
+        self.chronometer_track = Chronometer(clock)
+        self.chronometer_sidewalk = Chronometer(clock)
+        self.chronometer_grass = Chronometer(clock)
+        self.chronometer_still = Chronometer(clock)
 
         # intervals
         self.current_tile_interval = None
-        self.tile_intervals: list[Interval] = []
-        self.still_intervals: list[Interval] = []
-        self.speeds_per_frame = []
+        self.tile_intervals: RingBuffer = RingBuffer(telemetry_capacity, dtype=object)
+        self.still_intervals: RingBuffer = RingBuffer(telemetry_capacity, dtype=object)
+        self.speeds_per_frame: RingBuffer = RingBuffer(telemetry_capacity)
         self.checkpoints_intervals = []
         self.collisions_count = 0
         self.has_collided = False
@@ -40,7 +56,7 @@ class CarKnowledge:
         self.accumulator_speed = 0
 
         self.distance_to_next_checkpoint = 0
-        self.distances_to_checkpoints = []
+        self.distances_to_checkpoints: RingBuffer = RingBuffer(telemetry_capacity)
         self.angle_to_next_checkpoint = 0
 
         self.last_nearest_tile = None
@@ -50,6 +66,9 @@ class CarKnowledge:
         self.position_of_next_checkpoint = None  # used for AI inputs
 
         self.traveled_distance = 0
+        # Best traveled distance reached, and simulated time since it was last beaten
+        self.progress_watermark = 0
+        self.time_without_progress = 0
 
     def initialize(self, position_next_checkpoint) -> None:
         """
@@ -59,10 +78,12 @@ class CarKnowledge:
         self.position_of_next_checkpoint = position_next_checkpoint
 
     def update(self, on_tile: MapType, next_checkpoint_position: tuple[float, float], speed: float,
-               collider, car_in_tile_position: Vector2, frame_chronometer, checkpoint_distances) -> None:
+               collider, car_in_tile_position: Vector2, frame_chronometer,
+               cumulative_checkpoint_distances: np.ndarray) -> None:
         """
         Update the car knowledge
-        :param checkpoint_distances:
+        :param cumulative_checkpoint_distances: distance from the first checkpoint to the end of each checkpoint, the
+        last one is the length of a lap
         :param frame_chronometer:
         :param car_in_tile_position:
         :param collider:
@@ -83,13 +104,29 @@ class CarKnowledge:
 
         self.traveled_distance = 0
         if self.checkpoint_number != -1:
-            self.traveled_distance = 0
-            self.traveled_distance += self.lap_number * sum(checkpoint_distances)
-            for i in range(len(checkpoint_distances)):
-                if i <= self.checkpoint_number:
-                    self.traveled_distance += checkpoint_distances[i]
+            self.traveled_distance += self.lap_number * cumulative_checkpoint_distances.item(-1)
+            self.traveled_distance += cumulative_checkpoint_distances.item(self.checkpoint_number)
             self.traveled_distance -= self.distance_to_next_checkpoint
 
+    def update_progress(self, delta_time: float) -> None:
+        """
+        Update the progress watermark with the current traveled distance
+        :param delta_time: simulated seconds since the last update
+        """
+        if self.traveled_distance > self.progress_watermark + PROGRESS_MARGIN:
+            self.progress_watermark = self.traveled_distance
+            self.time_without_progress = 0
+        else:
+            self.time_without_progress += delta_time
+
+    def is_stalled(self, stall_time: float = STALL_TIME) -> bool:
+        """
+        Check if the car has not made progress for a while
+        :param stall_time: simulated seconds without progress to be stalled
+        :return: True if the car is stalled, False otherwise
+        """
+        return self.time_without_progress > stall_time
+
     def get_field_of_view(self) -> FOV:
         """
         Get the field of view
@@ -161,8 +198,7 @@ class CarKnowledge:
         self.distance_to_next_checkpoint = math.sqrt((next_checkpoint_position[0] - car_in_tile_position[0]) ** 2 +
                                                      (next_checkpoint_position[1] - car_in_tile_position[1]) ** 2)
 
-        self.distances_to_checkpoints.append(math.sqrt((next_checkpoint_position[0] - car_in_tile_position[0]) ** 2 +
-                                                       (next_checkpoint_position[1] - car_in_tile_position[1]) ** 2))
+        self.distances_to_checkpoints.append(self.distance_to_next_checkpoint)
 
     def _update_tile_type(self, on_tile) -> None:
         """
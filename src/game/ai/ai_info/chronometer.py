@@ -2,13 +2,19 @@
 This module contains the Chronometer class
 """
 import time
+from typing import Optional
+
+from src.game.ai.ai_info.sim_clock import SimClock
 
 
 class Chronometer:
     """
     This a reusable class that encapsulates the behavior of a chronometer.
+    With a clock of the simulation it measures simulated time, otherwise it measures the time of the machine.
     """
-    def __init__(self):
+    def __init__(self, clock: Optional[SimClock] = None):
+        self.clock: Optional[SimClock] = clock
+        self._get_time = clock.get_time if clock is not None else time.time
         self.start_time = None
         self.stop_time = None
         self.elapsed_seconds = 0
@@ -20,7 +26,7 @@ class Chronometer:
         :return: None
         """
         if not self.is_running:
-            self.start_time = time.time()
+            self.start_time = self._get_time()
             self.is_running = True
 
     def stop(self) -> None:
@@ -29,7 +35,7 @@ class Chronometer:
         :return: None
         """
         if self.is_running:
-            self.stop_time = time.time()
+            self.stop_time = self._get_time()
             self.is_running = False
             self.elapsed_seconds += self.stop_time - self.start_time
 
@@ -40,7 +46,7 @@ class Chronometer:
         :return: The elapsed time
         """
         if self.is_running:
-            return self.elapsed_seconds + time.time() - self.start_time
+            return self.elapsed_seconds + self._get_time() - self.start_time
         return self.elapsed_seconds
 
     def reset(self) -> None:
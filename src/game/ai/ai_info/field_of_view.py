@@ -4,42 +4,168 @@ This module contains the class FOV that represents the field of view of the car
 from typing import Optional
 
 import numpy as np
+from numba import njit
 from numpy import ndarray
 from pygame import Rect
 
 from src.engine.components.transform import Transform
-from src.engine.math.geometry import calculate_polygon
+from src.engine.math.geometry import fused_multiply_add, point_in_polygon, rotate_point
 from src.game.entities.tile import Tile
 from src.game.map.tile_map import TileMap, TILE_SIZE
 
-forward_array = np.zeros(2, dtype=np.float64)
-position_array = np.zeros(2, dtype=np.float64)
+FOV_RADIUS = 6
+FOV_SIZE = FOV_RADIUS * 2
+# Half the side, in tiles, of the square around the center of the field of view where its tiles are searched
+FOV_SEARCH_RADIUS = round(FOV_SIZE * FOV_SIZE) // TILE_SIZE
+# Distance to the edges of the vision box, in pixels, under which the rounding may decide if a point is inside
+VISION_BOX_EDGE_MARGIN = 1e-6
+
+
+@njit(cache=True)
+def calculate_vision_box(center_x: float, center_y: float, angle: float, tile_size: int) -> ndarray:
+    """
+    Calculate the vision box of the field of view, a square of 12x12 tiles around its center rotated by the angle.
+    :param center_x: The x coordinate of the center of the field of view
+    :param center_y: The y coordinate of the center of the field of view
+    :param angle: The angle of the field of view
+    :param tile_size: The size of the tiles
+    :return: The 4 corners of the vision box
+    """
+    radius_pixels = FOV_RADIUS * tile_size
+    corners = np.array([[center_x + radius_pixels, center_y - radius_pixels],
+                        [center_x + radius_pixels, center_y + radius_pixels],
+                        [center_x - radius_pixels, center_y + radius_pixels],
+                        [center_x - radius_pixels, center_y - radius_pixels]])
+    vision_box = np.zeros((4, 2), dtype=np.float64)
+    for i in range(4):
+        vision_box[i] = rotate_point(corners[i, 0], corners[i, 1], center_x, center_y, angle)
+    return vision_box
+
+
+@njit(cache=True)
+def sample_field_of_view(center_x: float, center_y: float, angle: float, map_width: int, map_height: int,
+                         tile_size: int, tile_indices: ndarray, tile_positions: ndarray) -> int:
+    """
+    Get the tiles in the field of view, in the order the car sees them.
+    The tiles around the center whose point (the middle of their top edge) is inside the vision box are selected.
+    Then they are sorted by their position relative to the center, rotated with the car: by rows of 12 tiles from the
+    front of the car to the back, and each row from right to left. There may be a few more or less than 144 tiles
+    inside the vision box, depending on the angle, only the first 144 are kept.
+    This is compiled with Numba.
+    :param center_x: The x coordinate of the center of the field of view
+    :param center_y: The y coordinate of the center of the field of view
+    :param angle: The angle of the field of view
+    :param map_width: The number of tiles in a row of the map
+    :param map_height: The number of rows of the map
+    :param tile_size: The size of the tiles
+    :param tile_indices: The array where the index in the map of each tile is written, with 144 elements
+    :param tile_positions: The array where the rotated position of each tile is written, with shape (144, 2)
+    :return: The number of tiles in the field of view
+    """
+    vision_box = calculate_vision_box(center_x, center_y, angle, tile_size)
+    radius_pixels = FOV_RADIUS * tile_size
+    theta = np.radians(angle)
+    cos_theta = np.cos(theta)
+    sin_theta = np.sin(theta)
+
+    number_of_candidates = 4 * FOV_SEARCH_RADIUS * FOV_SEARCH_RADIUS
+    candidate_indices = np.empty(number_of_candidates, dtype=np.int64)
+    rotated_x = np.empty(number_of_candidates, dtype=np.float64)
+    rotated_y = np.empty(number_of_candidates, dtype=np.float64)
+    point = np.zeros(2, dtype=np.float64)
+    number_of_tiles = 0
+    for i in range(-FOV_SEARCH_RADIUS, FOV_SEARCH_RADIUS):
+        index_x = int(center_x + i * tile_size) // tile_size
+        for j in range(-FOV_SEARCH_RADIUS, FOV_SEARCH_RADIUS):
+            index_y = int(center_y + j * tile_size) // tile_size
+            if not (0 <= index_x < map_width and 0 <= index_y < map_height):
+                continue
+            tile_x = float(index_x * tile_size)
+            tile_y = float(index_y * tile_size)
+            point[0] = tile_x + tile_size / 2
+            point[1] = tile_y
+            # Only the points next to the edges of the vision box need the point in polygon test
+            box_x = (point[0] - center_x) * cos_theta + (point[1] - center_y) * sin_theta
+            box_y = (point[1] - center_y) * cos_theta - (point[0] - center_x) * sin_theta
+            distance_to_edge = radius_pixels - max(abs(box_x), abs(box_y))
+            if distance_to_edge < -VISION_BOX_EDGE_MARGIN:
+                continue
+            if distance_to_edge > VISION_BOX_EDGE_MARGIN or point_in_polygon(point, vision_box):
+                relative_x = center_x - tile_x
+                relative_y = center_y - tile_y
+                candidate_indices[number_of_tiles] = index_y * map_width + index_x
+                # Rounded as np.dot rounds the product of the rotation matrix and the relative position, the order
+                # of the tiles at the same distance (at 45 degrees) depends on it
+                rotated_x[number_of_tiles] = fused_multiply_add(cos_theta, relative_x, sin_theta * relative_y)
+                rotated_y[number_of_tiles] = fused_multiply_add(-sin_theta, relative_x, cos_theta * relative_y)
+                number_of_tiles += 1
+
+    # Stable sorts, so the tiles at the same distance keep the order in which they were found
+    by_rows = np.argsort(-rotated_y[:number_of_tiles], kind="mergesort")
+    number_of_tiles = min(number_of_tiles, FOV_SIZE * FOV_SIZE)
+    for row_start in range(0, number_of_tiles, FOV_SIZE):
+        row = by_rows[row_start:row_start + FOV_SIZE]
+        row = row[np.argsort(rotated_x[row], kind="mergesort")]
+        for k in range(min(len(row), number_of_tiles - row_start)):
+            tile_indices[row_start + k] = candidate_indices[row[k]]
+            tile_positions[row_start + k, 0] = rotated_x[row[k]]
+            tile_positions[row_start + k, 1] = rotated_y[row[k]]
+    return number_of_tiles
 
 
 class FOV:
     """
     Class that represents the field of view of the car in the game.
     The purpose of this class is to calculate all the tiles that are in the field of view of the car.
+
+    The field of view is a square of 12x12 tiles in front of the car, rotated with it. Its tiles are selected and
+    ordered by sample_field_of_view, compiled with Numba.
+
+    Updating it only keeps its center and angle, the tiles are sampled when they are requested, so the AI can sample
+    the fields of view of all the cars at once with them instead.
     """
     def __init__(self):
-        self.field_of_view: list[Tile] = []
-        self.vision_box: ndarray = np.zeros((4, 2), dtype=np.float64)
+        self.tile_indices: ndarray = np.full(FOV_SIZE * FOV_SIZE, -1, dtype=np.int64)
+        self.tile_positions: ndarray = np.zeros((FOV_SIZE * FOV_SIZE, 2), dtype=np.float64)
+        self.number_of_tiles: int = 0
         self.tiles_with_entities_in_fov: list[int] = []
-        self.field_of_view_encoded: list[float] = []
+        self.field_of_view_encoded: ndarray = np.zeros(FOV_SIZE * FOV_SIZE, dtype=np.float32)
+        self._tile_map: Optional[TileMap] = None
+        self._center: ndarray = np.zeros(2, dtype=np.float64)
+        self._angle: float = 0
+        self._sampled: bool = True
+        # The tiles and the vision box are only needed for debugging, so they are calculated when requested
+        self._field_of_view: Optional[list[Tile]] = None
+        self._vision_box: Optional[ndarray] = None
 
-    def get(self) -> Optional[list[Tile]]:
+    def get(self) -> list[Tile]:
         """
         Get the field of view of the car as a list of tiles.
-        :return: The field of view of the car
+        :return: The field of view of the car, at most 144 tiles
+        """
+        if self._field_of_view is None:
+            if self._tile_map is None:
+                return []
+            self._sample()
+            self._field_of_view = [self._tile_map.tiles[index] for index in self.tile_indices[:self.number_of_tiles]]
+        return self._field_of_view
+
+    def get_positions(self) -> ndarray:
+        """
+        Get the positions of the tiles of the field of view relative to its center, rotated with the car.
+        :return: The position of each tile, in the same order as the tiles
         """
-        return self.field_of_view
+        self._sample()
+        return self.tile_positions[:self.number_of_tiles]
 
     def get_vision_box(self) -> ndarray:
         """
         Get the vision box of the car.
         :return: The vision box of the car
         """
-        return self.vision_box
+        if self._vision_box is None:
+            self._vision_box = calculate_vision_box(self._center[0], self._center[1], self._angle, TILE_SIZE)
+        return self._vision_box
 
     def get_tiles_with_entities_in_fov(self) -> list[int]:
         """
@@ -49,44 +175,65 @@ class FOV:
         """
         return self.tiles_with_entities_in_fov
 
+    def get_center(self) -> ndarray:
+        """
+        Get the center of the field of view, 6 tiles in front of the car
+        :return: The center of the field of view
+        """
+        return self._center
+
+    def get_angle(self) -> float:
+        """
+        Get the angle of the field of view, the rotation of the car when it was updated
+        :return: The angle of the field of view
+        """
+        return self._angle
+
+    def get_tile_map(self) -> Optional[TileMap]:
+        """
+        Get the tile map the field of view looks at
+        :return: The tile map, None if the field of view was never updated
+        """
+        return self._tile_map
+
     def update(self, car_transform: Transform, tile_map: TileMap) -> None:
         """
         Update the field of view of the car.
-        This will call calculate_polygon to obtain a polygon (rotated square) and then get the tiles within that square.
+        This moves the center of the field of view 6 tiles in front of the car and rotates it with the car, the tiles
+        are sampled again when they are requested.
         :param car_transform: The transform of the car
         :param tile_map: The tile map of the game
         :return: None
         """
         forward = car_transform.get_forward()
         position = car_transform.get_position()
-        angle = car_transform.get_rotation()
-        forward_array[0] = forward.x
-        forward_array[1] = forward.y
-        position_array[0] = position.x
-        position_array[1] = position.y
-        self.vision_box: ndarray = calculate_polygon(angle, forward_array, position_array, TILE_SIZE, radius=6)
-        self.field_of_view = self._get_field_of_view(car_transform, tile_map)
+        self._angle = car_transform.get_rotation()
+        self._center[0] = position.x + forward.x * FOV_RADIUS * TILE_SIZE
+        self._center[1] = position.y + forward.y * FOV_RADIUS * TILE_SIZE
+        self._tile_map = tile_map
+        self._sampled = False
+        self._field_of_view = None
+        self._vision_box = None
 
-    def _get_field_of_view(self, transform: Transform, tile_map: TileMap) -> list[Tile, bool]:
+    def _sample(self) -> None:
         """
-        Get the field of view of the car as a list of tiles.
-        This method is called by update to get the field of view of the car to update the attribute field_of_view.
-        :param transform:
-        :param tile_map:
-        :return:
-        """
-        position = transform.get_position()
-        angle = transform.get_rotation()
-        forward = transform.get_forward()
-        # Sum 6 tiles in the forward direction
-        pos = position.x + forward.x * 6 * TILE_SIZE, position.y + forward.y * 6 * TILE_SIZE
-        tiles_within_square_and_codes = tile_map.get_tiles_within_square((pos[0], pos[1]),
-                                                                         radius=6,
-                                                                         vision_box=self.vision_box,
-                                                                         angle=angle)
-        tiles_within_square = tiles_within_square_and_codes[0]
-        self.field_of_view_encoded = tiles_within_square_and_codes[1]
-        return tiles_within_square
+        Sample the tiles of the field of view and their encoded values, if it was updated since they were sampled.
+        The positions without a tile, at the end, are encoded as -1. If there is no tile at all, everything is 0.
+        :return: None
+        """
+        if self._sampled or self._tile_map is None:
+            return
+        self.number_of_tiles = sample_field_of_view(self._center[0], self._center[1], self._angle,
+                                                    self._tile_map.get_width_number(),
+                                                    self._tile_map.get_height_number(), TILE_SIZE,
+                                                    self.tile_indices, self.tile_positions)
+        if self.number_of_tiles == 0:
+            self.field_of_view_encoded = np.zeros(FOV_SIZE * FOV_SIZE, dtype=np.float32)
+        else:
+            self.field_of_view_encoded = np.full(FOV_SIZE * FOV_SIZE, -1.0, dtype=np.float32)
+            self.field_of_view_encoded[:self.number_of_tiles] = \
+                self._tile_map.encoded_values[self.tile_indices[:self.number_of_tiles]]
+        self._sampled = True
 
     def _get_tiles_with_entity(self,
                                npc_transforms: list[Transform],
@@ -110,21 +257,16 @@ class FOV:
             if transform.get_position().distance_to(car_transform.get_position()) > 12 * TILE_SIZE:
                 continue
             tiles_with_entity.extend(tile_map.get_tiles_of_rect(transform.get_position(), sprite_rect))
-        for i, tile in enumerate(self.field_of_view):
+        for i, tile in enumerate(self.get()):
             if tile in tiles_with_entity:
                 tiles_with_entity_index.append(i)
         return tiles_with_entity_index
 
-    def get_encoded_version(self) -> list[float]:
+    def get_encoded_version(self) -> ndarray:
         """
-        This returns a list of 144 elements that represents the field of view of the car in an encoded version.
+        This returns an array of 144 elements that represents the field of view of the car in an encoded version.
         The purpose of this method is to be used as input for the neural network.
-        :return: The encoded version of the field of view as a list of 144 floats
+        :return: The encoded version of the field of view as an array of 144 floats
         """
-        if len(self.field_of_view_encoded) == 0:
-            return [0] * 144
-        to_add = 144 - len(self.field_of_view_encoded)
-
-        for _ in range(to_add):
-            self.field_of_view_encoded.append(-1.0)
+        self._sample()
         return self.field_of_view_encoded
@@ -0,0 +1,66 @@
+"""
+This module contains the RingBuffer class
+"""
+import numpy as np
+
+
+class RingBuffer:
+    """
+    Fixed size buffer backed by a NumPy array.
+    When it is full, every new value overwrites the oldest one, so the memory used stays the same no matter how many
+    values are appended. It is used for the telemetry of the cars, which is recorded every frame.
+
+    The values are indexed from the oldest to the newest one, and negative indices start from the newest one like in
+    a list.
+    """
+    def __init__(self, capacity: int, dtype=np.float64):
+        if capacity <= 0:
+            raise ValueError("The capacity of the ring buffer must be greater than 0")
+        self._values: np.ndarray = np.empty(capacity, dtype=dtype)
+        self._next: int = 0
+        self._size: int = 0
+
+    def append(self, value) -> None:
+        """
+        Add a value, overwriting the oldest one if the buffer is full
+        :param value: The value to add
+        :return: None
+        """
+        self._values[self._next] = value
+        self._next = (self._next + 1) % len(self._values)
+        if self._size < len(self._values):
+            self._size += 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int):
+        if not -self._size <= index < self._size:
+            raise IndexError("Ring buffer index out of range")
+        if index < 0:
+            index += self._size
+        return self._values[(self._next - self._size + index) % len(self._values)]
+
+    def get_capacity(self) -> int:
+        """
+        Get the maximum number of values the buffer keeps
+        :return: The capacity of the buffer
+        """
+        return len(self._values)
+
+    def to_array(self) -> np.ndarray:
+        """
+        Get the values kept in the buffer
+        :return: A copy of the values, from the oldest to the newest one
+        """
+        if self._size < len(self._values):
+            return self._values[:self._size].copy()
+        return np.roll(self._values, -self._next)
+
+    def clear(self) -> None:
+        """
+        Remove all the values
+        :return: None
+        """
+        self._next = 0
+        self._size = 0
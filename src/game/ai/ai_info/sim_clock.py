@@ -0,0 +1,47 @@
+"""
+This module contains the SimClock class
+"""
+
+
+class SimClock:
+    """
+    This class is the clock of the simulation.
+    Its time is the sum of the delta times of the steps of the simulation, instead of the time of the machine, so the
+    simulation can run faster than real time and gives the same results in any machine or load.
+
+    The owner of the simulation advances it once per step, and the chronometers created with it measure its time.
+    """
+    def __init__(self):
+        self._time: float = 0
+        self._steps: int = 0
+
+    def advance(self, delta_time: float) -> None:
+        """
+        Advance the clock one step of the simulation
+        :param delta_time: simulated seconds of the step
+        :return: None
+        """
+        self._time += delta_time
+        self._steps += 1
+
+    def get_time(self) -> float:
+        """
+        Get the simulated time
+        :return: The simulated seconds since the clock started
+        """
+        return self._time
+
+    def get_steps(self) -> int:
+        """
+        Get the number of steps of the simulation
+        :return: The number of times the clock has advanced
+        """
+        return self._steps
+
+    def reset(self) -> None:
+        """
+        Reset the clock to zero
+        :return: None
+        """
+        self._time = 0
+        self._steps = 0
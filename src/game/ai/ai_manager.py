@@ -2,7 +2,7 @@
 AI Manager class that manages the AI agents
 """
 
-import json
+from typing import Optional
 
 import numpy as np
 
@@ -12,11 +12,19 @@ from src.engine.managers.input_manager.input_manager import InputManager
 from src.engine.managers.input_manager.key import Key
 from src.game.ai.ai_state import AIState
 from src.game.ai.car_ai_agent import CarAIAgent
+from src.game.ai.checkpoint_writer import CheckpointWriter, load_latest_model
 from src.game.ai.data_collector import DataCollector
+from src.game.ai.input_encoder import InputEncoder
+from src.game.ai.generation_end_policies import GenerationEndPolicy, TimeLimitPolicy, NoProgressPolicy, \
+    EliteUnreachablePolicy
+from src.game.ai.training_snapshot import TrainingSnapshot
 from src.engine.ai.genetic_algorithm.genetic_algorithm import GeneticAlgorithm
 from src.engine.ai.neural_network.neural_network import NeuralNetwork
+from src.engine.ai.neural_network.population_neural_network import PopulationNeuralNetwork
 from src.game.entities.car import Car
+from src.game.map.tile_map import TileMap
 from src.game.ai.ai_info.chronometer import Chronometer
+from src.game.ai.ai_info.sim_clock import SimClock
 
 population_size = 15
 NEURAL_NET_LAYER_SIZES = [147, 32, 6]
@@ -27,19 +35,41 @@ class AIManager:
     AI Manager class that manages the AI agents
     """
 
-    def __init__(self, entity_manager: EntityManager, training=True) -> None:
+    def __init__(self, entity_manager: EntityManager, training=True, seed: int = None,
+                 clock: SimClock = None) -> None:
         self.entity_manager: EntityManager = entity_manager
         self.training: bool = training
+        # Tile map of the race, set by the cars manager
+        self.tile_map: Optional[TileMap] = None
+        # Clock of the simulation, advanced by the owner of the simulation, the generations are measured with it
+        self.clock: SimClock = clock if clock is not None else SimClock()
         if training:
-            self.genetic_algorithm: GeneticAlgorithm = GeneticAlgorithm()
+            self.genetic_algorithm: GeneticAlgorithm = GeneticAlgorithm(seed)
         self._agents: list[AIAgent] = []
         self.state: AIState = AIState.SIMULATION
 
-        self.fitness_scores = {}
+        # Saves the fitness scores and the best model of every generation in the background, None to not save them
+        self.checkpoint_writer: Optional[CheckpointWriter] = CheckpointWriter() if training else None
+        # Fitness scores of every evolved generation, saved in the snapshots to resume the training
+        self.fitness_history: dict[int, list[float]] = {}
+        # Snapshot to resume the training from when the population is created, None to start a new training
+        self._snapshot_to_resume: Optional[TrainingSnapshot] = None
+
+        # Policies that end the generation, checked every frame with the simulated time of the generation
+        # If None, the default ones are created with the population
+        self.generation_end_policies: Optional[list[GenerationEndPolicy]] = None
+        self._generation_start_time: float = 0
 
         self.inputs = []
+        self._population_neural_network: PopulationNeuralNetwork = None
+        # Encodes the inputs of all the enabled cars at once, created with the population neural network
+        self._input_encoder: Optional[InputEncoder] = None
+        # Last inputs and outputs of the network of each agent
+        self._last_inputs: np.ndarray = np.zeros((0, NEURAL_NET_LAYER_SIZES[0]), dtype=np.float64)
+        self._last_outputs: np.ndarray = np.zeros((0, NEURAL_NET_LAYER_SIZES[-1]), dtype=np.float64)
 
-        self.data_collector_activated = True
+        # Only the training records the fitness of the agents, watching or racing the AI must not replace it
+        self.data_collector_activated = training
         if self.data_collector_activated:
             self.data_collector = DataCollector()
         self._end_of_generation = False
@@ -79,21 +109,53 @@ class AIManager:
         :param frame_chronometer: frame chronometer
         """
         self._all_disabled = True
-        if len(self.get_agents()) > 1:
-            if self.genetic_algorithm.generation_timer.get_elapsed_time() == 0:
-                self.genetic_algorithm.generation_timer.start()
-        for agent in self.get_agents():
+        agents = self.get_agents()
+        if self._population_neural_network is None:
+            self._build_population_neural_network()
+        enabled_indices = []
+        enabled_cars = []
+        for i, agent in enumerate(agents):
             agent.evaluate_fitness()
             if self.data_collector_activated:
                 self.data_collector.collect_fitness(agent, frame_chronometer.get_elapsed_time())
             if not agent.controlled_entity.disabled:
-                self.inputs = self.prepare_input(agent.controlled_entity)
-                outputs = agent.neural_network.forward(self.inputs)
-                # Convert outputs to commands
-                agent.controlled_entity.input_manager.convert_outputs_to_commands(outputs)
-                self._all_disabled = False
+                enabled_indices.append(i)
+                enabled_cars.append(agent.controlled_entity)
             else:
                 agent.controlled_entity.input_manager.stop_keys()
+        if len(enabled_indices) == 0:
+            return
+        self._all_disabled = False
+
+        enabled_inputs = self._input_encoder.encode(enabled_cars, self.entity_manager)
+
+        # All the enabled agents are evaluated in a single forward pass of the population
+        indices = None if len(enabled_indices) == len(agents) else np.array(enabled_indices)
+        all_outputs = self._population_neural_network.forward(enabled_inputs, indices)
+        # The inputs and outputs are buffers overwritten every frame, so the last ones of each network are kept for
+        # the explainability
+        self._last_inputs[enabled_indices] = enabled_inputs
+        self._last_outputs[enabled_indices] = all_outputs
+        for i in enabled_indices:
+            agent = agents[i]
+            agent.neural_network.inputs = self._last_inputs[i]
+            agent.neural_network.outputs = self._last_outputs[i]
+            # Convert outputs to commands
+            agent.controlled_entity.input_manager.convert_outputs_to_commands(self._last_outputs[i])
+        self.inputs = self._last_inputs[enabled_indices[-1]]
+
+    def _build_population_neural_network(self) -> None:
+        """
+        Stack the neural networks of the current agents, so they can be evaluated together
+        Must be called every time the agents change
+        """
+        self._population_neural_network = PopulationNeuralNetwork(
+            [agent.neural_network for agent in self.get_agents()])
+        number_of_agents = len(self.get_agents())
+        if len(self._last_inputs) != number_of_agents:
+            self._last_inputs = np.zeros((number_of_agents, NEURAL_NET_LAYER_SIZES[0]), dtype=np.float64)
+            self._last_outputs = np.zeros((number_of_agents, NEURAL_NET_LAYER_SIZES[-1]), dtype=np.float64)
+            self._input_encoder = InputEncoder(number_of_agents)
 
     def evolve_agents(self, frame_chronometer) -> None:
         """
@@ -102,20 +164,47 @@ class AIManager:
         if self.data_collector_activated:
             self.data_collector.change_generation(frame_chronometer.get_elapsed_time(), self.get_agents(),
                                                   self.genetic_algorithm.current_generation)
-        cars = [agent.controlled_entity for agent in self.get_agents()]
+        generation = self.genetic_algorithm.current_generation
+        fitness_scores = [agent.fitness_score for agent in self.get_agents()]
+        self.fitness_history[generation] = fitness_scores
         next_generation = self.genetic_algorithm.evolve_agents()
-        next_generation_agents = []
-        for genome, car in zip(next_generation, cars):
-            next_generation_agents.append(CarAIAgent(car, NeuralNetwork(layer_sizes=NEURAL_NET_LAYER_SIZES,
-                                                                        parameters=genome)))
-        self.genetic_algorithm.load_agents(next_generation_agents)
-        self.state = AIState.SIMULATION
-        self.genetic_algorithm.generation_timer.reset()
-        self.reset(cars)
+        if self.checkpoint_writer is not None:
+            self.checkpoint_writer.save_generation(generation, fitness_scores, self.genetic_algorithm.top_parameters,
+                                                   self.genetic_algorithm.top_fitness)
+            # The snapshot has the genomes of the next generation, so the training resumes where it is now
+            self.checkpoint_writer.save_snapshot(TrainingSnapshot.capture(np.stack(next_generation),
+                                                                          self.genetic_algorithm,
+                                                                          self.fitness_history))
+        self.load_genomes(next_generation)
         self._end_of_generation = True
         if self.data_collector_activated:
             self.data_collector.add_top_fitness(self.genetic_algorithm.top_fitness)
 
+    def load_genomes(self, genomes) -> None:
+        """
+        Replace the agents with new ones controlling the same cars with the given genomes, and start simulating them
+        :param genomes: genomes of the new agents, one per car
+        """
+        cars = [agent.controlled_entity for agent in self.get_agents()]
+        agents = []
+        for genome, car in zip(genomes, cars):
+            agents.append(CarAIAgent(car, NeuralNetwork(layer_sizes=NEURAL_NET_LAYER_SIZES, parameters=genome)))
+        self.genetic_algorithm.load_agents(agents)
+        self._build_population_neural_network()
+        self.state = AIState.SIMULATION
+        self._reset_generation_end_policies()
+        self.reset(cars)
+
+    def close(self) -> None:
+        """
+        Finish the saves of the checkpoint writer and the telemetry recorder, and stop their background writers
+        Must be called when the AI manager is not used anymore
+        """
+        if self.checkpoint_writer is not None:
+            self.checkpoint_writer.close()
+        if self.data_collector_activated:
+            self.data_collector.telemetry_recorder.close()
+
     def has_generation_ended(self) -> bool:
         """
         Check if the generation has ended
@@ -129,11 +218,11 @@ class AIManager:
         """
         self._end_of_generation = False
 
-    def prepare_input(self, car: Car) -> list[float]:
+    def prepare_input(self, car: Car) -> np.ndarray:
         """
         Prepare the input for the neural network
         :param car: car to get the inputs from
-        :return: list of inputs for the neural network of the car
+        :return: array of inputs for the neural network of the car
         """
         # 1. Velocity
         physics = self.entity_manager.get_physics(car.entity_ID)
@@ -161,20 +250,92 @@ class AIManager:
         agent_field_of_view: list[float] = car.car_knowledge.field_of_view.get_encoded_version()
 
         # Add all inputs
-        inputs = [normalized_velocity] + list(normalized_relative_position)
-        inputs.extend(agent_field_of_view)
-        return inputs
+        return np.concatenate(([normalized_velocity], normalized_relative_position, agent_field_of_view))
 
     def create_population(self, cars: list[Car]) -> None:
         """
         Initialize population
         """
-        if len(cars) <= 2:
-            self.get_agents().append(CarAIAgent(cars[-1], NeuralNetwork(layer_sizes=NEURAL_NET_LAYER_SIZES)))
-            self.get_agents()[-1].neural_network.load_parameters()
+        # Without training there is only one AI car, the last one (the other one is the player, if any)
+        if not self.training:
+            neural_network = NeuralNetwork(layer_sizes=NEURAL_NET_LAYER_SIZES)
+            # The last model saved by the training is used if it fits the network, otherwise the bundled one
+            parameters = load_latest_model()
+            if parameters is not None and parameters.size == neural_network.get_total_params():
+                neural_network.set_parameters(parameters)
+            else:
+                neural_network.load_parameters()
+            self.get_agents().append(CarAIAgent(cars[-1], neural_network))
+            self._build_population_neural_network()
             return
-        agents = self._create_new_population(cars)  # or self._load_agents_from_file(cars)
+        if self._snapshot_to_resume is not None:
+            agents = self._load_agents_from_snapshot(cars, self._snapshot_to_resume)
+            self._snapshot_to_resume = None
+        else:
+            agents = self._create_new_population(cars)  # or self._load_agents_from_file(cars)
         self.genetic_algorithm.load_agents(agents)
+        self._build_population_neural_network()
+        if self.generation_end_policies is None:
+            self.generation_end_policies = self._create_generation_end_policies(cars)
+        self._reset_generation_end_policies()
+
+    def _create_generation_end_policies(self, cars: list[Car]) -> list[GenerationEndPolicy]:
+        """
+        Create the default policies to end the generations
+        :param cars: list of cars, to get their maximum speed
+        :return: the policies
+        """
+        duration = self.genetic_algorithm.generation_duration
+        policies = [TimeLimitPolicy(duration), NoProgressPolicy()]
+        # Without the tile map the jumps of the traveled distance at the checkpoints are unknown
+        if self.tile_map is not None:
+            max_speed = max(car.accelerate_max_speed for car in cars)
+            policies.append(EliteUnreachablePolicy(duration, max_speed, self.genetic_algorithm.elite_fraction,
+                                                   self.tile_map.get_checkpoint_jump()))
+        return policies
+
+    def _reset_generation_end_policies(self) -> None:
+        """
+        Restart the simulated time and the policies to end the generation for a new generation
+        """
+        self._generation_start_time = self.clock.get_time()
+        for policy in self.generation_end_policies or []:
+            policy.reset()
+
+    def get_generation_time(self) -> float:
+        """
+        Get the simulated time of the current generation
+        :return: The simulated seconds since the generation started
+        """
+        return self.clock.get_time() - self._generation_start_time
+
+    def should_generation_end(self) -> bool:
+        """
+        Check the policies to end the generation with the current fitness scores and simulated time
+        All the policies are checked every frame, as some of them keep track of the progress of the agents
+        :return: True if any policy ends the generation, False otherwise
+        """
+        agents = self.get_agents()
+        fitness_scores = np.fromiter((agent.fitness_score for agent in agents), dtype=np.float64, count=len(agents))
+        alive = np.fromiter((not agent.controlled_entity.disabled for agent in agents), dtype=bool,
+                            count=len(agents))
+        should_end = False
+        for policy in self.generation_end_policies or []:
+            should_end = policy.should_end(fitness_scores, alive, self.get_generation_time()) or should_end
+        return should_end
+
+    def resume_from_snapshot(self, snapshot: TrainingSnapshot) -> None:
+        """
+        Resume a training session from a snapshot
+        The genomes of the snapshot are loaded when the population is created, and the state of the genetic algorithm
+        and the fitness history are restored now
+        :param snapshot: snapshot of the training to resume
+        """
+        if not self.training:
+            raise ValueError("Only a training can be resumed")
+        snapshot.restore(self.genetic_algorithm)
+        self.fitness_history = dict(snapshot.fitness_history)
+        self._snapshot_to_resume = snapshot
 
     def reset(self, cars: list[Car]):
         """
@@ -184,10 +345,19 @@ class AIManager:
         for agent, car in zip(self.get_agents(), cars):
             agent.reset(car)
 
+    @staticmethod
+    def _load_agents_from_snapshot(cars, snapshot: TrainingSnapshot):
+        if len(snapshot.genomes) < len(cars):
+            raise ValueError(f"The snapshot has {len(snapshot.genomes)} genomes, but there are {len(cars)} cars")
+        agents: list[AIAgent] = []
+        for car, genome in zip(cars, snapshot.genomes):
+            agents.append(CarAIAgent(car, NeuralNetwork(layer_sizes=NEURAL_NET_LAYER_SIZES, parameters=genome)))
+        return agents
+
     @staticmethod
     def _create_new_population(cars):
         agents: list[AIAgent] = []
-        for i in range(population_size):
+        for i in range(len(cars)):
             agents.append(CarAIAgent(cars[i], NeuralNetwork(layer_sizes=NEURAL_NET_LAYER_SIZES)))
             # agents[i].neural_network.load_parameters()
         return agents
@@ -195,24 +365,29 @@ class AIManager:
     def handle_user_inputs(self, input_manager, frame_chronometer):
         """
         Handle user inputs for the AI manager
-        :param input_manager: input manager to get the keys pressed by the user
+        :param input_manager: input manager to get the keys pressed by the user, None if there is no user
         :param frame_chronometer: chronometer to get the elapsed time of the game
         :return:
         """
+        # Without an input manager (headless training) there are no user inputs to handle
+        key_save_pressed = input_manager is not None and input_manager.is_key_down(Key.K_S)
+        key_next_pressed = input_manager is not None and input_manager.is_key_down(Key.K_N)
         # check if generation is over
-        if input_manager.is_key_down(Key.K_S):
+        if key_save_pressed:
             if self.data_collector_activated:
                 self.data_collector.save_data(frame_chronometer.get_elapsed_time())
         # detect keys pressed, 'N' for next generation
-        if (input_manager.is_key_down(Key.K_N)
-                or self._all_disabled
-                or self.genetic_algorithm.generation_timer.get_elapsed_time() >
-                self.genetic_algorithm.generation_duration):
-            # before going to the next generation, save fitness scores
-            self.fitness_scores[self.genetic_algorithm.current_generation] = []
-            for agent in self.get_agents():
-                self.fitness_scores[self.genetic_algorithm.current_generation].append(agent.fitness_score)
-            with open('fitness_scores.json', 'w') as f:
-                json.dump(self.fitness_scores, f)
-
-            self.state = AIState.EVOLVING
+        # The policies are always checked, so they keep track of the whole generation
+        policies_end_generation = self.should_generation_end()
+        if key_next_pressed or self._all_disabled or policies_end_generation:
+            self.end_generation()
+
+    def end_generation(self) -> None:
+        """
+        End the current generation, so the agents evolve on the next update.
+        The fitness scores are saved when they evolve.
+        It does nothing if the agents are not being simulated.
+        """
+        if self.state != AIState.SIMULATION:
+            return
+        self.state = AIState.EVOLVING
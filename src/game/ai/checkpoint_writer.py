@@ -0,0 +1,108 @@
+"""
+This module contains the CheckpointWriter class
+"""
+import json
+import os
+import time
+from typing import Optional
+
+import numpy as np
+
+from src.engine.managers.resource_manager.atomic_file_writer import AtomicFileWriter
+from src.engine.managers.resource_manager.background_writer import BackgroundWriter
+from src.game.ai.training_snapshot import TrainingSnapshot, SNAPSHOT_FILE_NAME
+
+FITNESS_SCORES_PATH = 'fitness_scores.jsonl'
+MODELS_DIRECTORY = 'assets/data_files/models/training'
+
+
+class CheckpointWriter:
+    """
+    This class saves the results of every generation of the training without blocking the game loop.
+    The files are written by a background writer, and each generation saves:
+
+    - a line with its fitness scores appended to the fitness scores file, so the history is never rewritten.
+
+    - the parameters of its best neural network in the models directory, as generation_NNNN.npy, with its metadata
+      in generation_NNNN.json.
+
+    - latest.json in the models directory, pointing to the model of the last saved generation.
+
+    The models and the metadata are written atomically, so a crash never corrupts the last good model.
+    """
+    def __init__(self, fitness_scores_path: str = FITNESS_SCORES_PATH, models_directory: str = MODELS_DIRECTORY,
+                 background_writer: Optional[BackgroundWriter] = None):
+        self.fitness_scores_path: str = fitness_scores_path
+        self.models_directory: str = models_directory
+        self._background_writer: Optional[BackgroundWriter] = background_writer
+
+    def save_generation(self, generation: int, fitness_scores, top_parameters: np.ndarray,
+                        top_fitness: float) -> None:
+        """
+        Queue the save of the results of a generation
+        :param generation: The number of the generation
+        :param fitness_scores: The fitness score of each agent of the generation
+        :param top_parameters: The parameters of the neural network of the best agent
+        :param top_fitness: The fitness score of the best agent
+        :return: None
+        """
+        if self._background_writer is None:
+            self._background_writer = BackgroundWriter()
+        # Copied now, the values may change before the background writer saves them
+        fitness_line = json.dumps({"generation": generation, "fitness_scores": [float(f) for f in fitness_scores]})
+        top_parameters = np.array(top_parameters, copy=True)
+
+        model_name = f"generation_{generation:04d}"
+        model_path = os.path.join(self.models_directory, model_name + ".npy")
+        metadata = {"generation": generation, "top_fitness": float(top_fitness),
+                    "number_of_parameters": int(top_parameters.size), "time": time.time(),
+                    "model": model_name + ".npy"}
+
+        self._background_writer.submit(AtomicFileWriter.append_line, self.fitness_scores_path, fitness_line)
+        self._background_writer.submit(AtomicFileWriter.save_npy, model_path, top_parameters)
+        self._background_writer.submit(AtomicFileWriter.save_json,
+                                       os.path.join(self.models_directory, model_name + ".json"), metadata)
+        # The latest model is only updated once the model it points to is saved
+        self._background_writer.submit(AtomicFileWriter.save_json,
+                                       os.path.join(self.models_directory, "latest.json"), metadata)
+
+    def save_snapshot(self, snapshot: TrainingSnapshot) -> None:
+        """
+        Queue the save of a snapshot of the training session in the models directory, replacing the previous one
+        :param snapshot: The snapshot of the training, it must not change after it is queued
+        :return: None
+        """
+        if self._background_writer is None:
+            self._background_writer = BackgroundWriter()
+        self._background_writer.submit(snapshot.save, os.path.join(self.models_directory, SNAPSHOT_FILE_NAME))
+
+    def flush(self) -> None:
+        """
+        Wait until all the queued saves are done
+        :return: None
+        """
+        if self._background_writer is not None:
+            self._background_writer.flush()
+
+    def close(self) -> None:
+        """
+        Finish all the queued saves and stop the background writer
+        :return: None
+        """
+        if self._background_writer is not None:
+            self._background_writer.close()
+            self._background_writer = None
+
+
+def load_latest_model(models_directory: str = MODELS_DIRECTORY) -> Optional[np.ndarray]:
+    """
+    Load the parameters of the last saved model of the training
+    :param models_directory: The directory of the models
+    :return: The parameters of the model, or None if there is no saved model
+    """
+    latest_path = os.path.join(models_directory, "latest.json")
+    if not os.path.exists(latest_path):
+        return None
+    with open(latest_path) as file:
+        latest = json.load(file)
+    return np.load(os.path.join(models_directory, latest["model"]))
@@ -5,18 +5,21 @@ import csv
 import json
 
 from src.game.ai.ai_info.interval import Interval
+from src.game.ai.telemetry_recorder import TelemetryRecorder
 
 
 class DataCollector:
     """
     The DataCollector class is responsible for collecting and saving data about the fitness of the agents.
+    The fitness of every agent through time is streamed to a TelemetryRecorder instead of being kept in memory.
     """
     def __init__(self):
         self.generation_intervals: list[Interval] = []
         self.generation_intervals.append(Interval(0, 0))
         self.top_fitness_per_generation = []
 
-        self.total_fitness_per_car_through_time = {}
+        self.current_generation = 1
+        self.telemetry_recorder = TelemetryRecorder()
 
     def collect_fitness(self, agent, elapsed_time, evaluate=True, new_generation=False):
         """
@@ -44,6 +47,8 @@ class DataCollector:
         """
         for agent in agents:
             self.collect_fitness(agent, elapsed_time, evaluate=False)
+        self.current_generation = current_generation + 1
+        for agent in agents:
             self.collect_fitness(agent, elapsed_time, evaluate=False, new_generation=True)
         self.generation_intervals[-1].close(elapsed_time)
         self.generation_intervals.append(Interval(elapsed_time, current_generation))
@@ -73,14 +78,11 @@ class DataCollector:
                 writer.writerow([data['fitness_score'], data['tile']])
 
     def _update_total_fitness(self, car_id, elapsed_time, fitness):
-        elapsed_time = round(elapsed_time, 3)
-        if car_id not in self.total_fitness_per_car_through_time:
-            self.total_fitness_per_car_through_time[car_id] = {}
-        self.total_fitness_per_car_through_time[car_id][elapsed_time] = fitness
+        self.telemetry_recorder.record(self.current_generation, car_id, elapsed_time, fitness)
 
-    def _save_fitness_scores(self, filename='assets/data_files/results/total_fitness_scores.json'):
-        with open(filename, 'w') as file:
-            json.dump(self.total_fitness_per_car_through_time, file, indent=4)
+    def _save_fitness_scores(self):
+        # The records are written in the background, so saving doesn't stall the game
+        self.telemetry_recorder.flush()
 
     def _save_generation_intervals(self, elapsed_time, filename='assets/data_files/results/generation_intervals.json'):
         elapsed_time = round(elapsed_time, 3)
@@ -0,0 +1,97 @@
+"""
+This module contains the policies that decide when a generation of the training ends
+"""
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+# Frames without any car improving its traveled distance before the generation ends
+NO_PROGRESS_FRAMES = 150
+
+
+class GenerationEndPolicy(ABC):
+    """
+    Policy that decides if the current generation must end
+    It is checked every frame of the simulation with the fitness scores of the agents and the simulated time, so the
+    generations end at the same point whatever the frame rate is
+    """
+    def reset(self) -> None:
+        """
+        Reset the policy for a new generation
+        Does nothing by default
+        :return: None
+        """
+        pass
+
+    @abstractmethod
+    def should_end(self, fitness_scores: np.ndarray, alive: np.ndarray, generation_time: float) -> bool:
+        """
+        Check if the generation must end
+        :param fitness_scores: fitness score of each agent
+        :param alive: whether each agent is still enabled
+        :param generation_time: simulated seconds since the generation started
+        :return: True if the generation must end, False otherwise
+        """
+        pass
+
+
+class TimeLimitPolicy(GenerationEndPolicy):
+    """
+    The generation ends when its simulated time is over the duration of a generation
+    """
+    def __init__(self, duration: float):
+        self.duration: float = duration
+
+    def should_end(self, fitness_scores: np.ndarray, alive: np.ndarray, generation_time: float) -> bool:
+        return generation_time > self.duration
+
+
+class NoProgressPolicy(GenerationEndPolicy):
+    """
+    The generation ends when no agent has improved its best fitness score for a number of frames
+    """
+    def __init__(self, max_frames: int = NO_PROGRESS_FRAMES):
+        self.max_frames: int = max_frames
+        self._best_fitness_scores: np.ndarray = None
+        self._frames_without_progress: int = 0
+
+    def reset(self) -> None:
+        self._best_fitness_scores = None
+        self._frames_without_progress = 0
+
+    def should_end(self, fitness_scores: np.ndarray, alive: np.ndarray, generation_time: float) -> bool:
+        if self._best_fitness_scores is None or np.any(fitness_scores > self._best_fitness_scores):
+            self._frames_without_progress = 0
+        else:
+            self._frames_without_progress += 1
+        self._best_fitness_scores = fitness_scores if self._best_fitness_scores is None \
+            else np.maximum(self._best_fitness_scores, fitness_scores)
+        return self._frames_without_progress >= self.max_frames
+
+
+class EliteUnreachablePolicy(GenerationEndPolicy):
+    """
+    The generation ends when none of the enabled agents can get into the elite anymore
+    An agent can at most add the distance traveled at the maximum speed during the time left in the generation, plus
+    the jump of its traveled distance when it crosses a checkpoint, so if even that is under the fitness score of the
+    worst agent of the elite, the elite will not change
+    The traveled distance is measured to the next checkpoint, so after the jump of a checkpoint the car is as much
+    further from the next one, and the jumps do not add up over the checkpoints crossed in the time left
+    """
+    def __init__(self, duration: float, max_speed: float, elite_fraction: float, checkpoint_jump: float):
+        self.duration: float = duration
+        self.max_speed: float = max_speed
+        self.elite_fraction: float = elite_fraction
+        self.checkpoint_jump: float = checkpoint_jump
+
+    def should_end(self, fitness_scores: np.ndarray, alive: np.ndarray, generation_time: float) -> bool:
+        if not np.any(alive):
+            return False
+        number_of_elite = max(1, int(round(self.elite_fraction * len(fitness_scores))))
+        if number_of_elite >= len(fitness_scores):
+            return False
+        # The worst fitness score of the elite, without sorting all the scores
+        elite_threshold = np.partition(fitness_scores, -number_of_elite)[-number_of_elite]
+        time_left = max(0.0, self.duration - generation_time)
+        best_reachable = np.max(fitness_scores[alive]) + self.max_speed * time_left + self.checkpoint_jump
+        return best_reachable < elite_threshold
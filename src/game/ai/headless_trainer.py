@@ -0,0 +1,123 @@
+"""
+This module contains the HeadlessTrainer class
+"""
+import os
+from typing import Optional
+
+import numpy as np
+
+from src.game.ai.ai_manager import AIManager, population_size
+from src.game.ai.ai_state import AIState
+from src.game.ai.training_snapshot import TrainingSnapshot
+from src.game.headless_simulation import HeadlessSimulation, FIXED_DELTA_TIME
+from src.game.replay.replay import ReplayRecorder
+
+
+class HeadlessTrainer(HeadlessSimulation):
+    """
+    This class trains the AI without a window, renderer or frame rate cap.
+    It is a headless simulation of the cars driven by an AI manager, stepped with a fixed simulated delta time, so the
+    generations run as fast as the CPU allows.
+
+    Each step mirrors one frame of the training state inside the engine. As in the engine, the generations end by the
+    policies of the AI manager, measured in simulated time.
+
+    Given a snapshot, the training resumes from it instead of starting with a new population. Given a replay
+    directory, every generation is recorded there, so it can be simulated again by a replay player.
+    """
+    def __init__(self, map_name: str, number_of_cars: int = population_size,
+                 delta_time: float = FIXED_DELTA_TIME, seed: int = None,
+                 snapshot: Optional[TrainingSnapshot] = None, replay_directory: Optional[str] = None) -> None:
+        super().__init__(map_name, number_of_cars, delta_time)
+        ai_manager = AIManager(self._entity_manager, seed=seed, clock=self._clock)
+        if snapshot is not None:
+            ai_manager.resume_from_snapshot(snapshot)
+        self._cars_manager.set_ai_manager(ai_manager)
+
+        self.replay_directory: Optional[str] = replay_directory
+        self._replay_recorder: Optional[ReplayRecorder] = None
+        if replay_directory is not None:
+            self._replay_recorder = ReplayRecorder(map_name, number_of_cars, seed)
+
+    def get_ai_manager(self) -> AIManager:
+        """
+        Get the AI manager of the trained cars
+        :return: The AI manager
+        """
+        return self._cars_manager.get_ai_manager()
+
+    def get_generation_time(self) -> float:
+        """
+        Get the simulated time of the current generation
+        :return: The simulated time in seconds
+        """
+        return self.get_ai_manager().get_generation_time()
+
+    def run(self, generations: int) -> None:
+        """
+        Run the simulation until the given number of generations have evolved
+        :param generations: The number of generations to train
+        :return: None
+        """
+        genetic_algorithm = self.get_ai_manager().genetic_algorithm
+        last_generation = genetic_algorithm.current_generation + generations
+        while genetic_algorithm.current_generation < last_generation:
+            self.step()
+            if self.get_ai_manager().has_generation_ended():
+                print(f"Reached generation {genetic_algorithm.current_generation}, "
+                      f"top fitness: {genetic_algorithm.top_fitness}")
+
+    def evaluate(self, genomes: np.ndarray) -> np.ndarray:
+        """
+        Simulate one generation of the given genomes, without evolving them
+        This is used by the parallel evaluator, where each process evaluates a part of the population
+        :param genomes: genomes to evaluate, one per row and at most one per car
+        :return: The fitness score of each genome
+        """
+        ai_manager = self.get_ai_manager()
+        if not ai_manager.get_agents():
+            ai_manager.create_population(self._cars_manager.get_cars())
+        self._reset()
+        ai_manager.load_genomes(genomes)
+        while ai_manager.state == AIState.SIMULATION:
+            self.step()
+        fitness_scores = np.array([agent.fitness_score for agent in ai_manager.get_agents()], dtype=np.float64)
+        # The evolution is done by the caller, so the generation starts again with the next genomes
+        ai_manager.state = AIState.SIMULATION
+        return fitness_scores
+
+    def step(self) -> None:
+        """
+        Advance the simulation one fixed time step
+        This updates the cars and the AI, then the physics and the colliders, as the engine does every frame
+        :return: None
+        """
+        ai_manager = self.get_ai_manager()
+        if ai_manager.has_generation_ended():
+            self._reset()
+            ai_manager.next_generation()
+        if self._replay_recorder is not None and not self._replay_recorder.is_recording():
+            self._replay_recorder.start(ai_manager.genetic_algorithm.current_generation, self._steps)
+
+        self._clock.advance(self._delta_time)
+        cars = self._cars_manager.get_cars()
+        if self._replay_recorder is not None:
+            # The keys pressed now are the outputs of the last update of the AI, used by the cars in this step
+            self._replay_recorder.record_frame(self._delta_time, cars)
+        self._cars_manager.update_training_cars(self._delta_time)
+        ai_manager.update(cars, None, self._chronometer)
+
+        self._update_physics()
+
+        if self._replay_recorder is not None and ai_manager.has_generation_ended():
+            self._save_replay()
+
+    def _save_replay(self) -> None:
+        """
+        Finish the recording of the generation and save its replay
+        :return: None
+        """
+        cars = self._cars_manager.get_cars()
+        replay = self._replay_recorder.finish(
+            self._cars_manager.get_car_positions(), [car.car_knowledge.traveled_distance for car in cars])
+        replay.save(os.path.join(self.replay_directory, f"generation_{replay.header['generation']:04d}.npz"))
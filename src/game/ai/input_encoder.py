@@ -0,0 +1,134 @@
+"""
+This module contains the InputEncoder class and the kernel that encodes the inputs of all the cars at once
+"""
+import numpy as np
+from numba import njit, prange
+from numpy import ndarray
+
+from src.engine.managers.entity_manager.entity_manager import EntityManager
+from src.game.ai.ai_info.field_of_view import FOV_SIZE, sample_field_of_view
+from src.game.entities.car import Car
+from src.game.map.tile_map import TILE_SIZE
+
+# Velocity, relative position to the next checkpoint and field of view
+NUMBER_OF_INPUTS = 1 + 2 + FOV_SIZE * FOV_SIZE
+
+
+def _encode_inputs(fov_centers: ndarray, fov_angles: ndarray, car_positions: ndarray, velocities: ndarray,
+                   min_velocities: ndarray, max_velocities: ndarray, next_checkpoint_positions: ndarray,
+                   encoded_values: ndarray, map_width: int, map_height: int, tile_size: int, inputs: ndarray) -> None:
+    """
+    Encode the inputs of the neural networks of many cars at once, each row of the inputs is a car.
+    The inputs of a car are its normalized velocity, the direction to its next checkpoint and the encoded values of the
+    tiles in its field of view, the same as AIManager.prepare_input.
+    This is compiled with Numba, and the cars are encoded in parallel.
+    :param fov_centers: The center of the field of view of each car, with shape (number of cars, 2)
+    :param fov_angles: The angle of the field of view of each car
+    :param car_positions: The position of each car, with shape (number of cars, 2)
+    :param velocities: The velocity of each car
+    :param min_velocities: The minimum velocity of each car
+    :param max_velocities: The maximum velocity of each car
+    :param next_checkpoint_positions: The position of the next checkpoint of each car, with shape (number of cars, 2)
+    :param encoded_values: The encoded value of each tile of the map
+    :param map_width: The number of tiles in a row of the map
+    :param map_height: The number of rows of the map
+    :param tile_size: The size of the tiles
+    :param inputs: The array where the inputs are written, with shape (number of cars, NUMBER_OF_INPUTS)
+    :return: None
+    """
+    for i in prange(len(fov_angles)):
+        # 1. Velocity
+        inputs[i, 0] = (velocities[i] - min_velocities[i]) / (max_velocities[i] - min_velocities[i])
+
+        # 2. Relative position to next checkpoint
+        relative_x = next_checkpoint_positions[i, 0] - car_positions[i, 0]
+        relative_y = next_checkpoint_positions[i, 1] - car_positions[i, 1]
+        distance = np.sqrt(relative_x * relative_x + relative_y * relative_y)
+        if distance != 0:
+            inputs[i, 1] = relative_x / distance
+            inputs[i, 2] = relative_y / distance
+        else:
+            inputs[i, 1] = 0.0
+            inputs[i, 2] = 0.0
+
+        # 3. Field of view, the tiles are selected and ordered as FOV does
+        tile_indices = np.empty(FOV_SIZE * FOV_SIZE, dtype=np.int64)
+        tile_positions = np.empty((FOV_SIZE * FOV_SIZE, 2), dtype=np.float64)
+        number_of_tiles = sample_field_of_view(fov_centers[i, 0], fov_centers[i, 1], fov_angles[i], map_width,
+                                               map_height, tile_size, tile_indices, tile_positions)
+        for k in range(FOV_SIZE * FOV_SIZE):
+            if k < number_of_tiles:
+                inputs[i, 3 + k] = encoded_values[tile_indices[k]]
+            elif number_of_tiles == 0:
+                inputs[i, 3 + k] = 0.0
+            else:
+                inputs[i, 3 + k] = -1.0
+
+
+encode_inputs = njit(parallel=True, cache=True)(_encode_inputs)
+
+
+class InputEncoder:
+    """
+    This class encodes the inputs of the neural networks of all the cars into a preallocated array.
+    The data of the cars is gathered into arrays and encoded by a single compiled kernel, instead of building the
+    inputs of each car with NumPy.
+    """
+    def __init__(self, number_of_cars: int):
+        self.inputs: ndarray = np.zeros((number_of_cars, NUMBER_OF_INPUTS), dtype=np.float64)
+        self._fov_centers: ndarray = np.zeros((number_of_cars, 2), dtype=np.float64)
+        self._fov_angles: ndarray = np.zeros(number_of_cars, dtype=np.float64)
+        self._car_positions: ndarray = np.zeros((number_of_cars, 2), dtype=np.float64)
+        self._velocities: ndarray = np.zeros(number_of_cars, dtype=np.float64)
+        self._min_velocities: ndarray = np.zeros(number_of_cars, dtype=np.float64)
+        self._max_velocities: ndarray = np.zeros(number_of_cars, dtype=np.float64)
+        self._next_checkpoint_positions: ndarray = np.zeros((number_of_cars, 2), dtype=np.float64)
+
+    def encode(self, cars: list[Car], entity_manager: EntityManager) -> ndarray:
+        """
+        Encode the inputs of the cars
+        The fields of view of the cars must look at the same tile map
+        :param cars: The cars to encode, at most the number of cars of the encoder
+        :param entity_manager: The entity manager of the cars
+        :return: The inputs, with one row per car. It is a view of the buffer, overwritten by the next call
+        """
+        number_of_cars = len(cars)
+        tile_map = None
+        without_field_of_view = []
+        for i, car in enumerate(cars):
+            field_of_view = car.car_knowledge.field_of_view
+            center = field_of_view.get_center()
+            self._fov_centers[i, 0] = center[0]
+            self._fov_centers[i, 1] = center[1]
+            self._fov_angles[i] = field_of_view.get_angle()
+            if field_of_view.get_tile_map() is None:
+                without_field_of_view.append(i)
+            elif tile_map is None:
+                tile_map = field_of_view.get_tile_map()
+
+            position = entity_manager.get_transform(car.entity_ID).get_position()
+            self._car_positions[i, 0] = position.x
+            self._car_positions[i, 1] = position.y
+            self._velocities[i] = entity_manager.get_physics(car.entity_ID).get_velocity()
+            self._min_velocities[i] = -car.base_max_speed
+            self._max_velocities[i] = car.accelerate_max_speed
+            next_checkpoint_position = car.car_knowledge.get_next_checkpoint_position()
+            self._next_checkpoint_positions[i, 0] = next_checkpoint_position[0]
+            self._next_checkpoint_positions[i, 1] = next_checkpoint_position[1]
+
+        inputs = self.inputs[:number_of_cars]
+        if tile_map is None:
+            encoded_values = np.zeros(0, dtype=np.float32)
+            map_width = map_height = 0
+        else:
+            encoded_values = tile_map.encoded_values
+            map_width = tile_map.type_map_list.get_width()
+            map_height = tile_map.type_map_list.get_height()
+        encode_inputs(self._fov_centers[:number_of_cars], self._fov_angles[:number_of_cars],
+                      self._car_positions[:number_of_cars], self._velocities[:number_of_cars],
+                      self._min_velocities[:number_of_cars], self._max_velocities[:number_of_cars],
+                      self._next_checkpoint_positions[:number_of_cars], encoded_values, map_width, map_height,
+                      TILE_SIZE, inputs)
+        # The fields of view that were never updated are empty
+        inputs[without_field_of_view, 3:] = 0
+        return inputs
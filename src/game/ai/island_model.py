@@ -0,0 +1,181 @@
+"""
+This module contains the IslandModel class
+"""
+import multiprocessing
+import os
+import queue
+from typing import Optional
+
+import numpy as np
+
+from src.engine.ai.genetic_algorithm.genetic_algorithm import GeneticAlgorithm
+from src.engine.ai.neural_network.neural_network import NeuralNetwork
+from src.game.ai.ai_manager import NEURAL_NET_LAYER_SIZES, population_size
+from src.game.ai.checkpoint_writer import CheckpointWriter, MODELS_DIRECTORY
+from src.game.ai.headless_trainer import HeadlessTrainer, FIXED_DELTA_TIME
+
+# Seconds the main process waits for the result of an island before checking that the islands are still alive
+RESULT_TIMEOUT = 5
+
+
+def _run_island(island_index: int, map_name: str, number_of_genomes: int, generations: int,
+                migration_interval: int, migration_size: int, delta_time: float, seed: Optional[int],
+                inbox: multiprocessing.Queue, outbox: multiprocessing.Queue,
+                results: multiprocessing.Queue) -> None:
+    """
+    Evolve the population of an island, run in its own process
+    Every migration interval, the best genomes of the generation are sent to the next island, and the ones received
+    from the previous island replace some of the children of the next generation
+    :param island_index: index of the island
+    :param map_name: name of the map the island trains on
+    :param number_of_genomes: population size of the island
+    :param generations: number of generations to evolve
+    :param migration_interval: generations between migrations
+    :param migration_size: number of genomes that migrate
+    :param delta_time: simulated seconds advanced every step
+    :param seed: seed of the genetic algorithm of the island, None for a random seed
+    :param inbox: queue of the genomes migrating from the previous island
+    :param outbox: queue of the genomes migrating to the next island
+    :param results: queue where the fitness scores and the best genome of every generation are sent
+    :return: None
+    """
+    # The global random generator is used to create the neural networks, seeded so the islands are reproducible
+    np.random.seed(seed)
+    trainer = HeadlessTrainer(map_name, number_of_genomes, delta_time, seed)
+    # The main process saves the results of the islands, and the telemetry of the islands is not recorded
+    trainer.get_ai_manager().checkpoint_writer = None
+    trainer.get_ai_manager().data_collector_activated = False
+    genetic_algorithm = GeneticAlgorithm(seed)
+    genomes = np.stack([NeuralNetwork(NEURAL_NET_LAYER_SIZES).get_parameters() for _ in range(number_of_genomes)])
+
+    for _ in range(generations):
+        fitness_scores = trainer.evaluate(genomes)
+        top_index = int(np.argmax(fitness_scores))
+        results.put((island_index, genetic_algorithm.current_generation, fitness_scores, genomes[top_index].copy()))
+
+        migrants = None
+        if migration_size > 0 and genetic_algorithm.current_generation % migration_interval == 0:
+            migrants = genomes[np.argpartition(-fitness_scores, migration_size - 1)[:migration_size]]
+        genomes = genetic_algorithm.evolve_genomes(genomes, fitness_scores)
+        if migrants is not None:
+            outbox.put(migrants)
+            # The elite is at the start of the genomes and is never replaced, the immigrants replace the last children
+            immigrants = inbox.get()
+            genomes[len(genomes) - len(immigrants):] = immigrants
+
+
+class IslandModel:
+    """
+    This class trains the AI with an island model: the population is split in islands, each one evolving its own
+    sub-population in its own process with its own genetic algorithm, and possibly on a different map.
+
+    The islands are connected in a ring. Every migration interval, each island sends copies of its best genomes to the
+    next island through a queue, where they replace some of its children. The best genomes spread across the islands,
+    and the ones trained on different maps are mixed, while each island keeps its own diversity.
+
+    The results of every island are saved by the main process in its own directory of the training models.
+    """
+    def __init__(self, map_names: list[str], number_of_islands: int, genomes_per_island: int = population_size,
+                 migration_interval: int = 5, migration_size: int = 2, delta_time: float = FIXED_DELTA_TIME,
+                 seed: int = None, models_directory: str = MODELS_DIRECTORY) -> None:
+        if number_of_islands < 1:
+            raise ValueError("There must be at least one island")
+        if len(map_names) == 0:
+            raise ValueError("There must be at least one map")
+        if migration_interval < 1:
+            raise ValueError("The migration interval must be at least 1")
+        # Never more migrants than genomes, and a single island has nowhere to send them
+        self.migration_size: int = min(migration_size, genomes_per_island) if number_of_islands > 1 else 0
+        self.migration_interval: int = migration_interval
+        self.genomes_per_island: int = genomes_per_island
+        self.delta_time: float = delta_time
+        self.seed: Optional[int] = seed
+        # The maps are assigned to the islands in turns
+        self.map_names: list[str] = [map_names[i % len(map_names)] for i in range(number_of_islands)]
+
+        self.checkpoint_writers: list[CheckpointWriter] = []
+        for i in range(number_of_islands):
+            island_directory = os.path.join(models_directory, f"island_{i:02d}")
+            self.checkpoint_writers.append(
+                CheckpointWriter(os.path.join(island_directory, "fitness_scores.jsonl"), island_directory))
+        self.top_fitness: list[float] = [0.0] * number_of_islands
+        self.top_parameters: list[Optional[np.ndarray]] = [None] * number_of_islands
+        self._processes: list[multiprocessing.Process] = []
+
+    def run(self, generations: int) -> None:
+        """
+        Evolve all the islands the given number of generations
+        :param generations: The number of generations to train
+        :return: None
+        """
+        number_of_islands = len(self.map_names)
+        # The islands are spawned, not forked, so they don't inherit the threads of this process (the thread pool of
+        # the compiled kernels or the background writers), which are not safe to use after a fork
+        context = multiprocessing.get_context("spawn")
+        # Queue i carries the migrants to island i
+        migration_queues = [context.Queue() for _ in range(number_of_islands)]
+        results = context.Queue()
+        self._processes = []
+        for i, map_name in enumerate(self.map_names):
+            # Every island has its own seed, so they don't evolve the same way
+            seed = None if self.seed is None else self.seed + i
+            process = context.Process(
+                target=_run_island, name=f"Island{i}",
+                args=(i, map_name, self.genomes_per_island, generations, self.migration_interval,
+                      self.migration_size, self.delta_time, seed, migration_queues[i],
+                      migration_queues[(i + 1) % number_of_islands], results))
+            process.start()
+            self._processes.append(process)
+
+        remaining_results = generations * number_of_islands
+        while remaining_results > 0:
+            try:
+                island_index, generation, fitness_scores, top_parameters = results.get(timeout=RESULT_TIMEOUT)
+            except queue.Empty:
+                if any(process.exitcode not in (None, 0) for process in self._processes):
+                    self.close()
+                    raise RuntimeError("An island stopped before finishing its generations")
+                continue
+            self._save_generation(island_index, generation, fitness_scores, top_parameters)
+            remaining_results -= 1
+
+        for process in self._processes:
+            process.join()
+
+    def get_best_island(self) -> int:
+        """
+        Get the island with the best genome found
+        :return: The index of the island
+        """
+        return int(np.argmax(self.top_fitness))
+
+    def _save_generation(self, island_index: int, generation: int, fitness_scores: np.ndarray,
+                         top_parameters: np.ndarray) -> None:
+        """
+        Save the fitness scores of a generation of an island and the parameters of its best genome
+        :param island_index: The index of the island
+        :param generation: The number of the generation
+        :param fitness_scores: The fitness score of each genome of the island
+        :param top_parameters: The parameters of the best genome of the generation
+        :return: None
+        """
+        top_fitness = float(np.max(fitness_scores))
+        if self.top_parameters[island_index] is None or top_fitness > self.top_fitness[island_index]:
+            self.top_fitness[island_index] = top_fitness
+            self.top_parameters[island_index] = top_parameters
+        self.checkpoint_writers[island_index].save_generation(generation, fitness_scores, top_parameters, top_fitness)
+        print(f"Island {island_index} ({self.map_names[island_index]}) finished generation {generation}, "
+              f"top fitness: {top_fitness}")
+
+    def close(self) -> None:
+        """
+        Stop the islands that are still running and finish saving their results
+        :return: None
+        """
+        for process in self._processes:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+        self._processes = []
+        for checkpoint_writer in self.checkpoint_writers:
+            checkpoint_writer.close()
@@ -0,0 +1,160 @@
+"""
+This module contains the ParallelEvaluator class
+"""
+import multiprocessing
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional
+
+import numpy as np
+
+from src.engine.ai.genetic_algorithm.genetic_algorithm import GeneticAlgorithm
+from src.engine.ai.neural_network.neural_network import NeuralNetwork
+from src.game.ai.ai_manager import NEURAL_NET_LAYER_SIZES, population_size
+from src.game.ai.checkpoint_writer import CheckpointWriter
+from src.game.ai.generation_end_policies import TimeLimitPolicy
+from src.game.ai.headless_trainer import HeadlessTrainer, FIXED_DELTA_TIME
+from src.game.ai.training_snapshot import TrainingSnapshot
+
+# State of each worker process, set by _initialize_worker
+_worker_genomes: Optional[np.ndarray] = None
+_worker_shared_memory: Optional[SharedMemory] = None
+_worker_map_name: str = ""
+_worker_delta_time: float = FIXED_DELTA_TIME
+# One headless trainer per number of cars, as the shards may differ in one genome
+_worker_trainers: dict[int, HeadlessTrainer] = {}
+
+
+def _initialize_worker(map_name: str, shared_memory_name: str, shape: tuple[int, int], delta_time: float) -> None:
+    """
+    Initialize a worker process, attaching it to the shared memory of the genomes
+    :param map_name: name of the map to train on
+    :param shared_memory_name: name of the shared memory block with the genomes
+    :param shape: shape of the genomes array, (population size, genome length)
+    :param delta_time: simulated seconds advanced every step
+    :return: None
+    """
+    global _worker_genomes, _worker_shared_memory, _worker_map_name, _worker_delta_time
+    _worker_shared_memory = SharedMemory(name=shared_memory_name)
+    _worker_genomes = np.ndarray(shape, dtype=np.float64, buffer=_worker_shared_memory.buf)
+    _worker_map_name = map_name
+    _worker_delta_time = delta_time
+
+
+def _evaluate_shard(start: int, stop: int) -> np.ndarray:
+    """
+    Simulate one generation of the genomes in the rows [start, stop) of the shared memory
+    :param start: first genome of the shard
+    :param stop: end of the shard, not included
+    :return: The fitness score of each genome of the shard
+    """
+    number_of_cars = stop - start
+    if number_of_cars not in _worker_trainers:
+        trainer = HeadlessTrainer(_worker_map_name, number_of_cars, _worker_delta_time)
+        ai_manager = trainer.get_ai_manager()
+        # Only the main process saves the fitness scores and the telemetry
+        ai_manager.checkpoint_writer = None
+        ai_manager.data_collector_activated = False
+        # The other policies look at the progress and the elite of the shard, not of the whole population
+        ai_manager.generation_end_policies = [TimeLimitPolicy(ai_manager.genetic_algorithm.generation_duration)]
+        _worker_trainers[number_of_cars] = trainer
+    # Copied, as the neural networks keep views of their parameters and the shared memory is rewritten every generation
+    return _worker_trainers[number_of_cars].evaluate(_worker_genomes[start:stop].copy())
+
+
+class ParallelEvaluator:
+    """
+    This class trains the AI evaluating the population in a pool of processes.
+    The population is split in one shard per worker, and each worker simulates its shard with its own headless trainer
+    (tile map, physics, colliders and cars) for a generation of simulated time. The fitness scores are gathered in
+    the main process, where the genetic algorithm evolves the whole population.
+
+    Unlike a training in one process, a shard only ends when its time is over or all its cars are disabled. A worker
+    only sees its shard, so ending it when its cars stop improving or can not reach the elite of the shard could
+    stop a car that would still get into the elite of the whole population.
+
+    The genomes are written every generation in a shared memory block, so they are not pickled to the workers. Only
+    the bounds of each shard are sent, and only the fitness scores are sent back.
+
+    Given a snapshot, the training resumes from its genomes and the state of its genetic algorithm.
+    """
+    def __init__(self, map_name: str, number_of_workers: int, number_of_genomes: int = population_size,
+                 delta_time: float = FIXED_DELTA_TIME, seed: int = None,
+                 snapshot: Optional[TrainingSnapshot] = None) -> None:
+        if number_of_workers < 1:
+            raise ValueError("There must be at least one worker")
+        self.genetic_algorithm: GeneticAlgorithm = GeneticAlgorithm(seed)
+        self.checkpoint_writer: CheckpointWriter = CheckpointWriter()
+        self.fitness_history: dict[int, list[float]] = {}
+        if snapshot is not None:
+            if len(snapshot.genomes) < number_of_genomes:
+                raise ValueError(f"The snapshot has {len(snapshot.genomes)} genomes, "
+                                 f"but the population has {number_of_genomes}")
+            snapshot.restore(self.genetic_algorithm)
+            self.fitness_history = dict(snapshot.fitness_history)
+
+        self._genome_length: int = NeuralNetwork(NEURAL_NET_LAYER_SIZES).get_total_params()
+        shape = (number_of_genomes, self._genome_length)
+        self._shared_memory = SharedMemory(create=True, size=int(np.prod(shape)) * np.dtype(np.float64).itemsize)
+        self.genomes: np.ndarray = np.ndarray(shape, dtype=np.float64, buffer=self._shared_memory.buf)
+        if snapshot is not None:
+            self.genomes[:] = snapshot.genomes[:number_of_genomes]
+        else:
+            self.genomes[:] = np.stack([NeuralNetwork(NEURAL_NET_LAYER_SIZES).get_parameters()
+                                        for _ in range(number_of_genomes)])
+
+        # Never more workers than genomes, every shard must have at least one car
+        number_of_workers = min(number_of_workers, number_of_genomes)
+        bounds = np.linspace(0, number_of_genomes, number_of_workers + 1).astype(int)
+        self._shards: list[tuple[int, int]] = list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+        # The workers are spawned, not forked, so they don't inherit the threads of this process (the thread pool of
+        # the compiled kernels or the background writers), which are not safe to use after a fork
+        self._pool = multiprocessing.get_context("spawn").Pool(
+            number_of_workers, initializer=_initialize_worker,
+            initargs=(map_name, self._shared_memory.name, shape, delta_time))
+
+    def evaluate(self) -> np.ndarray:
+        """
+        Simulate one generation of the current genomes in the workers
+        :return: The fitness score of each genome
+        """
+        return np.concatenate(self._pool.starmap(_evaluate_shard, self._shards))
+
+    def run(self, generations: int) -> None:
+        """
+        Evaluate and evolve the population the given number of generations
+        :param generations: The number of generations to train
+        :return: None
+        """
+        for _ in range(generations):
+            fitness_scores = self.evaluate()
+            self._save_generation(fitness_scores)
+            self.genomes[:] = self.genetic_algorithm.evolve_genomes(self.genomes, fitness_scores)
+            self.checkpoint_writer.save_snapshot(TrainingSnapshot.capture(self.genomes, self.genetic_algorithm,
+                                                                          self.fitness_history))
+            print(f"Reached generation {self.genetic_algorithm.current_generation}, "
+                  f"top fitness: {self.genetic_algorithm.top_fitness}")
+
+    def _save_generation(self, fitness_scores: np.ndarray) -> None:
+        """
+        Save the fitness scores of the generation and the parameters of its best genome, as the AI manager does
+        :param fitness_scores: The fitness score of each genome
+        :return: None
+        """
+        self.fitness_history[self.genetic_algorithm.current_generation] = fitness_scores.tolist()
+        top_index = int(np.argmax(fitness_scores))
+        self.genetic_algorithm.top_fitness = float(fitness_scores[top_index])
+        self.genetic_algorithm.top_parameters = self.genomes[top_index].copy()
+        self.checkpoint_writer.save_generation(self.genetic_algorithm.current_generation, fitness_scores,
+                                               self.genetic_algorithm.top_parameters,
+                                               self.genetic_algorithm.top_fitness)
+
+    def close(self) -> None:
+        """
+        Stop the workers and release the shared memory
+        :return: None
+        """
+        self._pool.close()
+        self._pool.join()
+        self.checkpoint_writer.close()
+        self._shared_memory.close()
+        self._shared_memory.unlink()
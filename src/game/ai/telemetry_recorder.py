@@ -0,0 +1,121 @@
+"""
+This module contains the TelemetryRecorder class and the functions to load the recorded telemetry
+"""
+import glob
+import os
+from typing import Iterator, Optional
+
+import numpy as np
+
+from src.engine.managers.resource_manager.atomic_file_writer import AtomicFileWriter
+from src.engine.managers.resource_manager.background_writer import BackgroundWriter
+
+TELEMETRY_DIRECTORY = 'assets/data_files/results/telemetry'
+# Fixed width record of the fitness of a car at a given simulation time
+TELEMETRY_RECORD = np.dtype([('generation', np.int32), ('car_id', np.int32),
+                             ('time', np.float64), ('fitness', np.float64)])
+TELEMETRY_CHUNK_SIZE = 65536
+
+
+class TelemetryRecorder:
+    """
+    This class records the fitness of the cars through time in fixed width records.
+    The records are stored in a preallocated chunk, and when the chunk is full it is written to the disk as a .npy file
+    by a background writer, so the memory used stays the same and the game loop never waits for the disk.
+
+    The chunk files are only appended, numbered in the order they are written. The previous recording in the
+    directory is removed the first time a chunk is written.
+    """
+    def __init__(self, directory: str = TELEMETRY_DIRECTORY, chunk_size: int = TELEMETRY_CHUNK_SIZE,
+                 background_writer: Optional[BackgroundWriter] = None):
+        self.directory: str = directory
+        self._chunk: np.ndarray = np.empty(chunk_size, dtype=TELEMETRY_RECORD)
+        self._size: int = 0
+        self._next_chunk_number: int = 0
+        self._background_writer: Optional[BackgroundWriter] = background_writer
+
+    def record(self, generation: int, car_id: int, time: float, fitness: float) -> None:
+        """
+        Add a record, writing the chunk if it is full
+        :param generation: The generation of the car
+        :param car_id: The entity id of the car
+        :param time: The elapsed time of the simulation
+        :param fitness: The fitness score of the car
+        :return: None
+        """
+        self._chunk[self._size] = (generation, car_id, time, fitness)
+        self._size += 1
+        if self._size == len(self._chunk):
+            self._write_chunk()
+
+    def flush(self) -> None:
+        """
+        Write the records that are not written yet, without waiting for the disk
+        :return: None
+        """
+        if self._size > 0:
+            self._write_chunk()
+
+    def close(self) -> None:
+        """
+        Write all the records and wait until they are on the disk
+        :return: None
+        """
+        self.flush()
+        if self._background_writer is not None:
+            self._background_writer.close()
+            self._background_writer = None
+
+    def _write_chunk(self) -> None:
+        """
+        Queue the write of the filled part of the chunk and start a new one
+        :return: None
+        """
+        if self._background_writer is None:
+            self._background_writer = BackgroundWriter()
+        if self._next_chunk_number == 0:
+            self._background_writer.submit(self._clear_directory, self.directory)
+        path = os.path.join(self.directory, f"chunk_{self._next_chunk_number:06d}.npy")
+        # The full chunk is handed to the writer and a new one is allocated, so it is never copied
+        records = self._chunk if self._size == len(self._chunk) else self._chunk[:self._size].copy()
+        self._background_writer.submit(AtomicFileWriter.save_npy, path, records)
+        if records is self._chunk:
+            self._chunk = np.empty(len(records), dtype=TELEMETRY_RECORD)
+        self._size = 0
+        self._next_chunk_number += 1
+
+    @staticmethod
+    def _clear_directory(directory: str) -> None:
+        """
+        Create the directory of the recording, removing the chunks of a previous recording
+        :param directory: The directory of the recording
+        :return: None
+        """
+        os.makedirs(directory, exist_ok=True)
+        for path in glob.glob(os.path.join(directory, "chunk_*.npy")):
+            os.remove(path)
+
+
+def iter_telemetry_chunks(directory: str = TELEMETRY_DIRECTORY) -> Iterator[np.ndarray]:
+    """
+    Iterate the recorded chunks in the order they were written
+    The chunks are memory mapped, so they are only read from the disk when they are used
+    :param directory: The directory of the recording
+    :return: An iterator of structured arrays of TELEMETRY_RECORD
+    """
+    for path in sorted(glob.glob(os.path.join(directory, "chunk_*.npy"))):
+        yield np.load(path, mmap_mode='r')
+
+
+def load_telemetry(directory: str = TELEMETRY_DIRECTORY, car_id: Optional[int] = None) -> np.ndarray:
+    """
+    Load the recorded telemetry
+    :param directory: The directory of the recording
+    :param car_id: The entity id of the car to load, or None to load every car
+    :return: A structured array of TELEMETRY_RECORD
+    """
+    chunks = [chunk if car_id is None else chunk[chunk['car_id'] == car_id]
+              for chunk in iter_telemetry_chunks(directory)]
+    if len(chunks) == 0:
+        return np.empty(0, dtype=TELEMETRY_RECORD)
+    return np.concatenate(chunks)
@@ -0,0 +1,79 @@
+"""
+This module contains the TrainingSnapshot class
+"""
+import json
+import os
+
+import numpy as np
+
+from src.engine.ai.genetic_algorithm.genetic_algorithm import GeneticAlgorithm
+from src.engine.managers.resource_manager.atomic_file_writer import AtomicFileWriter
+
+SNAPSHOT_FILE_NAME = 'snapshot.npz'
+SNAPSHOT_PATH = 'assets/data_files/models/training/' + SNAPSHOT_FILE_NAME
+
+
+class TrainingSnapshot:
+    """
+    This class holds everything needed to resume a training session: the genomes of the whole population stacked in
+    one array, the state of the genetic algorithm (generation, mutation parameters and random generator) and the
+    fitness scores of every past generation.
+
+    It is saved as a .npz file with the genomes and a JSON string with the rest of the state, written atomically so a
+    session stopped while saving can always resume from the previous snapshot.
+    """
+    def __init__(self, genomes: np.ndarray, genetic_algorithm_state: dict, fitness_history: dict[int, list[float]]):
+        self.genomes: np.ndarray = genomes
+        self.genetic_algorithm_state: dict = genetic_algorithm_state
+        self.fitness_history: dict[int, list[float]] = fitness_history
+
+    @staticmethod
+    def capture(genomes: np.ndarray, genetic_algorithm: GeneticAlgorithm,
+                fitness_history: dict[int, list[float]]) -> 'TrainingSnapshot':
+        """
+        Create a snapshot of the current state of a training session
+        The values are copied, so the snapshot doesn't change when the training goes on
+        :param genomes: genomes of the population, one per row
+        :param genetic_algorithm: genetic algorithm of the training
+        :param fitness_history: fitness scores of each past generation
+        :return: The snapshot
+        """
+        return TrainingSnapshot(np.array(genomes, dtype=np.float64, copy=True),
+                                json.loads(json.dumps(genetic_algorithm.get_state())),
+                                {generation: [float(score) for score in scores]
+                                 for generation, scores in fitness_history.items()})
+
+    def save(self, path: str = SNAPSHOT_PATH) -> None:
+        """
+        Save the snapshot atomically
+        :param path: The path of the .npz file
+        :return: None
+        """
+        state = json.dumps({"genetic_algorithm": self.genetic_algorithm_state,
+                            "fitness_history": self.fitness_history})
+        AtomicFileWriter.write(path, lambda file: np.savez(file, genomes=self.genomes, state=np.array(state)),
+                               binary=True)
+
+    @staticmethod
+    def load(path: str = SNAPSHOT_PATH) -> 'TrainingSnapshot':
+        """
+        Load a snapshot
+        :param path: The path of the .npz file
+        :return: The snapshot
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"There is no training snapshot at {path}")
+        with np.load(path) as data:
+            genomes = data["genomes"]
+            state = json.loads(str(data["state"]))
+        # JSON keys are always strings
+        fitness_history = {int(generation): scores for generation, scores in state["fitness_history"].items()}
+        return TrainingSnapshot(genomes, state["genetic_algorithm"], fitness_history)
+
+    def restore(self, genetic_algorithm: GeneticAlgorithm) -> None:
+        """
+        Restore the state of the genetic algorithm of the snapshot
+        :param genetic_algorithm: The genetic algorithm to restore
+        :return: None
+        """
+        genetic_algorithm.set_state(self.genetic_algorithm_state)
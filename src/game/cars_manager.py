@@ -1,19 +1,23 @@
 """
 This module contains the CarsManager class
 """
+from typing import Optional
+
 import numpy as np
 import pygame
 from pygame import Vector2
 
 from src.engine.components.collider import Collider
 from src.engine.components.transform import Transform
+from src.engine.managers.collider_manager.collision_layers import CollisionLayer
 from src.engine.managers.entity_manager.entity_manager import EntityManager
 from src.engine.managers.render_manager.renderer import DebugRenderer, Renderer
 from src.game.ai.ai_info.chronometer import Chronometer
+from src.game.ai.ai_info.sim_clock import SimClock
 from src.game.ai.ai_manager import AIManager
 from src.game.entities.car import Car
 from src.game.entities.tile import Tile
-from src.game.map.map_types import MapType
+from src.game.map.map_types import MapType, value_to_map_type
 from src.game.map.tile_map import TileMap
 
 
@@ -25,8 +29,7 @@ class CarsManager:
     """
     def __init__(self, tile_map: TileMap, entity_manager: EntityManager, renderer: Renderer,
                  debug_renderer: DebugRenderer,
-                 checkpoints_distances: list[float],
-                 chronometer: Chronometer = None):
+                 chronometer: Chronometer = None, clock: SimClock = None):
         self._ai_manager = None
         self._renderer = renderer
         self._debug_renderer = debug_renderer
@@ -34,9 +37,8 @@ class CarsManager:
         self._entity_manager = entity_manager
         self._cars: [Car] = []
         self._chronometer = chronometer
-        self._generation_chronometer = Chronometer()
-
-        self.checkpoints_distances = checkpoints_distances
+        # Clock of the simulation, the times of the cars are measured with it
+        self._clock = clock
 
         self._number_of_cars = 1
 
@@ -60,6 +62,7 @@ class CarsManager:
         :return: None
         """
         self._ai_manager = ai_manager
+        ai_manager.tile_map = self._tile_map
 
     def get_cars(self) -> list[Car]:
         """
@@ -98,14 +101,12 @@ class CarsManager:
         Initialize the car entities and the AI for each car
         :return: None
         """
-        self._generation_chronometer.reset()
-        self._generation_chronometer.start()
         tile_id = self._tile_map.tiles[self._initial_car_position].entity_ID
         start_tile = self._entity_manager.get_transform(tile_id).get_position()
         car: Car
         print("NEW INITIALIZATION")
         for car in self._cars:
-            car.reset()
+            car.reset(self._clock)
             self._entity_manager.get_transform(car.entity_ID).debug_config_show_transform()
             first_checkpoint_position = self._tile_map.get_next_checkpoint_position(0)
             car.car_knowledge.initialize(first_checkpoint_position)
@@ -114,18 +115,27 @@ class CarsManager:
             car_physics = self._entity_manager.get_physics(car.entity_ID)
             car_collider.set_active(True)
             car_physics.set_static(False)
-            # Add all the cars to non-collideable colliders
-            # So while its training, they don't collide with each other
-            for other_car in self._cars:
-                other_car_collider: Collider = self._entity_manager.get_collider(other_car.entity_ID)
-                if car_collider is not other_car_collider:
-                    car_collider.add_non_collideable_collider(other_car_collider)
+            # The cars don't collide with each other, so while its training they don't block each other
+            car_collider.set_collision_layer(CollisionLayer.CARS, CollisionLayer.ALL & ~CollisionLayer.CARS)
+
+    def get_car_positions(self) -> np.ndarray:
+        """
+        Get the positions of all the cars at once, to query the tile map for all of them in one call
+        :return: The positions of the cars, with shape (number of cars, 2)
+        """
+        positions = np.empty((len(self._cars), 2), dtype=np.float64)
+        for i, car in enumerate(self._cars):
+            position = self._entity_manager.get_transform(car.entity_ID).get_position()
+            positions[i, 0] = position.x
+            positions[i, 1] = position.y
+        return positions
 
-    def handle_ai_knowledge(self, car: Car, tile_of_car: Tile) -> None:
+    def handle_ai_knowledge(self, car: Car, tile_type: MapType, checkpoint: Optional[int] = None) -> None:
         """
         This method updates the FOV of the car, the checkpoint reached and the car knowledge
         :param car: The car entity
-        :param tile_of_car: The tile where the car is
+        :param tile_type: The type of the tile where the car is
+        :param checkpoint: The checkpoint number of the tile where the car is, looked up in the tile map if None
         :return: None
         """
         car_knowledge = car.car_knowledge
@@ -136,7 +146,8 @@ class CarsManager:
 
         fov.update(car_transform, self._tile_map)
 
-        checkpoint = self._tile_map.get_tile_at_pos_vec(car_transform.get_position()).checkpoint_number
+        if checkpoint is None:
+            checkpoint = self._tile_map.checkpoint_at(car_transform.get_position())
 
         total_checkpoints = len(self._tile_map.checkpoints)
         car_knowledge.reach_checkpoint(checkpoint, total_checkpoints)
@@ -145,23 +156,27 @@ class CarsManager:
         car_velocity = self._entity_manager.get_physics(car_entity_id).get_velocity()
 
         collider = self._entity_manager.get_collider(car_entity_id)
-        car_knowledge.update(tile_of_car.tile_type, next_checkpoint_position, car_velocity, collider,
-                             car_transform.get_position(), self._chronometer, self.checkpoints_distances)
+        car_knowledge.update(tile_type, next_checkpoint_position, car_velocity, collider,
+                             car_transform.get_position(), self._chronometer,
+                             self._tile_map.cumulative_checkpoint_distances)
 
-    def handle_ai_training(self, car: Car, tile_of_car: Tile):
+    def handle_ai_training(self, car: Car, tile_type: MapType, delta_time: float):
         """
         This method handles the training of the AI
         This will check for states where the car should be disabled and update the AI knowledge
         also will update the physics of the car to disable it completely from moving or colliding
+        A car is stalled when it hasn't gone further than its best traveled distance for a while, so the cars that
+        turn around or drive in circles are disabled too
         :param car: The car entity
-        :param tile_of_car: The tile where the car is
+        :param tile_type: The type of the tile where the car is
+        :param delta_time: Delta time for the update
         :return: None
         """
         car_entity_id = car.entity_ID
         car_physics = self._entity_manager.get_physics(car_entity_id)
         car_collider = self._entity_manager.get_collider(car_entity_id)
-        if car_collider.is_colliding() or tile_of_car.tile_type == MapType.SIDEWALK\
-                or (self._generation_chronometer.get_elapsed_time() > 1 and abs(car_physics.get_velocity()) < 7):
+        car.car_knowledge.update_progress(delta_time)
+        if car_collider.is_colliding() or tile_type == MapType.SIDEWALK or car.car_knowledge.is_stalled():
             car.disable()
             car_physics.set_velocity(0)
             car_physics.set_acceleration(0)
@@ -170,6 +185,42 @@ class CarsManager:
             car_collider.set_active(False)
             self._entity_manager.get_physics(car_entity_id).set_vector_velocity(Vector2(0, 0))
 
+    def update_training_cars(self, delta_time: float) -> None:
+        """
+        This updates all the cars while training the AI
+        The tile type and checkpoint of all the cars are looked up in the tile map at once, then the AI knowledge and
+        training of each enabled car are handled and the cars are updated with their input
+        :param delta_time: Delta time for the update
+        :return: None
+        """
+        positions = self.get_car_positions()
+        tile_types = self._tile_map.types_at(positions)
+        checkpoints = self._tile_map.checkpoints_at(positions)
+        for car, tile_type_value, checkpoint in zip(self._cars, tile_types, checkpoints):
+            # The disabled cars don't move anymore and their fitness score is kept, there is nothing to update
+            if car.is_disabled():
+                continue
+            tile_type = value_to_map_type(int(tile_type_value))
+
+            self.handle_ai_knowledge(car, tile_type, int(checkpoint))
+
+            self.handle_ai_training(car, tile_type, delta_time)
+
+            car.update_input()
+            car.update(delta_time)
+
+    def slow_down_cars_off_road(self) -> None:
+        """
+        This reduces the velocity of the cars in the sidewalk and grass
+        :return: None
+        """
+        tile_types = self._tile_map.types_at(self.get_car_positions())
+        off_road = (tile_types == MapType.SIDEWALK.value) | (tile_types == MapType.GRASS.value)
+        for car, is_off_road in zip(self._cars, off_road):
+            if is_off_road:
+                car_physics = self._entity_manager.get_physics(car.entity_ID)
+                car_physics.set_velocity(car_physics.get_velocity() * 0.9)
+
     def handle_car_out_of_bounds(self, car: Car, tile_of_car: Tile):
         """
         This method handles the case where the car is out of bounds
@@ -201,7 +252,9 @@ class CarsManager:
             center = Vector2(200, 200)
             i = 0
             color = colors[0]
-            for vector in self._tile_map.positions:
+            # Positions of the tiles relative to the center of the field of view, as seen by the car
+            positions = car.car_knowledge.field_of_view.get_positions()
+            for vector in positions:
                 # Every 12 tiles change color
                 if i % 12 == 0:
                     color = colors[i // 12]
@@ -210,7 +263,7 @@ class CarsManager:
                 self._renderer.draw_text_absolute(f"{i}", pos, (255, 255, 255), 10)
                 i += 1
             center = Vector2(200, 500)
-            for tile, vector in zip(car.car_knowledge.field_of_view.get(), self._tile_map.positions):
+            for tile, vector in zip(car.car_knowledge.field_of_view.get(), positions):
                 if tile is not None:
                     pos = Vector2(center[0] + vector[0], center[1] - vector[1])
                     if tile.tile_type == MapType.TRACK:
@@ -8,6 +8,7 @@ from src.engine.managers.input_manager.input_manager import InputManager
 from src.engine.managers.input_manager.key import Key
 from src.engine.managers.render_manager.render_layers import RenderLayer
 from src.game.ai.ai_info.car_knowledge import CarKnowledge
+from src.game.ai.ai_info.sim_clock import SimClock
 
 
 class Car:
@@ -127,11 +128,12 @@ class Car:
         """
         return self._is_accelerating
 
-    def reset(self) -> None:
+    def reset(self, clock: SimClock = None) -> None:
         """
         Reset the car attributes
+        :param clock: clock of the simulation, to measure the times of the car knowledge in simulated time
         """
-        self.car_knowledge = CarKnowledge()
+        self.car_knowledge = CarKnowledge(clock=clock)
         self.fitness_score = 0
         self.current_rotation_speed = 0
         self._is_accelerating = False
@@ -9,6 +9,7 @@ from src.engine.managers.input_manager.input_manager import InputManager
 from src.engine.managers.input_manager.key import Key
 from src.engine.managers.render_manager.renderer import DebugRenderer
 from src.game.ai.ai_info.chronometer import Chronometer
+from src.game.ai.ai_info.sim_clock import SimClock
 
 from src.game.cars_manager import CarsManager
 from src.game.game_state.exit_state import ExitState
@@ -22,6 +23,7 @@ from src.game.game_state.races.training_state import TrainingState
 
 from src.game.game_state.races.watching_ai_state import WatchingAIState
 from src.game.map.tile_map import TileMap
+from src.game.resource_manager.map_cache import MapCache
 
 
 class Game(Engine):
@@ -36,11 +38,13 @@ class Game(Engine):
     playing state, player vs AI state, training state, watching AI state, or exit state.
     """
 
-    def __init__(self, chronometer) -> None:
+    def __init__(self, chronometer, clock: SimClock = None) -> None:
         super().__init__()
 
         # self.play_music("GameMusic")
 
+        # The clock of the simulation is advanced with the delta time of every frame, the chronometer should use it
+        self._clock = clock if clock is not None else SimClock()
         self._chronometer = chronometer
         self._input_manager = InputManager()
         self._tile_map = None
@@ -57,6 +61,7 @@ class Game(Engine):
             StateEnum.PLAYING: PlayingState(self, StateEnum.PLAYING),
             StateEnum.PLAYER_VS_AI: PlayerVsAIState(self, StateEnum.PLAYER_VS_AI),
             StateEnum.TRAINING: TrainingState(self, StateEnum.TRAINING),
+            StateEnum.RESUMING_TRAINING: TrainingState(self, StateEnum.RESUMING_TRAINING, resume=True),
             StateEnum.WATCHING_AI: WatchingAIState(self, StateEnum.WATCHING_AI),
             StateEnum.EXIT: ExitState(self, StateEnum.EXIT)
         }
@@ -66,12 +71,14 @@ class Game(Engine):
         self._game_states[StateEnum.MENU].link_to_state(StateEnum.PLAYING)
         self._game_states[StateEnum.MENU].link_to_state(StateEnum.PLAYER_VS_AI)
         self._game_states[StateEnum.MENU].link_to_state(StateEnum.TRAINING)
+        self._game_states[StateEnum.MENU].link_to_state(StateEnum.RESUMING_TRAINING)
         self._game_states[StateEnum.MENU].link_to_state(StateEnum.WATCHING_AI)
         self._game_states[StateEnum.MENU].link_to_state(StateEnum.EXIT)
 
         self._game_states[StateEnum.PLAYING].link_to_state(StateEnum.MENU)
         self._game_states[StateEnum.PLAYER_VS_AI].link_to_state(StateEnum.MENU)
         self._game_states[StateEnum.TRAINING].link_to_state(StateEnum.MENU)
+        self._game_states[StateEnum.RESUMING_TRAINING].link_to_state(StateEnum.MENU)
         self._game_states[StateEnum.WATCHING_AI].link_to_state(StateEnum.MENU)
 
     def get_input_manager(self) -> InputManager:
@@ -119,11 +126,26 @@ class Game(Engine):
         self._tile_map: TileMap = TileMap(self._entity_manager)
         self._tile_map.load_map(self._current_map_name)
         self._cars_manager: CarsManager = CarsManager(self._tile_map, self._entity_manager,
-                                                      self.renderer, self.debug_renderer,
-                                                      self._tile_map.distance_between_checkpoints,
-                                                      self._chronometer)
+                                                      self.renderer, self.debug_renderer, self._chronometer,
+                                                      self._clock)
 
-        self.get_tile_map().generate_tiles()
+        # With a cache of the map, the background and the tile arrays are loaded instead of built from the tiles
+        cached_map = MapCache.load(self._current_map_name)
+        self.get_tile_map().generate_tiles(cached_map.tile_arrays if cached_map is not None else None)
+        if cached_map is not None:
+            self.renderer.set_background_batch(cached_map.background_batch)
+            self.background_batch_created = True
+
+    def _create_background_batch(self) -> None:
+        """
+        Create the background batch from the tiles and save it in the cache of the map
+        :return: None
+        """
+        super()._create_background_batch()
+        try:
+            MapCache.save(self._current_map_name, self.renderer.background_batch, self._tile_map.get_tile_arrays())
+        except OSError as error:
+            print(f"The map {self._current_map_name} could not be cached: {error}")
 
     def _game_reset(self) -> None:
         """
@@ -140,6 +162,7 @@ class Game(Engine):
         :param delta_time: The time passed since the last frame
         :return: None
         """
+        self._clock.advance(delta_time)
         self.get_current_state().update(delta_time)
 
     def _game_render(self) -> None:
@@ -262,6 +285,14 @@ class Game(Engine):
         """
         return self.debug_renderer
 
+    def get_clock(self) -> SimClock:
+        """
+        Get the clock of the simulation
+        This is used by the game states
+        :return: The clock
+        """
+        return self._clock
+
     def get_chronometer(self) -> Chronometer:
         """
         Get the chronometer
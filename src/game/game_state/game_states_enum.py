@@ -13,3 +13,4 @@ class StateEnum:
     TRAINING = 3
     WATCHING_AI = 4
     EXIT = 5
+    RESUMING_TRAINING = 6
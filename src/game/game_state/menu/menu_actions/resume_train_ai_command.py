@@ -0,0 +1,24 @@
+"""
+ResumeTrainAICommand class
+"""
+from src.game.game_state.game_states_enum import StateEnum
+from src.game.game_state.menu.menu_actions.command import Command
+
+
+class ResumeTrainAICommand(Command):
+    """
+    Command to resume the last training from its snapshot
+    """
+    def __init__(self, menu_state, game):
+        self.menu_state = menu_state
+        self.game = game
+
+    def execute(self):
+        """
+        Execute the command
+        Will set the game state to resuming training
+        :return:
+        """
+        print("Resume training button clicked")
+        self.game.set_map_name(self.menu_state.maps_names[self.menu_state.current_map_index])
+        self.game.set_game_state(StateEnum.RESUMING_TRAINING)
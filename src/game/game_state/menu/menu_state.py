@@ -4,10 +4,12 @@ This module contains the MenuState class.
 import pygame
 from overrides import overrides
 
+from src.engine.font_cache import FontCache
 from src.engine.managers.input_manager.key import Mouse
 from src.game.game_state.igame_state import IGameState
 from src.game.game_state.menu.menu_actions.command import Command
 from src.game.game_state.menu.menu_actions.exit_game_command import ExitGameCommand
+from src.game.game_state.menu.menu_actions.resume_train_ai_command import ResumeTrainAICommand
 from src.game.game_state.menu.menu_actions.start_play_command import StartPlayCommand
 from src.game.game_state.menu.menu_actions.start_player_vs_ai_command import StartPlayerVsAICommand
 from src.game.game_state.menu.menu_actions.start_train_ai_command import StartTrainAICommand
@@ -122,7 +124,7 @@ class MenuState(IGameState):
         :return: None
         """
         print("Setting up Menu State")
-        self.font = pygame.font.SysFont("Arial", 48)
+        self.font = FontCache().get_font("Arial", 48)
 
         self.image_rect = pygame.Rect(400, 50, 700, 420)  # 100, 60
         for i in range(len(self.maps_names)):
@@ -147,6 +149,8 @@ class MenuState(IGameState):
                                StartWatchAICommand(self, self._game)),
             self.create_button("Train new AI", (50, 50 + 3 * distance_between_buttons),
                                StartTrainAICommand(self, self._game)),
+            self.create_button("Resume training", (50, 50 + 4 * distance_between_buttons),
+                               ResumeTrainAICommand(self, self._game)),
             self.create_button("<", (self.map_name_position[0] - 150 - 50 / 2,
                                      self.map_name_position[1] - 50 / 2),
                                size=(50, 50), command=SwapMapPreviousCommand(self)),
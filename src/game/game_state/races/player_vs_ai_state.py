@@ -24,7 +24,8 @@ class PlayerVsAIState(RaceState):
         :return:
         """
         super().initialize_race(2)
-        self._game.get_cars_manager().set_ai_manager(AIManager(self._game.get_entity_manager(), training=False))
+        self._game.get_cars_manager().set_ai_manager(AIManager(self._game.get_entity_manager(), training=False,
+                                                               clock=self._game.get_clock()))
 
     @overrides
     def update(self, delta_time):
@@ -43,7 +44,7 @@ class PlayerVsAIState(RaceState):
 
             self._game.get_cars_manager().handle_car_out_of_bounds(car, tile_of_car)
 
-            self._game.get_cars_manager().handle_ai_knowledge(car, tile_of_car)
+            self._game.get_cars_manager().handle_ai_knowledge(car, tile_of_car.tile_type)
 
             car.update_input()
             car.update(delta_time)
@@ -35,7 +35,7 @@ class PlayingState(RaceState):
 
             new_tile_of_car = self._game.get_cars_manager().handle_car_out_of_bounds(car, tile_of_car)
 
-            self._game.get_cars_manager().handle_ai_knowledge(car, new_tile_of_car)
+            self._game.get_cars_manager().handle_ai_knowledge(car, new_tile_of_car.tile_type)
 
             car.update_input()
             car.update(delta_time)
@@ -4,12 +4,9 @@ This module contains the RaceState class
 from overrides import overrides
 from abc import abstractmethod
 
-from src.engine.components.transform import Transform
 from src.engine.managers.input_manager.key import Key
-from src.game.entities.tile import Tile
 from src.game.game_state.game_states_enum import StateEnum
 from src.game.game_state.igame_state import IGameState
-from src.game.map.map_types import MapType
 
 
 class RaceState(IGameState):
@@ -59,13 +56,7 @@ class RaceState(IGameState):
         """
         self._game.move_camera()
         self._handle_go_to_menu_input()
-        for car in self._game.get_cars_manager().get_cars():
-            car_entity_id = car.entity_ID
-            car_physics = self._game.get_entity_manager().get_physics(car_entity_id)
-            car_transform: Transform = self._game.get_entity_manager().get_transform(car.entity_ID)
-            tile_of_car: Tile = self._game.get_tile_map().get_tile_at_pos_vec(car_transform.get_position())
-            if tile_of_car.tile_type == MapType.SIDEWALK or tile_of_car.tile_type == MapType.GRASS:
-                car_physics.set_velocity(car_physics.get_velocity() * 0.9)
+        self._game.get_cars_manager().slow_down_cars_off_road()
 
     @abstractmethod
     def render(self) -> None:
@@ -88,10 +79,13 @@ class RaceState(IGameState):
     @overrides
     def destruct(self) -> None:
         """
-        This will clear the game
+        This will close the AI manager, if any, and clear the game
         Must be inherited by the child class
         :return:
         """
+        ai_manager = self._game.get_cars_manager().get_ai_manager()
+        if ai_manager is not None:
+            ai_manager.close()
         self._game.game_clear()
 
     @abstractmethod
@@ -5,11 +5,10 @@ This module contains the training state of the game
 from overrides import overrides
 from pygame import Vector2
 
-from src.engine.components.transform import Transform
 from src.engine.ai.AI_input_manager import AIInputManager
 from src.game.ai.ai_manager import AIManager, population_size
+from src.game.ai.training_snapshot import TrainingSnapshot
 from src.game.entities.car import Car
-from src.game.entities.tile import Tile
 from src.game.game_state.races.race_state import RaceState
 
 
@@ -17,7 +16,12 @@ class TrainingState(RaceState):
     """
     This is the state of the game of training AI
     In this state many cars will train using neural networks and genetic algorithms
+    If it resumes, the training continues from the last saved snapshot instead of a new population
     """
+    def __init__(self, game, state_enum, resume: bool = False):
+        super().__init__(game, state_enum)
+        self._resume: bool = resume
+
     @overrides
     def initialize(self) -> None:
         """
@@ -25,7 +29,13 @@ class TrainingState(RaceState):
         :return: None
         """
         super().initialize_race(population_size)
-        self._game.get_cars_manager().set_ai_manager(AIManager(self._game.get_entity_manager()))
+        ai_manager = AIManager(self._game.get_entity_manager(), clock=self._game.get_clock())
+        if self._resume:
+            try:
+                ai_manager.resume_from_snapshot(TrainingSnapshot.load())
+            except FileNotFoundError as error:
+                print(f"{error}, starting a new training")
+        self._game.get_cars_manager().set_ai_manager(ai_manager)
         self._game.get_chronometer().start()
 
     @overrides
@@ -92,17 +102,6 @@ class TrainingState(RaceState):
         :return:
         """
         cars = self._game.get_cars_manager().get_cars()
-        i: int
-        car: Car
-        for i, car in enumerate(cars):
-            car_transform: Transform = self._game.get_entity_manager().get_transform(car.entity_ID)
-            tile_of_car: Tile = self._game.get_tile_map().get_tile_at_pos_vec(car_transform.get_position())
-
-            self._game.get_cars_manager().handle_ai_knowledge(car, tile_of_car)
-
-            self._game.get_cars_manager().handle_ai_training(car, tile_of_car)
-
-            car.update_input()
-            car.update(delta_time)
+        self._game.get_cars_manager().update_training_cars(delta_time)
         self._game.get_cars_manager().get_ai_manager().update(cars, self._game.get_input_manager(),
                                                               self._game.get_chronometer())
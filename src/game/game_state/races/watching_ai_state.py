@@ -9,7 +9,6 @@ from src.engine.ai.AI_input_manager import AIInputManager
 from src.game.ai.ai_manager import AIManager
 from src.game.ai.explainability.explainability_manager import ExplainabilityManager
 from src.game.entities.car import Car
-from src.game.entities.tile import Tile
 from src.game.game_state.races.race_state import RaceState
 
 
@@ -25,7 +24,8 @@ class WatchingAIState(RaceState):
         :return: None
         """
         super().initialize_race(1)
-        self._game.get_cars_manager().set_ai_manager(AIManager(self._game.get_entity_manager(), training=False))
+        self._game.get_cars_manager().set_ai_manager(AIManager(self._game.get_entity_manager(), training=False,
+                                                               clock=self._game.get_clock()))
         self._game.set_explainability_manager(ExplainabilityManager(self._game.renderer))
 
     @overrides
@@ -40,9 +40,9 @@ class WatchingAIState(RaceState):
         car: Car
         for i, car in enumerate(cars):
             car_transform: Transform = self._game.get_entity_manager().get_transform(car.entity_ID)
-            tile_of_car: Tile = self._game.get_tile_map().get_tile_at_pos_vec(car_transform.get_position())
+            tile_type = self._game.get_tile_map().type_at(car_transform.get_position())
 
-            self._game.get_cars_manager().handle_ai_knowledge(car, tile_of_car)
+            self._game.get_cars_manager().handle_ai_knowledge(car, tile_type)
 
             car.update_input()
             car.update(delta_time)
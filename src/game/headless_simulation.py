@@ -0,0 +1,114 @@
+"""
+This module contains the HeadlessSimulation class
+"""
+from src.engine.ai.AI_input_manager import AIInputManager
+from src.engine.managers.collider_manager.collider_manager import ColliderManager
+from src.engine.managers.entity_manager.entity_manager import EntityManager
+from src.engine.managers.physics_manager.physics_manager import PhysicsManager
+from src.game.ai.ai_info.chronometer import Chronometer
+from src.game.ai.ai_info.sim_clock import SimClock
+from src.game.cars_manager import CarsManager
+from src.game.entities.car import Car
+from src.game.map.tile_map import TileMap
+
+FIXED_DELTA_TIME = 1 / 30
+
+
+class HeadlessSimulation:
+    """
+    This class simulates the cars on a map without a window, renderer or frame rate cap.
+    It only builds the managers needed by the simulation (tile map, entities, physics, colliders and cars) and steps
+    them with a fixed simulated delta time, so it runs as fast as the CPU allows.
+
+    The cars are driven by AI input managers, whose keys are set by the child classes before the cars are updated.
+    Each step mirrors one frame of the training state inside the engine.
+    """
+    def __init__(self, map_name: str, number_of_cars: int, delta_time: float = FIXED_DELTA_TIME) -> None:
+        self._map_name: str = map_name
+        self._delta_time: float = delta_time
+        self._entity_manager = EntityManager()
+        self._physics_manager = PhysicsManager()
+        self._collider_manager = ColliderManager(self._entity_manager, None)
+        # Every time of the simulation is measured in simulated time, advanced by the fixed delta time every step
+        self._clock = SimClock()
+        self._chronometer = Chronometer(self._clock)
+
+        self._tile_map = TileMap(self._entity_manager)
+        self._tile_map.load_map(map_name)
+        self._cars_manager = CarsManager(self._tile_map, self._entity_manager, None, None, self._chronometer,
+                                         self._clock)
+        self._tile_map.generate_tiles()
+
+        self._cars_manager.set_number_of_cars(number_of_cars)
+        for _ in range(number_of_cars):
+            entity = self._cars_manager.create_car_entity()
+            self._cars_manager.add_car(Car(entity, self._entity_manager, AIInputManager()))
+        self._cars_manager.initialize()
+        self._chronometer.start()
+
+        for entity in self._entity_manager.entities:
+            if self._entity_manager.get_collider(entity).is_active():
+                self._collider_manager.send_data(entity)
+
+        self._steps: int = 0
+
+    def get_cars_manager(self) -> CarsManager:
+        """
+        Get the cars manager
+        :return: The cars manager
+        """
+        return self._cars_manager
+
+    def get_map_name(self) -> str:
+        """
+        Get the name of the simulated map
+        :return: The name of the map
+        """
+        return self._map_name
+
+    def get_delta_time(self) -> float:
+        """
+        Get the simulated seconds advanced every step
+        :return: The delta time
+        """
+        return self._delta_time
+
+    def get_steps(self) -> int:
+        """
+        Get the number of steps simulated
+        :return: The number of steps
+        """
+        return self._steps
+
+    def _update_physics(self) -> None:
+        """
+        Finish a step once the cars are updated: slow down the cars off the road, then update the physics and the
+        colliders, as the engine does every frame
+        :return: None
+        """
+        # Slow down the cars outside the road, as the race states do
+        self._cars_manager.slow_down_cars_off_road()
+
+        # The cars are the only dynamic entities, the tiles never move
+        self._physics_manager.step(self._entity_manager, self._delta_time)
+        for car in self._cars_manager.get_cars():
+            entity = car.entity_ID
+            transform = self._entity_manager.get_transform(entity)
+            # There is no renderer placing the sprite rects, so the collider is placed in world space
+            sprite_rect = self._entity_manager.get_sprite_rect(entity)
+            sprite_rect.center = transform.get_position()
+            self._entity_manager.get_collider(entity).update_rect(sprite_rect)
+        if self._steps > 0:
+            self._collider_manager.update()
+
+        self._steps += 1
+
+    def _reset(self) -> None:
+        """
+        Reset the cars to their initial state, as the engine reset does
+        :return: None
+        """
+        for entity in self._entity_manager.dynamic_entities:
+            if not self._entity_manager.get_physics(entity).is_static():
+                self._entity_manager.reset_entity(entity)
+        self._cars_manager.initialize()
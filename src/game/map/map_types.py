@@ -2,6 +2,7 @@
 This module contains the MapType enum.
 """
 from enum import Enum
+from typing import Optional
 
 
 class MapType(Enum):
@@ -79,3 +80,15 @@ def map_type_to_encoded_value(map_type: MapType) -> float:
         return float(EncodedValue.FOREST.value)
     elif map_type == MapType.SEA:
         return float(EncodedValue.SEA.value)
+
+
+def value_to_map_type(value: int) -> Optional[MapType]:
+    """
+    This function maps the value of a MapType, as stored in the dense arrays of the tile map, back to the MapType
+    :param value: The value of the type of tile
+    :return: The type of tile, or None if the value is not a type of tile (out of the map)
+    """
+    try:
+        return MapType(value)
+    except ValueError:
+        return None
@@ -13,9 +13,8 @@ from src.game.map.checkpoints.checkpoint_direction import CheckpointDirection
 from src.game.map.map_types_list import MapTypeList
 from src.game.resource_manager.checkpoints_loader import CheckpointsLoader
 from src.game.resource_manager.map_loader import MapLoader
-from src.game.map.map_types import MapType, map_type_to_encoded_value
+from src.game.map.map_types import MapType, map_type_to_encoded_value, value_to_map_type
 from src.game.map.map_types import map_type_to_file
-from src.engine.math.geometry import point_in_polygon
 
 TILE_SIZE = 16
 MAP_WALL_DEPTH = 100
@@ -37,13 +36,19 @@ class TileMap:
         self.checkpoints: list[Tile] = []
         self.checkpoint_lines: list[Tile] = []
         self.distance_between_checkpoints = []
+        # Prefix sums of distance_between_checkpoints, to know the distance traveled until any checkpoint
+        self.cumulative_checkpoint_distances: ndarray = np.zeros(0, dtype=np.float64)
 
         self.height = 0
         self.width = 0
 
-        self.positions = []
-        self.tiles_fov = []
-        self.ordered_tiles = []
+        # Dense arrays with the information of each tile, in the same order as the tiles, to query many positions at
+        # once without going through the tile objects
+        self.tile_types: ndarray = np.zeros(0, dtype=np.int8)
+        self.encoded_values: ndarray = np.zeros(0, dtype=np.float32)
+        self.checkpoint_numbers: ndarray = np.zeros(0, dtype=np.int32)
+        self.tile_positions: ndarray = np.zeros((0, 2), dtype=np.float64)
+        self.checkpoint_positions: ndarray = np.zeros((0, 2), dtype=np.float64)
 
     def load_map(self, map_name: str) -> None:
         """
@@ -78,13 +83,20 @@ class TileMap:
         self.checkpoints = []
         self.checkpoint_lines = []
         self.distance_between_checkpoints = []
+        self.cumulative_checkpoint_distances = np.zeros(0, dtype=np.float64)
+        self.tile_types = np.zeros(0, dtype=np.int8)
+        self.encoded_values = np.zeros(0, dtype=np.float32)
+        self.checkpoint_numbers = np.zeros(0, dtype=np.int32)
+        self.tile_positions = np.zeros((0, 2), dtype=np.float64)
+        self.checkpoint_positions = np.zeros((0, 2), dtype=np.float64)
 
-    def generate_tiles(self) -> None:
+    def generate_tiles(self, tile_arrays: Optional[dict[str, ndarray]] = None) -> None:
         """
         This generates all the tiles.
         It iterates over the map of tile types and creates one entity for each one.
         The entities are configured as static and batched for optimization.
         It also sets the checkpoints and the checkpoint lines.
+        :param tile_arrays: The dense arrays of the tiles of this map by name, if they are cached
         :return:
         """
         print("Generating tiles")
@@ -114,7 +126,49 @@ class TileMap:
 
         # order checkpoints
         self.checkpoints = sorted(self.checkpoints, key=lambda x: x.checkpoint_number)
+        self.checkpoint_positions = np.array([self.entity_manager.get_transform(tile.entity_ID).get_position()
+                                              for tile in self.checkpoints], dtype=np.float64).reshape(-1, 2)
         self.process_checkpoints(checkpoints_directions_dict)
+        if tile_arrays is not None:
+            self.set_tile_arrays(tile_arrays)
+        else:
+            self._generate_tile_arrays()
+
+    def get_tile_arrays(self) -> dict[str, ndarray]:
+        """
+        Get the dense arrays of the tiles, to cache them
+        :return: The arrays by name
+        """
+        return {"tile_types": self.tile_types, "encoded_values": self.encoded_values,
+                "checkpoint_numbers": self.checkpoint_numbers, "tile_positions": self.tile_positions}
+
+    def set_tile_arrays(self, tile_arrays: dict[str, ndarray]) -> None:
+        """
+        Set the dense arrays of the tiles from a cache, instead of filling them from the generated tiles
+        :param tile_arrays: The arrays by name, as get_tile_arrays returns them
+        :return: None
+        """
+        if len(tile_arrays["tile_types"]) != len(self.tiles):
+            raise ValueError(f"The cached arrays have {len(tile_arrays['tile_types'])} tiles, but the map has "
+                             f"{len(self.tiles)}")
+        self.tile_types = tile_arrays["tile_types"]
+        self.encoded_values = tile_arrays["encoded_values"]
+        self.checkpoint_numbers = tile_arrays["checkpoint_numbers"]
+        self.tile_positions = tile_arrays["tile_positions"]
+
+    def _generate_tile_arrays(self) -> None:
+        """
+        This fills the dense arrays of the tiles from the generated tiles.
+        Must be called after the checkpoints are processed, as the checkpoint lines change the tiles.
+        :return: None
+        """
+        map_width = self.type_map_list.get_width()
+        indices = np.arange(len(self.tiles))
+        self.tile_types = np.array([tile.tile_type.value for tile in self.tiles], dtype=np.int8)
+        self.encoded_values = np.array([tile.get_encoded_value() for tile in self.tiles], dtype=np.float32)
+        self.checkpoint_numbers = np.array([tile.checkpoint_number for tile in self.tiles], dtype=np.int32)
+        self.tile_positions = np.stack(((indices % map_width) * TILE_SIZE,
+                                        (indices // map_width) * TILE_SIZE), axis=1).astype(np.float64)
 
     def get_tile_at_pos_vec(self, vec2: Vector2) -> Tile:
         """
@@ -153,40 +207,73 @@ class TileMap:
         """
         return x // TILE_SIZE, y // TILE_SIZE
 
-    def get_tiles_within_square(self, position: tuple[float, float], radius: float, vision_box: ndarray,
-                                angle: float) -> tuple[list[Tile], list[float]]:
+    def get_tile_indices_at_positions(self, positions: ndarray) -> ndarray:
         """
-        This method returns a list of times and their encoded values that are within the vision box of the entity.
-        :param position: The position of the entity
-        :param radius: The radius of the vision box
-        :param vision_box: The vision box of the entity
-        :param angle: The angle of the entity
-        :return: A tuple with the list of tiles and their encoded values
+        Get the index in the map of the tiles at many positions at once
+        The positions are converted to tiles as get_tile_index_from_pos_vec does
+        :param positions: The positions, with shape (number of positions, 2)
+        :return: The index of the tile at each position, or -1 if the position is out of bounds
         """
-        tiles: list[Tile] = []
-        radius_doubled = radius * 2
-        tiles_size = round((radius_doubled * radius_doubled)) // TILE_SIZE
-        pos_x, pos_y = position
-        tile_size_half = TILE_SIZE / 2
-
-        polygon_array = np.array(vision_box, dtype=np.float64)
-        for i in range(-tiles_size, tiles_size):
-            offset_x = pos_x + i * TILE_SIZE
-            for j in range(-tiles_size, tiles_size):
-                offset_y = pos_y + j * TILE_SIZE
-                tile = self.get_tile_at_pos(int(offset_x), int(offset_y))
-                if tile is not None:
-                    tile_position = self.entity_manager.get_transform(tile.entity_ID).get_position()
-                    tile_pos = np.array([tile_position.x + tile_size_half, tile_position.y])
-                    if point_in_polygon(tile_pos, polygon_array):
-                        tiles.append(tile)
-
-        tiles_and_codes = self._rotate_tiles(tiles, angle, pos_x, pos_y)
-        tiles = tiles_and_codes[0]
-        codes = tiles_and_codes[1]
-        tiles = tiles[:144]
-        codes = codes[:144]
-        return tiles, codes
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        map_width = self.type_map_list.get_width()
+        map_height = self.type_map_list.get_height()
+        index_x = np.floor(positions[:, 0] / TILE_SIZE).astype(np.int64)
+        index_y = np.floor(positions[:, 1] / TILE_SIZE).astype(np.int64) + 1
+        in_bounds = (index_x >= 0) & (index_x < map_width) & (index_y >= 0) & (index_y < map_height)
+        return np.where(in_bounds, index_y * map_width + index_x, -1)
+
+    @staticmethod
+    def _gather(values: ndarray, tile_indices: ndarray, out_of_bounds_value) -> ndarray:
+        """
+        Get the values of many tiles at once from one of the dense arrays
+        :param values: The dense array with one value per tile
+        :param tile_indices: The index in the map of the tiles, -1 for the positions out of bounds
+        :param out_of_bounds_value: The value for the positions out of bounds
+        :return: The value of each tile
+        """
+        in_bounds = tile_indices >= 0
+        return np.where(in_bounds, values[np.where(in_bounds, tile_indices, 0)],
+                        np.array(out_of_bounds_value, dtype=values.dtype))
+
+    def get_encoded_values(self, tile_indices: ndarray) -> ndarray:
+        """
+        Get the encoded values of many tiles at once
+        :param tile_indices: The index in the map of the tiles, -1 for the positions out of bounds
+        :return: The encoded value of each tile, -1.0 for the positions out of bounds
+        """
+        return self._gather(self.encoded_values, tile_indices, -1.0)
+
+    def types_at(self, positions: ndarray) -> ndarray:
+        """
+        Get the type of the tiles at many positions at once, for example the positions of all the cars
+        :param positions: The positions, with shape (number of positions, 2)
+        :return: The value of the MapType of the tile at each position, or -1 if the position is out of bounds
+        """
+        return self._gather(self.tile_types, self.get_tile_indices_at_positions(positions), -1)
+
+    def checkpoints_at(self, positions: ndarray) -> ndarray:
+        """
+        Get the checkpoint number of the tiles at many positions at once, for example the positions of all the cars
+        :param positions: The positions, with shape (number of positions, 2)
+        :return: The checkpoint number of the tile at each position, -1 if it is not a checkpoint or out of bounds
+        """
+        return self._gather(self.checkpoint_numbers, self.get_tile_indices_at_positions(positions), -1)
+
+    def type_at(self, position: Vector2) -> Optional[MapType]:
+        """
+        Get the type of the tile at a position, without going through the tile objects
+        :param position: The position
+        :return: The type of the tile at the position or None if the position is out of bounds
+        """
+        return value_to_map_type(int(self.types_at((position[0], position[1]))[0]))
+
+    def checkpoint_at(self, position: Vector2) -> int:
+        """
+        Get the checkpoint number of the tile at a position, without going through the tile objects
+        :param position: The position
+        :return: The checkpoint number of the tile, -1 if it is not a checkpoint or out of bounds
+        """
+        return int(self.checkpoints_at((position[0], position[1]))[0])
 
     def get_tiles_of_rect(self, entity_pos: Vector2, rect: Rect) -> list[Tile]:
         """
@@ -252,7 +339,7 @@ class TileMap:
     def process_checkpoints(self, checkpoints_directions_dict: dict[int, CheckpointDirection]) -> None:
         """
         This method processes the checkpoints and sets the checkpoint lines.
-        It calculates the distance between the checkpoints.
+        It calculates the distance between the checkpoints, and the distance from the first checkpoint to each one.
         :param checkpoints_directions_dict: The dictionary of the directions of the checkpoints
         :return: None
         """
@@ -264,6 +351,27 @@ class TileMap:
             distance = Vector2(self.get_next_checkpoint_position(tile.checkpoint_number)).distance_to(
                 self.entity_manager.get_transform(tile.entity_ID).get_position())
             self.distance_between_checkpoints.append(distance)
+        self.cumulative_checkpoint_distances = np.cumsum(self.distance_between_checkpoints, dtype=np.float64)
+
+    def get_checkpoint_jump(self) -> float:
+        """
+        Get the largest gain of the traveled distance of a car when it crosses a checkpoint, besides what it drives.
+        The traveled distance is measured to the position of the next checkpoint, so crossing a checkpoint can add up
+        to twice the distance from the car to the position of the crossed checkpoint, the farthest point of its tiles.
+        :return: The largest gain in pixels, 0 if there are no checkpoints
+        """
+        checkpoint_tiles = np.flatnonzero(self.checkpoint_numbers >= 0)
+        if len(checkpoint_tiles) == 0:
+            return 0.0
+        tile_positions = self.tile_positions[checkpoint_tiles]
+        checkpoint_positions = self.checkpoint_positions[self.checkpoint_numbers[checkpoint_tiles]]
+        # A tile is at the positions from TILE_SIZE above its position to its position, as in
+        # get_tile_indices_at_positions, so the farthest point is one of its corners
+        distance_x = np.maximum(np.abs(tile_positions[:, 0] - checkpoint_positions[:, 0]),
+                                np.abs(tile_positions[:, 0] + TILE_SIZE - checkpoint_positions[:, 0]))
+        distance_y = np.maximum(np.abs(tile_positions[:, 1] - TILE_SIZE - checkpoint_positions[:, 1]),
+                                np.abs(tile_positions[:, 1] - checkpoint_positions[:, 1]))
+        return 2 * float(np.max(np.hypot(distance_x, distance_y)))
 
     def get_tile(self, x, y):
         """
@@ -278,56 +386,6 @@ class TileMap:
             return self.tiles[y * map_width + x]
         return None
 
-    def _rotate_tiles(self, tiles: list[Tile], angle: float, position_x, position_y) -> tuple[list[Tile], list[float]]:
-        """
-        This method rotates the tiles by the angle.
-        This is needed to calculate the field of view of the entity with its rotation.
-        This works by rotating the tile positions and then sorting them by y and x.
-        Will return the ordered tiles and their encoded values.
-        :param tiles: The tiles to rotate
-        :param angle: The angle of the entity
-        :param position_x: The position of the entity
-        :param position_y: The position of the entity
-        :return: A tuple with the ordered tiles and their encoded values
-        """
-        theta = np.radians(angle)
-
-        cos_theta = np.cos(theta)
-        sin_theta = np.sin(theta)
-
-        rotation_matrix = [[cos_theta, sin_theta], [-sin_theta, cos_theta]]
-
-        ordered_tiles = []
-        encoded_values = []
-        position_and_tile_list = []
-
-        self.positions = []
-
-        for tile in tiles:
-            if tile is not None:
-                transform = self.entity_manager.get_transform(tile.entity_ID)
-                tile_pos: Vector2 = transform.get_position()
-                relative_tile_pos = (position_x - tile_pos.x, position_y - tile_pos.y)
-                new_pos = np.dot(rotation_matrix, relative_tile_pos)
-                new_x, new_y = new_pos[0], new_pos[1]
-                rotated_tile_pos = (new_x, new_y)
-                position_and_tile_list.append((rotated_tile_pos, tile))
-
-        # Sort the list by y
-        position_and_tile_list.sort(key=lambda item: item[0][1], reverse=True)
-
-        # Group the list in several sublist of 12 elements
-        grouped_arrays = [position_and_tile_list[i:i + 12] for i in range(0, len(position_and_tile_list), 12)]
-
-        # Sort each sublist by x
-        for sublist in grouped_arrays:
-            sublist.sort(key=lambda item: item[0][0])
-            ordered_tiles.extend([tile for _, tile in sublist])
-            encoded_values.extend([tile.get_encoded_value() for _, tile in sublist])
-            self.positions.extend([pos for pos, _ in sublist])
-
-        return ordered_tiles, encoded_values
-
     def get_next_checkpoint_position(self, checkpoint: int) -> tuple[float, float]:
         """
         This method returns the position of the next checkpoint.
@@ -337,6 +395,5 @@ class TileMap:
         """
         last_checkpoint_index = len(self.checkpoints) - 1
         next_checkpoint_number = 0 if checkpoint == last_checkpoint_index else checkpoint + 1
-        checkpoint_next = self.checkpoints[next_checkpoint_number]
-        tile_transform = self.entity_manager.get_transform(checkpoint_next.entity_ID)
-        return tile_transform.get_position().x, tile_transform.get_position().y
+        checkpoint_next_position = self.checkpoint_positions[next_checkpoint_number]
+        return float(checkpoint_next_position[0]), float(checkpoint_next_position[1])
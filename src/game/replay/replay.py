@@ -0,0 +1,149 @@
+"""
+This module contains the Replay and ReplayRecorder classes
+"""
+import json
+from typing import Optional
+
+import numpy as np
+
+from src.engine.managers.input_manager.key import Key
+from src.engine.managers.resource_manager.atomic_file_writer import AtomicFileWriter
+from src.game.entities.car import Car
+
+REPLAY_DIRECTORY = 'assets/data_files/replays'
+REPLAY_VERSION = 1
+# Keys that drive the cars, the bit i of the mask of a car is set when REPLAY_KEYS[i] is pressed
+REPLAY_KEYS = [Key.K_W, Key.K_S, Key.K_D, Key.K_A, Key.K_SHIFT, Key.K_SPACE]
+
+
+class Replay:
+    """
+    This class holds the recording of a simulation: the keys pressed by every car in every frame, as one byte per car
+    and frame, and the delta time of every frame, with the map, seed and generation needed to simulate it again.
+
+    The final positions and traveled distances of the cars are kept too, so a replay can check that the simulation
+    gives exactly the same result.
+    """
+    def __init__(self, header: dict, masks: np.ndarray, delta_times: np.ndarray, final_positions: np.ndarray,
+                 final_traveled_distances: np.ndarray):
+        self.header: dict = header
+        self.masks: np.ndarray = masks
+        self.delta_times: np.ndarray = delta_times
+        self.final_positions: np.ndarray = final_positions
+        self.final_traveled_distances: np.ndarray = final_traveled_distances
+
+    def get_number_of_frames(self) -> int:
+        """
+        Get the number of recorded frames
+        :return: The number of frames
+        """
+        return len(self.masks)
+
+    def save(self, path: str) -> None:
+        """
+        Save the replay compressed and atomically
+        :param path: The path of the .npz file
+        :return: None
+        """
+        AtomicFileWriter.write(path, lambda file: np.savez_compressed(
+            file, header=np.array(json.dumps(self.header)), masks=self.masks, delta_times=self.delta_times,
+            final_positions=self.final_positions, final_traveled_distances=self.final_traveled_distances),
+                               binary=True)
+
+    @staticmethod
+    def load(path: str) -> 'Replay':
+        """
+        Load a replay
+        :param path: The path of the .npz file
+        :return: The replay
+        """
+        with np.load(path) as data:
+            header = json.loads(str(data["header"]))
+            if header.get("version") != REPLAY_VERSION:
+                raise ValueError(f"Unsupported replay version {header.get('version')} in {path}")
+            return Replay(header, data["masks"], data["delta_times"], data["final_positions"],
+                          data["final_traveled_distances"])
+
+
+class ReplayRecorder:
+    """
+    This class records the keys pressed by the cars every frame to create a replay.
+    The frames are stored in arrays that double their size when they are full, so recording a frame doesn't allocate
+    memory most of the time.
+    """
+    def __init__(self, map_name: str, number_of_cars: int, seed: Optional[int] = None, capacity: int = 1024):
+        self.map_name: str = map_name
+        self.number_of_cars: int = number_of_cars
+        self.seed: Optional[int] = seed
+        self._masks: np.ndarray = np.zeros((capacity, number_of_cars), dtype=np.uint8)
+        self._delta_times: np.ndarray = np.zeros(capacity, dtype=np.float64)
+        self._number_of_frames: int = 0
+        self._header: Optional[dict] = None
+
+    def is_recording(self) -> bool:
+        """
+        Check if a recording is started
+        :return: True if recording, False otherwise
+        """
+        return self._header is not None
+
+    def start(self, generation: int = 0, simulation_step: int = 0) -> None:
+        """
+        Start a new recording, discarding the frames of the previous one
+        :param generation: The generation that is recorded
+        :param simulation_step: The number of steps simulated before the recording, needed to simulate it again
+        :return: None
+        """
+        self._number_of_frames = 0
+        self._header = {"version": REPLAY_VERSION, "map_name": self.map_name, "seed": self.seed,
+                        "generation": generation, "number_of_cars": self.number_of_cars,
+                        "simulation_step": simulation_step, "keys": [key.name for key in REPLAY_KEYS]}
+
+    def record_frame(self, delta_time: float, cars: list[Car]) -> None:
+        """
+        Record the keys pressed by the cars in a frame
+        Must be called before the cars are updated with their input
+        :param delta_time: The delta time of the frame
+        :param cars: The recorded cars
+        :return: None
+        """
+        if self._number_of_frames == len(self._masks):
+            self._masks = np.concatenate((self._masks, np.zeros_like(self._masks)))
+            self._delta_times = np.concatenate((self._delta_times, np.zeros_like(self._delta_times)))
+        frame = self._masks[self._number_of_frames]
+        for i, car in enumerate(cars):
+            mask = 0
+            for bit, key in enumerate(REPLAY_KEYS):
+                if car.input_manager.is_key_down(key):
+                    mask |= 1 << bit
+            frame[i] = mask
+        self._delta_times[self._number_of_frames] = delta_time
+        self._number_of_frames += 1
+
+    def finish(self, final_positions: np.ndarray, final_traveled_distances: np.ndarray) -> Replay:
+        """
+        Finish the recording
+        :param final_positions: The positions of the cars at the end, with shape (number of cars, 2)
+        :param final_traveled_distances: The traveled distance of each car at the end
+        :return: The replay of the recording
+        """
+        if self._header is None:
+            raise RuntimeError("The recording was not started")
+        replay = Replay(self._header, self._masks[:self._number_of_frames].copy(),
+                        self._delta_times[:self._number_of_frames].copy(),
+                        np.array(final_positions, dtype=np.float64),
+                        np.array(final_traveled_distances, dtype=np.float64))
+        self._header = None
+        return replay
+
+
+def apply_mask(car: Car, mask: int) -> None:
+    """
+    Press the keys of a recorded mask in the AI input manager of a car
+    :param car: The car driven by the replay
+    :param mask: The recorded mask of the keys
+    :return: None
+    """
+    key_states = car.input_manager.key_states
+    for bit, key in enumerate(REPLAY_KEYS):
+        key_states[key.value] = bool(mask & (1 << bit))
@@ -0,0 +1,63 @@
+"""
+This module contains the ReplayPlayer class
+"""
+import numpy as np
+
+from src.game.headless_simulation import HeadlessSimulation
+from src.game.replay.replay import Replay, apply_mask
+
+
+class ReplayPlayer(HeadlessSimulation):
+    """
+    This class simulates a replay again without a window, as fast as the CPU allows.
+    The cars are driven by the recorded keys instead of the AI, with the same rules of the training, so the cars end
+    exactly where they ended when they were recorded.
+    """
+    def __init__(self, replay: Replay) -> None:
+        header = replay.header
+        super().__init__(header["map_name"], header["number_of_cars"])
+        self.replay: Replay = replay
+        # The colliders are not updated in the first step of a simulation, the replay must start in the same step
+        self._steps = header["simulation_step"]
+        self._frame: int = 0
+
+    def is_finished(self) -> bool:
+        """
+        Check if all the frames of the replay are simulated
+        :return: True if finished, False otherwise
+        """
+        return self._frame >= self.replay.get_number_of_frames()
+
+    def step(self) -> None:
+        """
+        Simulate the next frame of the replay
+        :return: None
+        """
+        delta_time = float(self.replay.delta_times[self._frame])
+        self._delta_time = delta_time
+        self._clock.advance(delta_time)
+        cars = self._cars_manager.get_cars()
+        for car, mask in zip(cars, self.replay.masks[self._frame]):
+            apply_mask(car, int(mask))
+        self._cars_manager.update_training_cars(delta_time)
+        self._update_physics()
+        self._frame += 1
+
+    def run(self) -> bool:
+        """
+        Simulate all the frames of the replay
+        :return: True if the cars end exactly as recorded, False otherwise
+        """
+        while not self.is_finished():
+            self.step()
+        return self.matches_recording()
+
+    def matches_recording(self) -> bool:
+        """
+        Check if the cars are exactly where they were at the end of the recording
+        :return: True if all the positions and traveled distances are equal, False otherwise
+        """
+        cars = self._cars_manager.get_cars()
+        traveled_distances = np.array([car.car_knowledge.traveled_distance for car in cars], dtype=np.float64)
+        return (np.array_equal(self._cars_manager.get_car_positions(), self.replay.final_positions)
+                and np.array_equal(traveled_distances, self.replay.final_traveled_distances))
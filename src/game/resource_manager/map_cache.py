@@ -0,0 +1,112 @@
+"""
+This module is used to cache the background and the tile arrays of the maps on the disk
+"""
+import glob
+import hashlib
+import os
+from typing import Optional
+
+import numpy as np
+import pygame
+
+from src.engine.managers.render_manager.background_batch import BackgroundBatch
+from src.engine.managers.resource_manager.atomic_file_writer import AtomicFileWriter
+from src.engine.managers.resource_manager.sprite_loader import GLOBAL_SPRITE_PATH, SPRITE_EXTENSION
+from src.game.resource_manager.checkpoints_loader import GLOBAL_CHECKPOINTS_PATH, CHECKPOINTS_EXTENSION
+from src.game.resource_manager.map_loader import GLOBAL_MAP_PATH, MAP_EXTENSION
+
+CACHE_DIRECTORY = "assets/cache/"
+# Must be increased when the format of the cache or the way the maps are built changes
+CACHE_VERSION = 1
+# Dense arrays of the tile map that are cached
+TILE_ARRAYS = ["tile_types", "encoded_values", "checkpoint_numbers", "tile_positions"]
+
+
+class CachedMap:
+    """
+    The cached background of a map and the dense arrays of its tiles
+    """
+    def __init__(self, background_batch: BackgroundBatch, tile_arrays: dict[str, np.ndarray]):
+        self.background_batch: BackgroundBatch = background_batch
+        self.tile_arrays: dict[str, np.ndarray] = tile_arrays
+
+
+class MapCache:
+    """
+    Building a map composes the sprites of thousands of tiles into the background, so the composed background is saved
+    as raw RGBA pixels together with the dense arrays of the tiles in a .npz file, and loaded the next times the map
+    is built.
+
+    The files are named after a hash of the map, its checkpoints and the sprites of the tiles, so a cache is never
+    used after any of them changes.
+    """
+    @staticmethod
+    def get_key(map_name: str) -> str:
+        """
+        Get the key of the cache of a map
+        :param map_name: The name of the map
+        :return: The hash of the content of the files the map is built from
+        """
+        paths = [GLOBAL_MAP_PATH + map_name + MAP_EXTENSION, GLOBAL_CHECKPOINTS_PATH + map_name + CHECKPOINTS_EXTENSION]
+        paths += sorted(glob.glob(GLOBAL_SPRITE_PATH + "tiles/*" + SPRITE_EXTENSION))
+        digest = hashlib.sha256(str(CACHE_VERSION).encode())
+        for path in paths:
+            with open(path, "rb") as file:
+                digest.update(file.read())
+        return digest.hexdigest()[:16]
+
+    @staticmethod
+    def _get_path(map_name: str, key: str) -> str:
+        """
+        Get the path of the cache files of a map, without extension
+        :param map_name: The name of the map
+        :param key: The key of the cache
+        :return: The path of the cache files
+        """
+        return CACHE_DIRECTORY + map_name + "_" + key
+
+    @staticmethod
+    def load(map_name: str) -> Optional[CachedMap]:
+        """
+        Load the cache of a map
+        :param map_name: The name of the map
+        :return: The cached map, None if there is no cache of the current content of the map
+        """
+        path = MapCache._get_path(map_name, MapCache.get_key(map_name))
+        if not os.path.exists(path + ".npz") or not os.path.exists(path + ".rgba"):
+            return None
+        with np.load(path + ".npz") as data:
+            tile_arrays = {name: data[name] for name in TILE_ARRAYS}
+            width, height, entity_width, entity_height = (int(value) for value in data["background_size"])
+            offset_x, offset_y = (float(value) for value in data["background_offset"])
+        with open(path + ".rgba", "rb") as file:
+            pixels = file.read()
+        if len(pixels) != width * height * 4:
+            return None
+        surface = pygame.image.frombytes(pixels, (width, height), "RGBA")
+        background_batch = BackgroundBatch.from_surface(surface, entity_width, entity_height, offset_x, offset_y)
+        return CachedMap(background_batch, tile_arrays)
+
+    @staticmethod
+    def save(map_name: str, background_batch: BackgroundBatch, tile_arrays: dict[str, np.ndarray]) -> None:
+        """
+        Save the cache of a map
+        The pixels are written before the arrays, so a cache is only complete once its .npz file exists
+        :param map_name: The name of the map
+        :param background_batch: The background of the map
+        :param tile_arrays: The dense arrays of the tiles of the map, by name
+        :return: None
+        """
+        path = MapCache._get_path(map_name, MapCache.get_key(map_name))
+        # The caches of the previous versions of the map are not used anymore
+        for old_path in glob.glob(MapCache._get_path(map_name, "*")):
+            if not old_path.startswith(path):
+                os.remove(old_path)
+        surface = background_batch.get_batch_surface()
+        pixels = pygame.image.tobytes(surface, "RGBA")
+        AtomicFileWriter.write(path + ".rgba", lambda file: file.write(pixels), binary=True)
+        AtomicFileWriter.write(path + ".npz", lambda file: np.savez(
+            file, background_size=np.array([surface.get_width(), surface.get_height(), background_batch.entity_width,
+                                            background_batch.entity_height]),
+            background_offset=np.array([background_batch.offset_x, background_batch.offset_y]),
+            **{name: tile_arrays[name] for name in TILE_ARRAYS}), binary=True)
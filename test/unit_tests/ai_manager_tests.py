@@ -0,0 +1,60 @@
+"""
+This module contains unit tests for the AI manager
+"""
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.engine.managers.entity_manager.entity_manager import EntityManager
+from src.game.ai.ai_manager import AIManager
+from src.game.ai.checkpoint_writer import CheckpointWriter
+from src.game.ai.telemetry_recorder import TelemetryRecorder
+
+
+class TestAIManager(unittest.TestCase):
+    def setUp(self):
+        """
+        This method will run before each test
+        """
+        self.entity_manager = EntityManager()
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """
+        This method will run after each test
+        """
+        self.directory.cleanup()
+
+    def test_only_training_records_telemetry(self):
+        # Watching or racing the AI must not replace the telemetry of the last training
+        ai_manager = AIManager(self.entity_manager, training=False)
+        self.assertFalse(ai_manager.data_collector_activated)
+        self.assertFalse(hasattr(ai_manager, "data_collector"))
+
+        ai_manager = AIManager(self.entity_manager, training=True)
+        self.assertTrue(ai_manager.data_collector_activated)
+        self.assertIsNotNone(ai_manager.data_collector.telemetry_recorder)
+
+    def test_close(self):
+        ai_manager = AIManager(self.entity_manager, training=True)
+        models_directory = os.path.join(self.directory.name, "models")
+        telemetry_directory = os.path.join(self.directory.name, "telemetry")
+        ai_manager.checkpoint_writer = CheckpointWriter(os.path.join(self.directory.name, "fitness_scores.jsonl"),
+                                                        models_directory)
+        ai_manager.data_collector.telemetry_recorder = TelemetryRecorder(telemetry_directory)
+        ai_manager.checkpoint_writer.save_generation(1, [1.0], np.zeros(3), 1.0)
+        ai_manager.data_collector.telemetry_recorder.record(1, 0, 0.5, 1.0)
+        background_writer = ai_manager.checkpoint_writer._background_writer
+
+        # The queued saves are done and no background thread is left running
+        ai_manager.close()
+        self.assertFalse(background_writer._thread.is_alive())
+        self.assertIsNone(ai_manager.data_collector.telemetry_recorder._background_writer)
+        self.assertTrue(os.path.exists(os.path.join(models_directory, "latest.json")))
+        self.assertTrue(os.path.exists(os.path.join(telemetry_directory, "chunk_000000.npy")))
+
+
+if __name__ == '__main__':
+    unittest.main()
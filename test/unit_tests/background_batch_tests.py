@@ -0,0 +1,46 @@
+"""
+This module contains unit tests for the BackgroundBatch class
+"""
+import unittest
+
+import pygame
+from pygame import Vector2
+
+from src.engine.components.transform import Transform
+from src.engine.managers.render_manager.background_batch import BackgroundBatch, BACKGROUND_CHUNK_SIZE
+
+
+class TestBackgroundBatch(unittest.TestCase):
+    def setUp(self):
+        """
+        This method will run before each test
+        """
+        # A map of 40x20 tiles of 32 pixels, 1280x640 pixels in 3x2 chunks
+        tile = pygame.Surface((32, 32))
+        tile.fill((255, 0, 0))
+        transforms = []
+        for row in range(20):
+            for column in range(40):
+                transform = Transform()
+                transform.set_position(Vector2(column * 32, row * 32))
+                transforms.append(transform)
+        self.batch = BackgroundBatch(32, 32, [tile] * len(transforms), transforms)
+
+    def test_chunks(self):
+        self.assertEqual(len(self.batch.chunks), 2)
+        self.assertEqual(len(self.batch.chunks[0]), 3)
+        self.assertEqual(self.batch.chunks[0][0].get_size(), (BACKGROUND_CHUNK_SIZE, BACKGROUND_CHUNK_SIZE))
+        self.assertEqual(self.batch.chunks[1][2].get_size(), (1280 - 2 * BACKGROUND_CHUNK_SIZE,
+                                                              640 - BACKGROUND_CHUNK_SIZE))
+
+    def test_only_visible_chunks_are_drawn(self):
+        target = pygame.Surface((400, 300))
+        self.assertEqual(self.batch.draw(target, (0, 0)), 1)
+        self.assertEqual(self.batch.draw(target, (-400, -400)), 4)
+        self.assertEqual(self.batch.draw(target, (400, 0)), 0)
+        self.assertEqual(self.batch.draw(target, (-2000, 0)), 0)
+        self.assertEqual(target.get_at((0, 0)), pygame.Color(255, 0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+"""
+This module contains unit tests for the checkpoint writer
+"""
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.game.ai.checkpoint_writer import CheckpointWriter, load_latest_model
+
+
+class TestCheckpointWriter(unittest.TestCase):
+    def setUp(self):
+        """
+        This method will run before each test
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.fitness_scores_path = os.path.join(self.directory.name, "fitness_scores.jsonl")
+        self.models_directory = os.path.join(self.directory.name, "models")
+        self.checkpoint_writer = CheckpointWriter(self.fitness_scores_path, self.models_directory)
+
+    def tearDown(self):
+        """
+        This method will run after each test
+        """
+        self.checkpoint_writer.close()
+        self.directory.cleanup()
+
+    def test_save_generations(self):
+        parameters = np.arange(5, dtype=np.float64)
+        self.checkpoint_writer.save_generation(1, [1.0, 3.0], parameters, 3.0)
+        # Changing the parameters after queueing the save must not change the saved model
+        parameters += 1
+        self.checkpoint_writer.save_generation(2, [4.0, 2.0], parameters, 4.0)
+        self.checkpoint_writer.flush()
+
+        with open(self.fitness_scores_path) as file:
+            lines = [json.loads(line) for line in file]
+        self.assertEqual([line["generation"] for line in lines], [1, 2])
+        np.testing.assert_array_equal(np.load(os.path.join(self.models_directory, "generation_0001.npy")),
+                                      np.arange(5))
+        np.testing.assert_array_equal(load_latest_model(self.models_directory), np.arange(5) + 1)
+        self.assertFalse(any(name.endswith(".tmp") for name in os.listdir(self.models_directory)))
+
+    def test_no_model(self):
+        self.assertIsNone(load_latest_model(self.models_directory))
+
+
+if __name__ == '__main__':
+    unittest.main()
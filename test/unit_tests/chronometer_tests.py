@@ -0,0 +1,39 @@
+"""
+This module contains unit tests for the chronometer with the clock of the simulation
+"""
+import unittest
+
+from src.game.ai.ai_info.chronometer import Chronometer
+from src.game.ai.ai_info.sim_clock import SimClock
+
+
+class TestChronometer(unittest.TestCase):
+    def setUp(self):
+        """
+        This method will run before each test
+        """
+        self.clock = SimClock()
+        self.chronometer = Chronometer(self.clock)
+
+    def test_measures_simulated_time(self):
+        self.clock.advance(5)
+        self.chronometer.start()
+        self.assertEqual(self.chronometer.get_elapsed_time(), 0)
+        for _ in range(30):
+            self.clock.advance(0.5)
+        self.assertEqual(self.chronometer.get_elapsed_time(), 15)
+        self.assertEqual(self.clock.get_steps(), 31)
+
+    def test_stop_and_resume(self):
+        self.chronometer.start()
+        self.clock.advance(2)
+        self.chronometer.stop()
+        self.clock.advance(10)
+        self.assertEqual(self.chronometer.get_elapsed_time(), 2)
+        self.chronometer.start()
+        self.clock.advance(1)
+        self.assertEqual(self.chronometer.get_elapsed_time(), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+"""
+This module contains unit tests for the colliders and the spatial hash
+"""
+import random
+import unittest
+
+import pygame
+
+from src.engine.components.collider import Collider
+from src.engine.managers.collider_manager.collision_layers import CollisionLayer
+from src.engine.managers.collider_manager.spatial_hash import SpatialHash
+
+
+class TestSpatialHash(unittest.TestCase):
+    def setUp(self):
+        """
+        This method will run before each test
+        """
+        random.seed(0)
+        self.rects = [pygame.Rect(random.randint(-200, 200), random.randint(-200, 200),
+                                  random.randint(1, 40), random.randint(1, 40)) for _ in range(200)]
+        self.spatial_hash = SpatialHash(64)
+        for i, rect in enumerate(self.rects):
+            self.spatial_hash.insert(i, rect)
+
+    def test_query_finds_all_colliding_rects(self):
+        for rect in self.rects:
+            candidates = self.spatial_hash.query(rect)
+            colliding = [i for i, other in enumerate(self.rects) if rect.colliderect(other)]
+            self.assertTrue(set(colliding).issubset(candidates))
+            self.assertEqual(candidates, sorted(candidates))
+
+    def test_clear(self):
+        self.spatial_hash.clear()
+        self.assertEqual(self.spatial_hash.query(self.rects[0]), [])
+
+
+class TestCollisionLayers(unittest.TestCase):
+    def test_can_collide_with(self):
+        car = Collider(pygame.Rect(0, 0, 10, 10))
+        other_car = Collider(pygame.Rect(0, 0, 10, 10))
+        npc = Collider(pygame.Rect(0, 0, 10, 10))
+        for collider in (car, other_car):
+            collider.set_collision_layer(CollisionLayer.CARS, CollisionLayer.ALL & ~CollisionLayer.CARS)
+        npc.set_collision_layer(CollisionLayer.NPCS, CollisionLayer.DEFAULT)
+
+        self.assertFalse(car.can_collide_with(other_car))
+        self.assertTrue(car.can_collide_with(npc))
+        self.assertFalse(npc.can_collide_with(car))
+        self.assertTrue(Collider(pygame.Rect(0, 0, 1, 1)).can_collide_with(car))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+This module contains unit tests for the sampling of the field of view of the cars
+"""
+import math
+import unittest
+
+import numpy as np
+
+from src.engine.math.geometry import calculate_polygon, point_in_polygon
+from src.game.ai.ai_info.field_of_view import FOV_RADIUS, FOV_SIZE, sample_field_of_view
+from src.game.map.tile_map import TILE_SIZE
+
+
+class TestFieldOfView(unittest.TestCase):
+    def setUp(self):
+        """
+        This method will run before each test
+        """
+        self.map_width = 60
+        self.map_height = 45
+        self.random_generator = np.random.default_rng(0)
+
+    def _get_polygon_field_of_view(self, position: tuple[float, float], angle: float) -> list[int]:
+        """
+        Get the tiles of the field of view with a point in polygon test for each tile around the center and sorting
+        them by rows, as TileMap.get_tiles_within_square and TileMap._rotate_tiles did
+        """
+        forward = np.array([-math.sin(-math.radians(angle)), -math.cos(math.radians(angle))])
+        forward /= np.linalg.norm(forward)
+        vision_box = calculate_polygon(angle, forward, np.array(position), TILE_SIZE, FOV_RADIUS)
+        center_x = position[0] + forward[0] * FOV_RADIUS * TILE_SIZE
+        center_y = position[1] + forward[1] * FOV_RADIUS * TILE_SIZE
+        tiles = []
+        search_radius = (FOV_SIZE * FOV_SIZE) // TILE_SIZE
+        for i in range(-search_radius, search_radius):
+            for j in range(-search_radius, search_radius):
+                index_x = int(center_x + i * TILE_SIZE) // TILE_SIZE
+                index_y = int(center_y + j * TILE_SIZE) // TILE_SIZE
+                if 0 <= index_x < self.map_width and 0 <= index_y < self.map_height:
+                    point = np.array([index_x * TILE_SIZE + TILE_SIZE / 2, float(index_y * TILE_SIZE)])
+                    if point_in_polygon(point, vision_box):
+                        tiles.append((index_x, index_y))
+
+        theta = np.radians(angle)
+        rotation_matrix = [[np.cos(theta), np.sin(theta)], [-np.sin(theta), np.cos(theta)]]
+        rotated_tiles = [(np.dot(rotation_matrix, (center_x - index_x * TILE_SIZE, center_y - index_y * TILE_SIZE)),
+                          index_y * self.map_width + index_x) for index_x, index_y in tiles]
+        rotated_tiles.sort(key=lambda item: item[0][1], reverse=True)
+        ordered_tiles = []
+        for row_start in range(0, len(rotated_tiles), FOV_SIZE):
+            row = sorted(rotated_tiles[row_start:row_start + FOV_SIZE], key=lambda item: item[0][0])
+            ordered_tiles.extend(index for _, index in row)
+        return ordered_tiles[:FOV_SIZE * FOV_SIZE]
+
+    def _sample(self, position: tuple[float, float], angle: float) -> list[int]:
+        forward_x = -math.sin(-math.radians(angle))
+        forward_y = -math.cos(math.radians(angle))
+        tile_indices = np.full(FOV_SIZE * FOV_SIZE, -1, dtype=np.int64)
+        tile_positions = np.zeros((FOV_SIZE * FOV_SIZE, 2), dtype=np.float64)
+        number_of_tiles = sample_field_of_view(position[0] + forward_x * FOV_RADIUS * TILE_SIZE,
+                                               position[1] + forward_y * FOV_RADIUS * TILE_SIZE, angle,
+                                               self.map_width, self.map_height, TILE_SIZE, tile_indices,
+                                               tile_positions)
+        return list(tile_indices[:number_of_tiles])
+
+    def test_same_tiles_as_polygon(self):
+        angles = [0.0, 90.0, 180.0, 270.0, 10.0, 45.0, 133.0, 225.0, 301.5]
+        positions = self.random_generator.uniform(0, [self.map_width * TILE_SIZE, self.map_height * TILE_SIZE],
+                                                  (20, 2))
+        for position in positions:
+            for angle in angles:
+                with self.subTest(position=position, angle=angle):
+                    self.assertEqual(self._sample(tuple(position), angle),
+                                     self._get_polygon_field_of_view(tuple(position), angle))
+
+    def test_out_of_map(self):
+        # Only the tiles in the map are in the field of view, the ones near the corner
+        position = (5.0, 5.0)
+        self.assertEqual(self._sample(position, 0.0), self._get_polygon_field_of_view(position, 0.0))
+        self.assertLess(len(self._sample(position, 0.0)), FOV_SIZE * FOV_SIZE)
+        self.assertEqual(self._sample((-1000.0, -1000.0), 30.0), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
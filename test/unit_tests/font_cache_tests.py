@@ -0,0 +1,60 @@
+"""
+This module contains unit tests for the FontCache class
+"""
+import unittest
+
+import pygame
+
+from src.engine.font_cache import FontCache
+
+
+class TestFontCache(unittest.TestCase):
+    def setUp(self):
+        """
+        This method will run before each test
+        """
+        pygame.font.init()
+        self.font_cache = FontCache()
+        self.font_cache.clear()
+        self.capacity = self.font_cache.capacity
+
+    def tearDown(self):
+        """
+        This method will run after each test
+        """
+        self.font_cache.capacity = self.capacity
+        self.font_cache.clear()
+
+    def test_font_is_loaded_once(self):
+        font = self.font_cache.get_font("Arial", 15)
+        self.assertIs(self.font_cache.get_font("Arial", 15), font)
+        self.assertIsNot(self.font_cache.get_font("Arial", 15, bold=True), font)
+        stats = self.font_cache.get_stats()
+        self.assertEqual(stats["font_hits"], 1)
+        self.assertEqual(stats["font_misses"], 2)
+
+    def test_text_is_rendered_once(self):
+        surface = self.font_cache.render("12", "Arial", 15, (255, 0, 255))
+        self.assertIs(self.font_cache.render("12", "Arial", 15, (255, 0, 255)), surface)
+        self.assertIsNot(self.font_cache.render("12", "Arial", 15, (255, 255, 255)), surface)
+        stats = self.font_cache.get_stats()
+        self.assertEqual(stats["text_hits"], 1)
+        self.assertEqual(stats["text_misses"], 2)
+        self.assertEqual(stats["fonts"], 1)
+
+    def test_least_recently_used_text_is_discarded(self):
+        self.font_cache.capacity = 2
+        first = self.font_cache.render("1", "Arial", 15, (0, 0, 0))
+        self.font_cache.render("2", "Arial", 15, (0, 0, 0))
+        # Using the first text makes the second one the least recently used
+        self.font_cache.render("1", "Arial", 15, (0, 0, 0))
+        self.font_cache.render("3", "Arial", 15, (0, 0, 0))
+        self.assertEqual(self.font_cache.get_stats()["texts"], 2)
+        self.assertIs(self.font_cache.render("1", "Arial", 15, (0, 0, 0)), first)
+        misses = self.font_cache.text_misses
+        self.font_cache.render("2", "Arial", 15, (0, 0, 0))
+        self.assertEqual(self.font_cache.text_misses, misses + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+This module contains unit tests for the policies that end the generations
+"""
+import unittest
+
+import numpy as np
+
+from src.game.ai.headless_trainer import HeadlessTrainer
+from src.game.ai.generation_end_policies import TimeLimitPolicy, NoProgressPolicy, EliteUnreachablePolicy
+
+
+class TestGenerationEndPolicies(unittest.TestCase):
+    def setUp(self):
+        """
+        This method will run before each test
+        """
+        self.fitness_scores = np.array([100.0, 50.0, 10.0, 5.0])
+        self.alive = np.array([False, False, True, True])
+
+    def test_time_limit(self):
+        policy = TimeLimitPolicy(10)
+        self.assertFalse(policy.should_end(self.fitness_scores, self.alive, 10))
+        self.assertTrue(policy.should_end(self.fitness_scores, self.alive, 10.1))
+
+    def test_no_progress(self):
+        policy = NoProgressPolicy(max_frames=3)
+        for _ in range(3):
+            self.assertFalse(policy.should_end(self.fitness_scores, self.alive, 0))
+        self.assertTrue(policy.should_end(self.fitness_scores, self.alive, 0))
+
+        # Any agent improving its best fitness score is progress
+        policy.reset()
+        for i in range(10):
+            fitness_scores = self.fitness_scores.copy()
+            fitness_scores[3] += i
+            self.assertFalse(policy.should_end(fitness_scores, self.alive, 0))
+
+    def test_elite_unreachable(self):
+        # With 4 agents the elite is the best one, at 100
+        policy = EliteUnreachablePolicy(duration=10, max_speed=10, elite_fraction=0.13, checkpoint_jump=0)
+        self.assertFalse(policy.should_end(self.fitness_scores, self.alive, 0))
+        self.assertFalse(policy.should_end(self.fitness_scores, self.alive, 1))
+        self.assertTrue(policy.should_end(self.fitness_scores, self.alive, 1.1))
+        # It never ends without enabled agents, that is handled when all of them are disabled
+        self.assertFalse(policy.should_end(self.fitness_scores, np.zeros(4, dtype=bool), 10))
+
+    def test_elite_reachable_crossing_checkpoint(self):
+        # Driving at the maximum speed, the enabled agent at 10 can not reach the elite at 100 in the last 0.5 seconds
+        self.assertTrue(EliteUnreachablePolicy(duration=10, max_speed=10, elite_fraction=0.13, checkpoint_jump=0)
+                        .should_end(self.fitness_scores, self.alive, 9.5))
+        # But crossing a checkpoint it can
+        policy = EliteUnreachablePolicy(duration=10, max_speed=10, elite_fraction=0.13, checkpoint_jump=90)
+        self.assertFalse(policy.should_end(self.fitness_scores, self.alive, 9.5))
+        fitness_scores = self.fitness_scores.copy()
+        fitness_scores[2] += 4 + 90
+        self.assertEqual(np.argmax(fitness_scores), 2)
+        self.assertFalse(policy.should_end(fitness_scores, self.alive, 9.9))
+
+    def test_checkpoint_jump_of_training(self):
+        # In a real training the traveled distance of an enabled car never gains more than the policy expects
+        trainer = HeadlessTrainer("road01", number_of_cars=40, seed=1)
+        ai_manager = trainer.get_ai_manager()
+        ai_manager.checkpoint_writer = None
+        ai_manager.data_collector_activated = False
+        checkpoint_jump = ai_manager.tile_map.get_checkpoint_jump()
+        max_speed = trainer.get_cars_manager().get_cars()[0].accelerate_max_speed
+        traveled_distances = []
+        alive = []
+        while not ai_manager.has_generation_ended():
+            trainer.step()
+            cars = trainer.get_cars_manager().get_cars()
+            traveled_distances.append([car.car_knowledge.traveled_distance for car in cars])
+            alive.append([not car.disabled for car in cars])
+        traveled_distances = np.array(traveled_distances)
+        alive = np.array(alive)
+        self.assertTrue(np.any(np.diff(traveled_distances, axis=0) > max_speed * trainer.get_delta_time()))
+
+        # Distance of each frame over the one driven at the maximum speed since the first frame, the largest gain
+        # after each frame is the largest of the frames after it
+        excess = traveled_distances - max_speed * trainer.get_delta_time() * np.arange(len(traveled_distances))[:, None]
+        largest_gain = np.maximum.accumulate(excess[::-1], axis=0)[::-1] - excess
+        self.assertLessEqual(np.max(largest_gain[alive]), checkpoint_jump)
+
+
+if __name__ == '__main__':
+    unittest.main()
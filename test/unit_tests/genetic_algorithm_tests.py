@@ -61,6 +61,18 @@ class TestGeneticAlgorithm(unittest.TestCase):
         # Checking that top fitness is set correctly (mock agents have fitness scores 0 and 1)
         self.assertEqual(self.ga.top_fitness, 1)
 
+    def test_evolve_genomes_is_reproducible_with_seed(self):
+        genomes = np.random.rand(15, 100)
+        fitness_scores = np.arange(15)
+        next_gen1 = GeneticAlgorithm(seed=7).evolve_genomes(genomes, fitness_scores)
+        next_gen2 = GeneticAlgorithm(seed=7).evolve_genomes(genomes, fitness_scores)
+
+        self.assertEqual(next_gen1.shape, genomes.shape)
+        np.testing.assert_array_equal(next_gen1, next_gen2)
+        # The best genomes are preserved as elite
+        np.testing.assert_array_equal(next_gen1[0], genomes[14])
+        np.testing.assert_array_equal(next_gen1[1], genomes[13])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,80 @@
+"""
+This module contains unit tests for the encoding of the inputs of the cars
+"""
+import unittest
+
+import numpy as np
+
+from src.game.ai.ai_info.field_of_view import FOV_SIZE, sample_field_of_view
+from src.game.ai.headless_trainer import HeadlessTrainer
+from src.game.ai.input_encoder import NUMBER_OF_INPUTS, InputEncoder, _encode_inputs, encode_inputs
+from src.game.map.tile_map import TILE_SIZE
+
+
+class TestInputEncoder(unittest.TestCase):
+    def setUp(self):
+        """
+        This method will run before each test
+        """
+        random_generator = np.random.default_rng(0)
+        self.map_width = 40
+        self.map_height = 30
+        self.encoded_values = random_generator.random(self.map_width * self.map_height).astype(np.float32)
+        self.number_of_cars = 5
+        self.fov_centers = random_generator.uniform(0, 30 * TILE_SIZE, (self.number_of_cars, 2))
+        self.fov_angles = random_generator.uniform(0, 360, self.number_of_cars)
+        self.car_positions = random_generator.uniform(0, 30 * TILE_SIZE, (self.number_of_cars, 2))
+        self.velocities = random_generator.uniform(-5, 10, self.number_of_cars)
+        self.next_checkpoint_positions = self.car_positions.copy()
+        self.next_checkpoint_positions[1:] += random_generator.uniform(-100, 100, (self.number_of_cars - 1, 2))
+
+    def _encode(self, function) -> np.ndarray:
+        inputs = np.zeros((self.number_of_cars, NUMBER_OF_INPUTS))
+        function(self.fov_centers, self.fov_angles, self.car_positions, self.velocities,
+                 np.full(self.number_of_cars, -5.0), np.full(self.number_of_cars, 10.0),
+                 self.next_checkpoint_positions, self.encoded_values, self.map_width, self.map_height, TILE_SIZE,
+                 inputs)
+        return inputs
+
+    def test_encode_inputs(self):
+        inputs = self._encode(_encode_inputs)
+        for i in range(self.number_of_cars):
+            self.assertAlmostEqual(inputs[i, 0], (self.velocities[i] + 5) / 15)
+            relative_position = self.next_checkpoint_positions[i] - self.car_positions[i]
+            distance = np.linalg.norm(relative_position)
+            expected_direction = relative_position / distance if distance != 0 else np.zeros(2)
+            np.testing.assert_allclose(inputs[i, 1:3], expected_direction)
+
+            # The field of view is sampled as FOV does
+            tile_indices = np.zeros(FOV_SIZE * FOV_SIZE, dtype=np.int64)
+            number_of_tiles = sample_field_of_view(self.fov_centers[i, 0], self.fov_centers[i, 1],
+                                                   self.fov_angles[i], self.map_width, self.map_height, TILE_SIZE,
+                                                   tile_indices, np.zeros((FOV_SIZE * FOV_SIZE, 2)))
+            expected_fov = np.full(FOV_SIZE * FOV_SIZE, -1.0)
+            expected_fov[:number_of_tiles] = self.encoded_values[tile_indices[:number_of_tiles]]
+            np.testing.assert_array_equal(inputs[i, 3:], expected_fov)
+
+    def test_compiled_kernel(self):
+        np.testing.assert_array_equal(self._encode(encode_inputs), self._encode(_encode_inputs))
+
+    def test_same_inputs_as_prepare_input(self):
+        trainer = HeadlessTrainer("road01", number_of_cars=10, seed=0)
+        ai_manager = trainer.get_ai_manager()
+        ai_manager.checkpoint_writer = None
+        ai_manager.data_collector_activated = False
+        cars = trainer.get_cars_manager().get_cars()
+        input_encoder = InputEncoder(len(cars))
+        # Two generations, as most of the cars crash soon
+        for step in range(1200):
+            trainer.step()
+            if step % 20 != 0:
+                continue
+            inputs = input_encoder.encode(cars, ai_manager.entity_manager)
+            expected_inputs = np.stack([ai_manager.prepare_input(car) for car in cars])
+            # The direction to the next checkpoint may differ in the last bit, the field of view must be the same
+            np.testing.assert_allclose(inputs[:, :3], expected_inputs[:, :3], rtol=1e-12, atol=1e-15)
+            np.testing.assert_array_equal(inputs[:, 3:], expected_inputs[:, 3:])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+This module contains unit tests for the island model
+"""
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.game.ai.island_model import IslandModel
+
+
+class TestIslandModel(unittest.TestCase):
+    def setUp(self):
+        """
+        This method will run before each test
+        """
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """
+        This method will run after each test
+        """
+        self.directory.cleanup()
+
+    def test_maps_are_assigned_in_turns(self):
+        island_model = IslandModel(["road01", "road02"], 5, models_directory=self.directory.name)
+        self.assertEqual(island_model.map_names, ["road01", "road02", "road01", "road02", "road01"])
+        island_model.close()
+
+    def test_migration_size(self):
+        island_model = IslandModel(["road01"], 1, models_directory=self.directory.name)
+        # A single island has nowhere to send its genomes
+        self.assertEqual(island_model.migration_size, 0)
+        island_model.close()
+        island_model = IslandModel(["road01"], 2, genomes_per_island=3, migration_size=5,
+                                   models_directory=self.directory.name)
+        self.assertEqual(island_model.migration_size, 3)
+        island_model.close()
+
+    def _read_fitness_scores(self, island_index: int) -> dict[int, list[float]]:
+        path = os.path.join(self.directory.name, f"island_{island_index:02d}", "fitness_scores.jsonl")
+        with open(path) as file:
+            lines = [json.loads(line) for line in file]
+        return {line["generation"]: line["fitness_scores"] for line in lines}
+
+    def test_run(self):
+        island_model = IslandModel(["road01"], 2, genomes_per_island=3, migration_interval=1, migration_size=1,
+                                   seed=0, models_directory=self.directory.name)
+        try:
+            island_model.run(2)
+        finally:
+            island_model.close()
+        fitness_scores = [self._read_fitness_scores(0), self._read_fitness_scores(1)]
+        # Every generation of every island is saved
+        for island_fitness_scores in fitness_scores:
+            self.assertEqual(sorted(island_fitness_scores), [1, 2])
+            self.assertTrue(all(len(scores) == 3 for scores in island_fitness_scores.values()))
+        # The best genome of each island replaces the last child of the other island, and drives the same way there
+        self.assertEqual(fitness_scores[1][2][-1], max(fitness_scores[0][1]))
+        self.assertEqual(fitness_scores[0][2][-1], max(fitness_scores[1][1]))
+        self.assertEqual(island_model.top_fitness[island_model.get_best_island()],
+                         max(max(scores) for island in fitness_scores for scores in island.values()))
+
+    @patch("src.game.ai.island_model.RESULT_TIMEOUT", 0.1)
+    def test_island_stops(self):
+        # The islands can not load the map, so they stop without sending any result
+        island_model = IslandModel(["missing_map"], 2, genomes_per_island=3, models_directory=self.directory.name)
+        with self.assertRaises(RuntimeError):
+            island_model.run(2)
+        island_model.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+"""
+This module contains unit tests for the MapCache class
+"""
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pygame
+
+from src.engine.managers.render_manager.background_batch import BackgroundBatch
+from src.game.resource_manager.map_cache import MapCache
+
+
+class TestMapCache(unittest.TestCase):
+    def setUp(self):
+        """
+        This method will run before each test
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.patcher = patch("src.game.resource_manager.map_cache.CACHE_DIRECTORY", self.directory.name + "/")
+        self.patcher.start()
+        surface = pygame.Surface((64, 32), pygame.SRCALPHA)
+        surface.fill((10, 20, 30, 255))
+        surface.fill((200, 0, 0, 128), pygame.Rect(16, 0, 16, 16))
+        self.background_batch = BackgroundBatch.from_surface(surface, 16, 16, 0, 16)
+        self.tile_arrays = {"tile_types": np.arange(8, dtype=np.int8),
+                            "encoded_values": np.linspace(0, 1, 8, dtype=np.float32),
+                            "checkpoint_numbers": np.full(8, -1, dtype=np.int32),
+                            "tile_positions": np.zeros((8, 2), dtype=np.float64)}
+
+    def tearDown(self):
+        """
+        This method will run after each test
+        """
+        self.patcher.stop()
+        self.directory.cleanup()
+
+    def test_save_and_load(self):
+        self.assertIsNone(MapCache.load("road01"))
+        MapCache.save("road01", self.background_batch, self.tile_arrays)
+        cached_map = MapCache.load("road01")
+        self.assertIsNotNone(cached_map)
+        self.assertEqual(cached_map.background_batch.get_width(), 64)
+        self.assertEqual(cached_map.background_batch.get_height(), 32)
+        self.assertEqual(cached_map.background_batch.offset_y, 16)
+        self.assertEqual(pygame.image.tobytes(cached_map.background_batch.get_batch_surface(), "RGBA"),
+                         pygame.image.tobytes(self.background_batch.get_batch_surface(), "RGBA"))
+        for name, array in self.tile_arrays.items():
+            np.testing.assert_array_equal(cached_map.tile_arrays[name], array)
+            self.assertEqual(cached_map.tile_arrays[name].dtype, array.dtype)
+
+    def test_cache_of_other_content_is_not_used(self):
+        MapCache.save("road01", self.background_batch, self.tile_arrays)
+        with patch.object(MapCache, "get_key", return_value="0000000000000000"):
+            self.assertIsNone(MapCache.load("road01"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,7 @@ import numpy as np
 from unittest.mock import patch
 from src.engine.ai.neural_network.layer import Layer
 from src.engine.ai.neural_network.neural_network import NeuralNetwork
+from src.engine.ai.neural_network.population_neural_network import PopulationNeuralNetwork
 
 
 class TestNeuralNetwork(unittest.TestCase):
@@ -139,6 +140,27 @@ class TestNeuralNetwork(unittest.TestCase):
         with self.assertRaises(ValueError):
             NeuralNetwork([-3, -5, -2])
 
+    def test_population_forward_matches_forward(self):
+        # Test that the batched forward pass gives the same outputs as each network on its own
+        networks = [NeuralNetwork([8, 5, 6]) for _ in range(4)]
+        for network in networks:
+            network.set_parameters(np.random.randn(network.get_total_params()))
+        population = PopulationNeuralNetwork(networks)
+        inputs = np.random.randn(3, 8)
+        indices = np.array([3, 0, 2])
+        outputs = population.forward(inputs, indices)
+        for row, index in enumerate(indices):
+            np.testing.assert_array_almost_equal(outputs[row], networks[index].forward(inputs[row]))
+
+    def test_population_forward_float32(self):
+        # Test that a float32 population uses float32 inputs and gives almost the same outputs
+        networks = [NeuralNetwork([8, 5, 6]) for _ in range(4)]
+        inputs = np.random.randn(4, 8)
+        expected = PopulationNeuralNetwork(networks).forward(inputs).copy()
+        outputs = PopulationNeuralNetwork(networks, dtype=np.float32).forward(inputs.astype(np.float32))
+        self.assertEqual(outputs.dtype, np.float32)
+        np.testing.assert_allclose(outputs, expected, rtol=1e-5)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,48 @@
+"""
+This module contains unit tests for the evaluation of the shards of the population in the workers
+"""
+import unittest
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from src.engine.ai.neural_network.neural_network import NeuralNetwork
+from src.game.ai import parallel_evaluator
+from src.game.ai.ai_manager import NEURAL_NET_LAYER_SIZES
+from src.game.ai.generation_end_policies import TimeLimitPolicy
+from src.game.ai.headless_trainer import FIXED_DELTA_TIME
+from src.game.ai.parallel_evaluator import _evaluate_shard, _initialize_worker
+
+
+class TestParallelEvaluator(unittest.TestCase):
+    def setUp(self):
+        """
+        This method will run before each test
+        """
+        np.random.seed(0)
+        genomes = np.stack([NeuralNetwork(NEURAL_NET_LAYER_SIZES).get_parameters() for _ in range(4)])
+        self.shared_memory = SharedMemory(create=True, size=genomes.nbytes)
+        np.ndarray(genomes.shape, dtype=np.float64, buffer=self.shared_memory.buf)[:] = genomes
+        # The worker is initialized in this process, as the pool does in each worker
+        _initialize_worker("road01", self.shared_memory.name, genomes.shape, FIXED_DELTA_TIME)
+
+    def tearDown(self):
+        """
+        This method will run after each test
+        """
+        parallel_evaluator._worker_trainers.clear()
+        parallel_evaluator._worker_genomes = None
+        parallel_evaluator._worker_shared_memory.close()
+        self.shared_memory.close()
+        self.shared_memory.unlink()
+
+    def test_shard_ends_by_time(self):
+        fitness_scores = _evaluate_shard(1, 3)
+        self.assertEqual(fitness_scores.shape, (2,))
+        # The shard does not end by the progress or the elite of its cars, only the whole population could
+        policies = parallel_evaluator._worker_trainers[2].get_ai_manager().generation_end_policies
+        self.assertEqual([type(policy) for policy in policies], [TimeLimitPolicy])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""
+This module contains unit tests for the physics store
+"""
+import unittest
+
+from pygame import Vector2
+
+from src.engine.components.physics import Physics
+from src.engine.components.transform import Transform
+from src.engine.managers.physics_manager.physics_manager import PhysicsManager
+from src.engine.managers.physics_manager.physics_store import PhysicsStore
+
+
+class TestPhysicsStore(unittest.TestCase):
+    def setUp(self):
+        """
+        This method will run before each test
+        """
+        # Small capacity so the store has to grow
+        self.store = PhysicsStore(capacity=2)
+        self.bound = []
+        self.unbound = []
+        for i in range(5):
+            pairs = []
+            for store in (self.store, None):
+                physics = Physics(is_static=i == 4)
+                transform = Transform()
+                if store is not None:
+                    slot = store.add_slot()
+                    physics.bind(store, slot)
+                    transform.bind(store, slot)
+                physics.set_drag(0.01 * i)
+                physics.set_velocity(10 * (i - 2))
+                physics.set_vector_velocity(Vector2(i, -i))
+                transform.set_position(Vector2(100 * i, 50))
+                transform.set_rotation(37 * i)
+                pairs.append((physics, transform))
+            self.bound.append(pairs[0])
+            self.unbound.append(pairs[1])
+
+    def test_step_matches_single_entity_update(self):
+        delta_time = 1 / 30
+        for frame in range(10):
+            for i, (physics, transform) in enumerate(self.unbound):
+                physics.add_force(100 * i)
+                self.bound[i][0].add_force(100 * i)
+                if not physics.is_static():
+                    PhysicsManager._update_physics_and_transform(physics, transform, delta_time)
+            self.store.step(delta_time)
+
+        for (bound_physics, bound_transform), (physics, transform) in zip(self.bound, self.unbound):
+            self.assertAlmostEqual(bound_physics.get_velocity(), physics.get_velocity())
+            self.assertEqual(bound_physics.get_force(), physics.get_force())
+            for axis in range(2):
+                self.assertAlmostEqual(bound_physics.get_vector_velocity()[axis], physics.get_vector_velocity()[axis])
+                self.assertAlmostEqual(bound_transform.get_position()[axis], transform.get_position()[axis])
+
+    def test_components_are_views_onto_the_store(self):
+        physics, transform = self.bound[1]
+        transform.displace(Vector2(1, 2))
+        self.assertEqual(tuple(self.store.position[1]), (101, 52))
+        self.store.velocity[1] = 5
+        self.assertEqual(physics.get_velocity(), 5)
+        transform.reset()
+        self.assertEqual(transform.get_position(), Vector2(0, 0))
+        self.assertEqual(transform.get_rotation(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+This module contains unit tests for the replays
+"""
+import glob
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+from src.engine.ai.AI_input_manager import AIInputManager
+from src.engine.managers.input_manager.key import Key
+from src.game.ai.headless_trainer import HeadlessTrainer
+from src.game.replay.replay import Replay, ReplayRecorder, apply_mask
+from src.game.replay.replay_player import ReplayPlayer
+
+
+class TestReplay(unittest.TestCase):
+    def setUp(self):
+        """
+        This method will run before each test
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.cars = [SimpleNamespace(input_manager=AIInputManager()) for _ in range(3)]
+        self.recorder = ReplayRecorder("road01", len(self.cars), seed=4, capacity=2)
+
+    def tearDown(self):
+        """
+        This method will run after each test
+        """
+        self.directory.cleanup()
+
+    def test_record_save_and_load(self):
+        self.recorder.start(generation=7, simulation_step=120)
+        for frame in range(5):
+            for i, car in enumerate(self.cars):
+                apply_mask(car, (frame * 3 + i) % 64)
+            self.recorder.record_frame(1 / 30, self.cars)
+        replay = self.recorder.finish(np.ones((3, 2)), np.arange(3))
+        self.assertFalse(self.recorder.is_recording())
+
+        path = os.path.join(self.directory.name, "replay.npz")
+        replay.save(path)
+        loaded = Replay.load(path)
+        self.assertEqual(loaded.header["generation"], 7)
+        self.assertEqual(loaded.header["simulation_step"], 120)
+        self.assertEqual(loaded.get_number_of_frames(), 5)
+        np.testing.assert_array_equal(loaded.masks, (np.arange(5)[:, None] * 3 + np.arange(3)) % 64)
+        np.testing.assert_array_equal(loaded.final_traveled_distances, np.arange(3))
+
+    def test_apply_mask(self):
+        car = self.cars[0]
+        apply_mask(car, 0b100001)
+        self.assertTrue(car.input_manager.is_key_down(Key.K_W))
+        self.assertTrue(car.input_manager.is_key_down(Key.K_SPACE))
+        self.assertFalse(car.input_manager.is_key_down(Key.K_A))
+
+    def test_replay_training(self):
+        trainer = HeadlessTrainer("road01", number_of_cars=3, seed=0, replay_directory=self.directory.name)
+        trainer.get_ai_manager().checkpoint_writer = None
+        trainer.get_ai_manager().data_collector_activated = False
+        trainer.run(2)
+        replay_paths = sorted(glob.glob(os.path.join(self.directory.name, "generation_*.npz")))
+        self.assertEqual(len(replay_paths), 2)
+        # The second generation starts in the middle of the simulation
+        for path in replay_paths:
+            replay = Replay.load(path)
+            self.assertGreater(replay.get_number_of_frames(), 0)
+            self.assertTrue(ReplayPlayer(replay).run())
+
+
+if __name__ == '__main__':
+    unittest.main()
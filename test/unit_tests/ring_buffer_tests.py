@@ -0,0 +1,36 @@
+"""
+This module contains unit tests for the ring buffer
+"""
+import unittest
+
+import numpy as np
+
+from src.game.ai.ai_info.ring_buffer import RingBuffer
+
+
+class TestRingBuffer(unittest.TestCase):
+    def setUp(self):
+        """
+        This method will run before each test
+        """
+        self.ring_buffer = RingBuffer(4)
+
+    def test_keeps_the_last_values(self):
+        for i in range(10):
+            self.ring_buffer.append(i)
+        self.assertEqual(len(self.ring_buffer), 4)
+        np.testing.assert_array_equal(self.ring_buffer.to_array(), [6, 7, 8, 9])
+        self.assertEqual(self.ring_buffer[0], 6)
+        self.assertEqual(self.ring_buffer[-1], 9)
+
+    def test_not_full(self):
+        self.ring_buffer.append(1)
+        self.ring_buffer.append(2)
+        np.testing.assert_array_equal(self.ring_buffer.to_array(), [1, 2])
+        self.assertEqual(self.ring_buffer[-2], 1)
+        with self.assertRaises(IndexError):
+            _ = self.ring_buffer[2]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+"""
+This module contains unit tests for the RotationCache class
+"""
+import unittest
+
+import pygame
+from pygame import Vector2
+
+from src.engine.components.sprite import Sprite
+from src.engine.components.transform import Transform
+from src.engine.managers.resource_manager.rotation_cache import RotationCache
+
+
+class TestRotationCache(unittest.TestCase):
+    def setUp(self):
+        """
+        This method will run before each test
+        """
+        RotationCache.clear()
+        self.image = pygame.Surface((10, 20))
+
+    def tearDown(self):
+        """
+        This method will run after each test
+        """
+        RotationCache.clear()
+
+    def test_quantize(self):
+        self.assertEqual(RotationCache.quantize(10.4, 1), 10)
+        self.assertEqual(RotationCache.quantize(10.6, 2), 10)
+        self.assertEqual(RotationCache.quantize(359.7, 1), 0)
+        self.assertEqual(RotationCache.quantize(-90, 1), 270)
+        self.assertEqual(RotationCache.quantize(10.4, 0), 10.4)
+
+    def test_rotations_are_shared_by_path(self):
+        rotated = RotationCache.get_rotated("car", self.image, 90)
+        self.assertEqual(rotated.get_size(), (20, 10))
+        self.assertIs(RotationCache.get_rotated("car", pygame.Surface((10, 20)), 90), rotated)
+        self.assertIsNot(RotationCache.get_rotated("bicycle", self.image, 90), rotated)
+        self.assertEqual(RotationCache.get_stats(), {"hits": 1, "misses": 2, "rotations": 2})
+
+    def test_sprite_rotates_once_per_step(self):
+        sprite = Sprite("entities/bicycle", rotation_step=2)
+        transform = Transform()
+        for rotation in (0.0, 0.5, 0.9, 2.5):
+            transform.set_rotation(rotation)
+            sprite.update_transform(transform, Vector2(0, 0))
+            sprite.update()
+        self.assertEqual(RotationCache.get_stats()["misses"], 2)
+
+        # Nothing changed, so the sprite is not updated again
+        sprite.update_transform(transform, Vector2(0, 0))
+        self.assertFalse(sprite.dirty)
+
+
+if __name__ == '__main__':
+    unittest.main()
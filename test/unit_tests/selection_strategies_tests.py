@@ -0,0 +1,50 @@
+"""
+This module contains unit tests for the selection strategies of the genetic algorithm
+"""
+import unittest
+
+import numpy as np
+
+from src.engine.ai.genetic_algorithm.genetic_algorithm import GeneticAlgorithm
+from src.engine.ai.genetic_algorithm.selection_strategies import TournamentSelection, RankSelection, \
+    FitnessProportionalSelection
+
+
+class TestSelectionStrategies(unittest.TestCase):
+    def setUp(self):
+        """
+        This method will run before each test
+        """
+        self.random_generator = np.random.default_rng(0)
+        self.fitness_scores = np.array([0.0, 10.0, 5.0, 0.0, 20.0])
+        self.strategies = [TournamentSelection(), RankSelection(), FitnessProportionalSelection()]
+
+    def test_parents_are_in_the_population(self):
+        for strategy in self.strategies:
+            parents1, parents2 = strategy.select_parents(self.fitness_scores, 100, self.random_generator)
+            self.assertEqual(parents1.shape, (100,))
+            self.assertEqual(parents2.shape, (100,))
+            self.assertTrue(np.all((0 <= parents1) & (parents1 < 5) & (0 <= parents2) & (parents2 < 5)))
+
+    def test_better_genomes_are_chosen_more(self):
+        for strategy in self.strategies:
+            parents1, parents2 = strategy.select_parents(self.fitness_scores, 1000, self.random_generator)
+            counts = np.bincount(np.concatenate((parents1, parents2)), minlength=5)
+            self.assertGreater(counts[4], counts[2], type(strategy).__name__)
+            self.assertGreater(counts[1], counts[0], type(strategy).__name__)
+
+    def test_fitness_proportional_with_equal_scores(self):
+        parents1, _ = FitnessProportionalSelection().select_parents(np.ones(5), 10, self.random_generator)
+        self.assertEqual(len(parents1), 10)
+
+    def test_elite_with_strategy(self):
+        genomes = np.random.rand(20, 10)
+        fitness_scores = np.random.rand(20)
+        next_generation = GeneticAlgorithm(seed=1, selection_strategy=RankSelection()).evolve_genomes(genomes,
+                                                                                                      fitness_scores)
+        # 13% of 20 genomes are 3 elite genomes, from the best one
+        np.testing.assert_array_equal(next_generation[:3], genomes[np.argsort(-fitness_scores)[:3]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+"""
+This module contains unit tests for the SpriteLoader class
+"""
+import glob
+import unittest
+
+from src.engine.managers.resource_manager.sprite_loader import SpriteLoader, GLOBAL_SPRITE_PATH, SPRITE_EXTENSION
+
+
+class TestSpriteLoader(unittest.TestCase):
+    def setUp(self):
+        """
+        This method will run before each test
+        """
+        SpriteLoader.clear()
+
+    def tearDown(self):
+        """
+        This method will run after each test
+        """
+        SpriteLoader.clear()
+
+    def test_sprites_are_shared(self):
+        sprite = SpriteLoader.load("tiles/sea")
+        self.assertIs(SpriteLoader.load("tiles/sea"), sprite)
+        self.assertIsNot(SpriteLoader.load("tiles/wall"), sprite)
+        stats = SpriteLoader.get_stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 2)
+        self.assertEqual(stats["sprites"], 2)
+        self.assertEqual(stats["memory"], sum(SpriteLoader.load(path).get_pitch() * SpriteLoader.load(path).get_height()
+                                              for path in ("tiles/sea", "tiles/wall")))
+
+    def test_preload(self):
+        number_of_tiles = len(glob.glob(GLOBAL_SPRITE_PATH + "tiles/*" + SPRITE_EXTENSION))
+        self.assertEqual(SpriteLoader.preload("tiles"), number_of_tiles)
+        self.assertEqual(SpriteLoader.get_stats()["sprites"], number_of_tiles)
+        SpriteLoader.load("tiles/sea")
+        self.assertEqual(SpriteLoader.misses, number_of_tiles)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+"""
+This module contains unit tests for the telemetry recorder
+"""
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.game.ai.telemetry_recorder import TelemetryRecorder, load_telemetry
+
+
+class TestTelemetryRecorder(unittest.TestCase):
+    def setUp(self):
+        """
+        This method will run before each test
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.recorder = TelemetryRecorder(self.directory.name, chunk_size=4)
+
+    def tearDown(self):
+        """
+        This method will run after each test
+        """
+        self.recorder.close()
+        self.directory.cleanup()
+
+    def test_records_are_loaded_in_order(self):
+        for i in range(10):
+            self.recorder.record(1, i % 2, i / 30, i * 10)
+        self.recorder.close()
+
+        telemetry = load_telemetry(self.directory.name)
+        np.testing.assert_array_equal(telemetry['fitness'], np.arange(10) * 10)
+        np.testing.assert_array_equal(load_telemetry(self.directory.name, car_id=1)['time'], np.arange(1, 10, 2) / 30)
+
+    def test_new_recording_replaces_the_previous_one(self):
+        self.recorder.record(1, 0, 0, 5)
+        self.recorder.close()
+        recorder = TelemetryRecorder(self.directory.name)
+        recorder.record(2, 0, 0, 7)
+        recorder.close()
+
+        np.testing.assert_array_equal(load_telemetry(self.directory.name)['generation'], [2])
+
+
+if __name__ == '__main__':
+    unittest.main()
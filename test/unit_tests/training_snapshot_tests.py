@@ -0,0 +1,51 @@
+"""
+This module contains unit tests for the training snapshots
+"""
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.engine.ai.genetic_algorithm.genetic_algorithm import GeneticAlgorithm
+from src.game.ai.training_snapshot import TrainingSnapshot
+
+
+class TestTrainingSnapshot(unittest.TestCase):
+    def setUp(self):
+        """
+        This method will run before each test
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "snapshot.npz")
+        self.genomes = np.random.default_rng(0).random((4, 6))
+        self.fitness_scores = np.array([1.0, 4.0, 2.0, 3.0])
+
+    def tearDown(self):
+        """
+        This method will run after each test
+        """
+        self.directory.cleanup()
+
+    def test_resumed_evolution_is_the_same(self):
+        genetic_algorithm = GeneticAlgorithm(seed=3)
+        genomes = genetic_algorithm.evolve_genomes(self.genomes, self.fitness_scores)
+        TrainingSnapshot.capture(genomes, genetic_algorithm, {1: self.fitness_scores}).save(self.path)
+        expected = genetic_algorithm.evolve_genomes(genomes, self.fitness_scores)
+
+        snapshot = TrainingSnapshot.load(self.path)
+        resumed_genetic_algorithm = GeneticAlgorithm(seed=7)
+        snapshot.restore(resumed_genetic_algorithm)
+        self.assertEqual(resumed_genetic_algorithm.current_generation, 2)
+        self.assertEqual(snapshot.fitness_history, {1: [1.0, 4.0, 2.0, 3.0]})
+        np.testing.assert_array_equal(snapshot.genomes, genomes)
+        np.testing.assert_array_equal(resumed_genetic_algorithm.evolve_genomes(snapshot.genomes, self.fitness_scores),
+                                      expected)
+
+    def test_missing_snapshot(self):
+        with self.assertRaises(FileNotFoundError):
+            TrainingSnapshot.load(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
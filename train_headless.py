@@ -0,0 +1,76 @@
+"""
+Headless training entry point
+Trains the AI without opening a window, using a fixed simulated time step
+"""
+import argparse
+
+from src.game.ai.headless_trainer import HeadlessTrainer, FIXED_DELTA_TIME
+from src.game.ai.island_model import IslandModel
+from src.game.ai.parallel_evaluator import ParallelEvaluator
+from src.game.ai.training_snapshot import TrainingSnapshot, SNAPSHOT_PATH
+from src.game.replay.replay import REPLAY_DIRECTORY
+
+
+def main():
+    """
+    Main function of the headless training
+    """
+    parser = argparse.ArgumentParser(description="Train the AI cars without rendering")
+    parser.add_argument("--map", default=["road01"], nargs="+", dest="maps",
+                        help="name of the map to train on, or of the maps of the islands")
+    parser.add_argument("--generations", type=int, default=10, help="number of generations to train")
+    parser.add_argument("--delta-time", type=float, default=FIXED_DELTA_TIME,
+                        help="simulated seconds advanced every step")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the genetic algorithm")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="number of processes evaluating the population, 1 to train in this process")
+    parser.add_argument("--resume", nargs="?", const=SNAPSHOT_PATH, default=None, metavar="SNAPSHOT",
+                        help="resume the training from a snapshot, by default the last saved one")
+    parser.add_argument("--islands", type=int, default=1,
+                        help="number of islands evolving their own population in their own process, "
+                             "each one on the next map in turns")
+    parser.add_argument("--migration-interval", type=int, default=5,
+                        help="generations between the migrations of the best genomes to the next island")
+    parser.add_argument("--migration-size", type=int, default=2, help="number of genomes that migrate")
+    parser.add_argument("--record-replays", nargs="?", const=REPLAY_DIRECTORY, default=None, metavar="DIRECTORY",
+                        help="record a replay of every generation, by default in " + REPLAY_DIRECTORY)
+    args = parser.parse_args()
+    if len(args.maps) > 1 and args.islands <= 1:
+        parser.error("several maps can only be used with --islands, each island trains on one of them")
+    if args.islands > 1 and args.resume is not None:
+        parser.error("--resume can not be used with --islands, the islands do not save snapshots")
+    if args.record_replays is not None and (args.islands > 1 or args.workers > 1):
+        parser.error("--record-replays can only be used training in one process, without --workers or --islands")
+
+    if args.islands > 1:
+        island_model = IslandModel(args.maps, args.islands, migration_interval=args.migration_interval,
+                                   migration_size=args.migration_size, delta_time=args.delta_time, seed=args.seed)
+        try:
+            island_model.run(args.generations)
+            best_island = island_model.get_best_island()
+            print(f"Best genome found in island {best_island} ({island_model.map_names[best_island]}), "
+                  f"top fitness: {island_model.top_fitness[best_island]}")
+        finally:
+            island_model.close()
+        return
+    snapshot = TrainingSnapshot.load(args.resume) if args.resume is not None else None
+
+    if args.workers > 1:
+        evaluator = ParallelEvaluator(args.maps[0], args.workers, delta_time=args.delta_time, seed=args.seed,
+                                      snapshot=snapshot)
+        try:
+            evaluator.run(args.generations)
+        finally:
+            evaluator.close()
+        return
+
+    trainer = HeadlessTrainer(args.maps[0], delta_time=args.delta_time, seed=args.seed, snapshot=snapshot,
+                              replay_directory=args.record_replays)
+    try:
+        trainer.run(args.generations)
+    finally:
+        trainer.get_ai_manager().close()
+
+
+if __name__ == '__main__':
+    main()